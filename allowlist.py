@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Merkle tree builder for the allowlist sale phase.
+
+Reads a CSV of address,quota rows (an optional header is skipped), and writes the
+root to pass to set_allowlist along with the proof each address submits to
+mint_allowlisted:
+
+    python allowlist.py allowlist.csv --output allowlist.json
+
+Leaves are sha256(pack(Pair address quota)) and each pair of nodes is hashed in
+ascending order, as verified by the contract. A node left without a sibling is
+carried up to the next level unchanged.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from hashlib import sha256
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.types import MichelsonType
+
+LEAF_TYPE = MichelsonType.match(michelson_to_micheline('pair address nat'))
+
+def leaf_hash(address, quota):
+    return sha256(LEAF_TYPE.from_python_object((address, quota)).pack()).digest()
+
+def hash_pair(a, b):
+    return sha256(min(a, b) + max(a, b)).digest()
+
+def build_levels(leaves):
+    """All the levels of the tree, from the leaves up to the root"""
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [hash_pair(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+def proof_for(levels, index):
+    """Sibling hashes from the leaf at index up to the root"""
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(level[sibling])
+        index //= 2
+    return proof
+
+def verify(root, address, quota, proof):
+    node = leaf_hash(address, quota)
+    for sibling in proof:
+        node = hash_pair(node, sibling)
+    return node == root
+
+def read_allowlist(path):
+    """[(address, quota)] from a CSV file, an address listed twice is an error"""
+    entries = []
+    seen = set()
+    with open(path, newline='') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip():
+                continue
+            address = row[0].strip()
+            if not address.startswith(('tz', 'KT')):
+                # header
+                continue
+            quota = int(row[1]) if len(row) > 1 and row[1].strip() else 1
+            if address in seen:
+                raise ValueError(f"{address} is listed twice")
+            seen.add(address)
+            entries.append((address, quota))
+    return entries
+
+def build_allowlist(entries):
+    """Root and per-address proofs of an allowlist, ready to be serialized as JSON"""
+    if not entries:
+        raise ValueError("the allowlist is empty")
+    levels = build_levels([leaf_hash(address, quota) for address, quota in entries])
+    root = levels[-1][0]
+    proofs = {}
+    for index, (address, quota) in enumerate(entries):
+        proof = proof_for(levels, index)
+        assert verify(root, address, quota, proof)
+        proofs[address] = {"quota": quota, "proof": [node.hex() for node in proof]}
+    return {"root": root.hex(), "entries": proofs}
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the merkle root and proofs of a mint allowlist')
+    parser.add_argument('csv', help='CSV file of address,quota rows')
+    parser.add_argument(
+        '--output',
+        help='JSON file to write the root and proofs to (default: stdout)'
+    )
+    args = parser.parse_args()
+
+    allowlist = build_allowlist(read_allowlist(args.csv))
+    print(f"{len(allowlist['entries'])} addresses, root {allowlist['root']}", file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(allowlist, f, indent=2)
+    else:
+        json.dump(allowlist, sys.stdout, indent=2)
+
+if __name__ == "__main__":
+    main()
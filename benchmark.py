@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Gas benchmarks for the compiled contracts.
+
+Originates the contracts written by compile.py on a node and simulates entrypoint
+calls with run_operation, reporting consumed gas and paid storage. Only the
+originations and the setup calls they need (adding a bootloader, creating a
+generator, minting the token to regenerate) are injected, so it is cheap to run
+against a sandbox.
+
+    python compile.py
+    python benchmark.py --network localnet --output results.csv
+    python benchmark.py --suite entrypoints --thresholds benchmark_thresholds.json
+
+With --thresholds, the run fails when a case uses more gas or paid storage than
+recorded in the file, beyond --tolerance, or when a case has no recorded value.
+--update-thresholds rewrites the file from the current run instead. The baseline
+is benchmark_thresholds.json; cases with null limits are still to be recorded on
+the reference sandbox.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pytezos import pytezos
+from pytezos.operation.result import OperationResult
+from deploy import get_wallet_from_env, get_wallet_test
+from utils import ContractDeployment, Network, load_lambda_from_name
+from templates import get_fragments_from_template
+
+def simulate(call):
+    """Simulate a contract call and return the run_operation result"""
+    result = call.as_transaction().fill().run_operation()
+    if not OperationResult.is_applied(result):
+        raise RuntimeError(OperationResult.errors(result))
+    return result
+
+def measure(call):
+    """Simulate a contract call and return (consumed gas, paid storage bytes)"""
+    result = simulate(call)
+    return OperationResult.consumed_gas(result), OperationResult.paid_storage_size_diff(result)
+
+def measure_internal(result, entrypoint):
+    """(consumed gas, paid storage bytes) of the internal calls to an entrypoint within a simulated operation"""
+    gas, storage = 0, 0
+    for content in result['contents']:
+        for internal in content['metadata'].get('internal_operation_results', []):
+            if internal.get('parameters', {}).get('entrypoint') != entrypoint:
+                continue
+            gas += int(internal['result'].get('consumed_milligas', 0)) // 1000
+            storage += int(internal['result'].get('paid_storage_size_diff', 0))
+    return gas, storage
+
+def print_results(title, rows):
+    print(f"\n{title}")
+    print(f"{'case':<50}{'gas':>12}{'storage':>10}")
+    for case, gas, storage in rows:
+        print(f"{case:<50}{gas:>12}{storage:>10}")
+    return [{"benchmark": title, "case": case, "gas": gas, "storage": storage} for case, gas, storage in rows]
+
+def bench_bytes_utils(pt):
+    deployer = ContractDeployment.from_name('bytes_utils_benchmark')
+    deployer.set_pytezos_client(pt)
+    contract = pt.contract(deployer.deploy())
+
+    rows = []
+    for n_bytes in [1, 8, 32]:
+        raw = os.urandom(n_bytes)
+        for entrypoint in ['to_nat_legacy', 'to_nat']:
+            gas, storage = measure(getattr(contract, entrypoint)(raw))
+            rows.append((f"{entrypoint} ({n_bytes} bytes)", gas, storage))
+    results = print_results("bytes_utils.to_nat", rows)
+
+    rows = []
+    for n_bytes in [1, 8, 32]:
+        n = int.from_bytes(os.urandom(n_bytes), 'big')
+        for entrypoint in ['from_nat_legacy', 'from_nat']:
+            gas, storage = measure(getattr(contract, entrypoint)(n))
+            rows.append((f"{entrypoint} ({n_bytes} bytes)", gas, storage))
+    return results + print_results("bytes_utils.from_nat", rows)
+
+def bench_lambdas(pt):
+    deployer = ContractDeployment.from_name('lambda_benchmark')
+    deployer.set_pytezos_client(pt)
+    contract = pt.contract(deployer.deploy())
+
+    fragments = [f.encode() for f in get_fragments_from_template('templates/v0.0.1')]
+    rows = []
+    for code_size in [1_000, 10_000, 30_000]:
+        for iteration_number in [1, 1_000, 1_000_000]:
+            params = {
+                "fragments": fragments,
+                "token_id": 1234,
+                "seed": str(int.from_bytes(os.urandom(32), 'big')).encode(),
+                "iteration_number": iteration_number,
+                "generator_name": b"benchmark",
+                "generator_author_bytes": b"tz1burnburnburnburnburnburnburjAYjjX",
+                "generator_version": 3,
+                "generator_code": os.urandom(code_size // 2).hex().encode(),
+                "libraries": [],
+            }
+            for entrypoint in ['render_v0_0_1', 'render_v0_0_2', 'render_v0_0_3']:
+                gas, storage = measure(getattr(contract, entrypoint)(params))
+                rows.append((f"{entrypoint} ({code_size} B code, #{iteration_number})", gas, storage))
+    return print_results("bootloader lambdas", rows)
+
+def bench_render(pt):
+    """Before/after of the bootloader big_map reads: per field, as the render paths used to, or once"""
+    deployer = ContractDeployment.from_name('render_benchmark')
+    deployer.set_pytezos_client(pt)
+    contract = pt.contract(deployer.deploy())
+
+    rows = []
+    for n_fragments in ENTRYPOINT_SWEEP["n_fragments"]:
+        fragments = [f.encode() for f in get_fragments_from_template('templates/v0.0.1')]
+        fragments += [b"<!-- padding -->"] * (n_fragments - len(fragments))
+        contract.set_fragments(bootloader_id=n_fragments, fragments=fragments).send(min_confirmations=1)
+        for code_size in [1_000, 10_000, 30_000]:
+            params = {
+                "bootloader_id": n_fragments,
+                "token_id": 1234,
+                "seed": str(int.from_bytes(os.urandom(32), 'big')).encode(),
+                "iteration_number": 1_000,
+                "generator_name": b"benchmark",
+                "generator_author_bytes": b"tz1burnburnburnburnburnburnburjAYjjX",
+                "generator_version": 3,
+                "generator_code": os.urandom(code_size // 2).hex().encode(),
+                "libraries": [],
+            }
+            for entrypoint in ['render_read_per_field', 'render_read_once']:
+                gas, storage = measure(getattr(contract, entrypoint)(params))
+                rows.append((f"{entrypoint} ({n_fragments} fragments, {code_size} B code)", gas, storage))
+    return print_results("bootloader reads per render", rows)
+
+def originate_bootloader(pt):
+    """Originate a bootloader wired to the randomiser mock, which reveals entropy in the same operation"""
+    rng_deployer = ContractDeployment.from_name('randomiser_mock')
+    rng_deployer.set_pytezos_client(pt)
+    rng_address = rng_deployer.deploy()
+
+    admin = pt.key.public_key_hash()
+    deployer = ContractDeployment.from_name('bootloader')
+    deployer.update_storage({
+        "administrator": admin,
+        "rng_contract": rng_address,
+        "treasury": admin,
+    })
+    deployer.set_pytezos_client(pt)
+    return pt.contract(deployer.deploy())
+
+def add_bootloader(contract, n_fragments=4):
+    """Add the v0.0.2 bootloader with the template fragments, padded to n_fragments, return its id"""
+    fragments = [f.encode() for f in get_fragments_from_template('templates/v0.0.1')]
+    fragments += [b"<!-- padding -->"] * (n_fragments - len(fragments))
+    bootloader_id = contract.storage['next_bootloader_id']()
+    contract.add_bootloader(
+        version='svg-js:0.0.2'.encode(),
+        fragments=fragments,
+        fun=load_lambda_from_name('lambda_0_0_2'),
+        storage_limits={"code": 30000, "desc": 8000, "name": 100, "author": 36},
+    ).send(min_confirmations=1)
+    return bootloader_id
+
+def generator_params(pt, code_size, bootloader_id, reserved_editions):
+    return dict(
+        name=b"benchmark",
+        description=b"benchmark generator",
+        code=os.urandom(code_size // 2).hex().encode(),
+        author_bytes=pt.key.public_key_hash().encode(),
+        reserved_editions=reserved_editions,
+        bootloader_id=bootloader_id,
+    )
+
+def create_generator(pt, contract, code_size, bootloader_id, reserved_editions):
+    """Create a generator with code_size bytes of code and return its id"""
+    generator_id = contract.storage['next_generator_id']()
+    contract.create_generator(**generator_params(pt, code_size, bootloader_id, reserved_editions)).send(min_confirmations=1)
+    return generator_id
+
+def deploy_bootloader(pt, reserved_editions):
+    """Originate a bootloader with one generator, return (contract, generator_id)"""
+    contract = originate_bootloader(pt)
+    bootloader_id = add_bootloader(contract)
+    return contract, create_generator(pt, contract, 5_000, bootloader_id, reserved_editions)
+
+def bench_airdrop(pt):
+    counts = [1, 10, 50]
+    contract, generator_id = deploy_bootloader(pt, reserved_editions=max(counts))
+    recipient = pt.key.public_key_hash()
+
+    rows = []
+    gas, storage = measure(contract.airdrop(generator_id=generator_id, recipient=recipient, entropy=os.urandom(16)))
+    rows.append(("airdrop (1 recipient)", gas, storage))
+    for count in counts:
+        gas, storage = measure(contract.airdrop_batch(
+            generator_id=generator_id,
+            recipients=[recipient] * count,
+            entropy=os.urandom(16),
+        ))
+        rows.append((f"airdrop_batch ({count} recipients)", gas, storage))
+        rows.append((f"airdrop_batch ({count} recipients) per recipient", gas // count, storage // count))
+    return print_results("airdrop vs airdrop_batch", rows)
+
+ENTRYPOINT_SWEEP = {
+    "code_size": [1_000, 5_000, 10_000, 20_000, 30_000],
+    "n_fragments": [4, 8],
+    "entropy_length": [16, 64],
+}
+
+def bench_entrypoints(pt):
+    """Gas and paid storage of the main Bootloader entrypoints over the ENTRYPOINT_SWEEP grid.
+
+    The iteration number only matters inside the lambdas and is swept by bench_lambdas.
+    set_entropy is the callback made by the randomiser mock within mint.
+    """
+    contract = originate_bootloader(pt)
+    admin = pt.key.public_key_hash()
+
+    rows = []
+    for n_fragments in ENTRYPOINT_SWEEP["n_fragments"]:
+        bootloader_id = add_bootloader(contract, n_fragments)
+        for code_size in ENTRYPOINT_SWEEP["code_size"]:
+            combo = f"{code_size} B code, {n_fragments} fragments"
+
+            gas, storage = measure(contract.create_generator(**generator_params(pt, code_size, bootloader_id, 1)))
+            rows.append((f"create_generator ({combo})", gas, storage))
+
+            generator_id = create_generator(pt, contract, code_size, bootloader_id, reserved_editions=1)
+            contract.set_sale(
+                generator_id=generator_id,
+                start_time=None,
+                price=0,
+                paused=False,
+                editions=100,
+                max_per_wallet=None,
+            ).send(min_confirmations=1)
+
+            for entropy_length in ENTRYPOINT_SWEEP["entropy_length"]:
+                result = simulate(contract.mint(generator_id=generator_id, entropy=os.urandom(entropy_length)))
+                gas, storage = OperationResult.consumed_gas(result), OperationResult.paid_storage_size_diff(result)
+                rows.append((f"mint ({combo}, {entropy_length} B entropy)", gas, storage))
+                gas, storage = measure_internal(result, 'set_entropy')
+                rows.append((f"set_entropy ({combo}, {entropy_length} B entropy)", gas, storage))
+
+            gas, storage = measure(contract.airdrop(generator_id=generator_id, recipient=admin, entropy=os.urandom(16)))
+            rows.append((f"airdrop ({combo})", gas, storage))
+
+            # a revealed token and a newer generator version are needed to regenerate
+            token_id = contract.storage['next_token_id']()
+            contract.mint(generator_id=generator_id, entropy=os.urandom(16)).send(min_confirmations=1)
+            update = generator_params(pt, code_size, bootloader_id, 1)
+            del update["bootloader_id"]
+            gas, storage = measure(contract.update_generator(generator_id=generator_id, **update))
+            rows.append((f"update_generator ({combo})", gas, storage))
+            contract.update_generator(generator_id=generator_id, **update).send(min_confirmations=1)
+
+            gas, storage = measure(contract.regenerate_token(token_id))
+            rows.append((f"regenerate_token ({combo})", gas, storage))
+    return print_results("bootloader entrypoints", rows)
+
+def write_results(results, path):
+    if path.endswith('.json'):
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=["benchmark", "case", "gas", "storage"])
+            writer.writeheader()
+            writer.writerows(results)
+    print(f"\nresults written to {path}")
+
+def check_thresholds(results, path, tolerance):
+    """Return the cases using more gas or storage than recorded in the thresholds file, beyond the tolerance.
+
+    Cases without a recorded threshold, and recorded cases of a benchmark that ran but
+    were not measured, are reported as well.
+    """
+    with open(path) as f:
+        thresholds = json.load(f)
+    regressions = []
+    keys = set()
+    for row in results:
+        key = f"{row['benchmark']}/{row['case']}"
+        keys.add(key)
+        for metric in ['gas', 'storage']:
+            limit = thresholds.get(key, {}).get(metric)
+            if limit is None:
+                # a new or renamed case must be recorded, not silently skipped
+                regressions.append(f"{key}: no {metric} threshold recorded")
+            elif row[metric] > limit * (1 + tolerance):
+                regressions.append(f"{key}: {metric} {row[metric]} > {limit} (+{tolerance:.0%})")
+    # recorded cases of the benchmarks that ran must still be measured
+    benchmarks = {row['benchmark'] for row in results}
+    for key in sorted(thresholds):
+        if key.split('/', 1)[0] in benchmarks and key not in keys:
+            regressions.append(f"{key}: recorded but not measured")
+    return regressions
+
+def update_thresholds(results, path):
+    thresholds = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            thresholds = json.load(f)
+    keys = [f"{row['benchmark']}/{row['case']}" for row in results]
+    duplicates = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicates:
+        raise ValueError(f"benchmark cases must be unique: {', '.join(duplicates)}")
+    for key, row in zip(keys, results):
+        thresholds[key] = {"gas": row['gas'], "storage": row['storage']}
+    with open(path, 'w') as f:
+        json.dump(thresholds, f, indent=2, sort_keys=True)
+    print(f"thresholds written to {path}")
+
+SUITES = {
+    "bytes_utils": bench_bytes_utils,
+    "lambdas": bench_lambdas,
+    "render": bench_render,
+    "airdrop": bench_airdrop,
+    "entrypoints": bench_entrypoints,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark contract gas usage')
+    parser.add_argument(
+        '--network',
+        choices=['localnet', 'ghostnet'],
+        default='localnet',
+        help='Network to simulate on (localnet or ghostnet)'
+    )
+    parser.add_argument(
+        '--test-wallet',
+        action='store_true',
+        help='Use test wallet instead of environment key (development only)'
+    )
+
+    parser.add_argument(
+        '--suite',
+        choices=list(SUITES),
+        action='append',
+        help='Benchmark suite to run, can be repeated (default: all)'
+    )
+    parser.add_argument(
+        '--output',
+        help='Write the results to this file, as JSON if it ends in .json, CSV otherwise'
+    )
+    parser.add_argument(
+        '--thresholds',
+        help='JSON file of per-case gas and storage limits to check the results against'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.05,
+        help='Allowed relative increase over the thresholds (default: 0.05)'
+    )
+    parser.add_argument(
+        '--update-thresholds',
+        action='store_true',
+        help='Record the results in the thresholds file instead of checking them'
+    )
+
+    args = parser.parse_args()
+    network = Network[args.network]
+    wallet = get_wallet_test("bootloader_test") if args.test_wallet else get_wallet_from_env()
+    pt = pytezos.using(key=wallet.secret_key(), shell=network)
+
+    results = []
+    for suite in args.suite or list(SUITES):
+        results += SUITES[suite](pt)
+
+    if args.output:
+        write_results(results, args.output)
+
+    if args.thresholds:
+        if args.update_thresholds:
+            update_thresholds(results, args.thresholds)
+        else:
+            regressions = check_thresholds(results, args.thresholds, args.tolerance)
+            if regressions:
+                print("\nregressions:")
+                for regression in regressions:
+                    print(f"\t{regression}")
+                sys.exit(1)
+            print("\nno regressions")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+import json
+import os
 import smartpy as sp
 
 from contracts.bootloader import bootloader
 from contracts.randomiser import randomiser
+from contracts.benchmarks import benchmarks
 
 @sp.add_test()
 def test():
@@ -12,6 +15,11 @@ def test():
     )
     scenario += contract
 
+    # TZIP-16 off-chain views (token_metadata for lazy bootloaders), picked up by deploy.py
+    os.makedirs("bootloader", exist_ok=True)
+    with open("bootloader/offchain_views.json", "w") as f:
+        json.dump(contract.get_offchain_views().content, f, indent=2)
+
 @sp.add_test()
 def test():
     scenario = sp.test_scenario("lambda_0_0_1")
@@ -24,8 +32,48 @@ def test():
 
 
 
+@sp.add_test()
+def test():
+    scenario = sp.test_scenario("lambda_0_0_2")
+    scenario += bootloader.LambdaHelper(bootloader.v0_0_2)
+
+@sp.add_test()
+def test():
+    scenario = sp.test_scenario("lambda_0_0_2_ghostnet")
+    scenario += bootloader.LambdaHelper(bootloader.v0_0_2_ghostnet)
+
+@sp.add_test()
+def test():
+    scenario = sp.test_scenario("lambda_0_0_3")
+    scenario += bootloader.LambdaHelper(bootloader.v0_0_3)
+
+@sp.add_test()
+def test():
+    scenario = sp.test_scenario("lambda_0_0_3_ghostnet")
+    scenario += bootloader.LambdaHelper(bootloader.v0_0_3_ghostnet)
+
 @sp.add_test()
 def test_randomiser():
     # Test scenario
     scenario = sp.test_scenario("randomiser", randomiser)
-    scenario += randomiser.CentralisedRandomiser()
\ No newline at end of file
+    scenario += randomiser.CentralisedRandomiser()
+
+@sp.add_test()
+def test_bytes_utils_benchmark():
+    scenario = sp.test_scenario("bytes_utils_benchmark")
+    scenario += benchmarks.BytesUtilsBenchmark()
+
+@sp.add_test()
+def test_lambda_benchmark():
+    scenario = sp.test_scenario("lambda_benchmark")
+    scenario += benchmarks.LambdaBenchmark()
+
+@sp.add_test()
+def test_randomiser_mock():
+    scenario = sp.test_scenario("randomiser_mock", randomiser)
+    scenario += randomiser.RandomiserMock()
+
+@sp.add_test()
+def test_render_benchmark():
+    scenario = sp.test_scenario("render_benchmark")
+    scenario += benchmarks.RenderBenchmark()
@@ -0,0 +1,166 @@
+import smartpy as sp
+from contracts.utils import bytes_utils
+from contracts.bootloader import bootloader
+
+@sp.module
+def legacy_bytes_utils():
+    # Reference implementations replaced in contracts/utils.py, kept to benchmark against.
+
+    def _digit_to_byte(d):
+        table = {
+            0: sp.bytes("0x30"),
+            1: sp.bytes("0x31"),
+            2: sp.bytes("0x32"),
+            3: sp.bytes("0x33"),
+            4: sp.bytes("0x34"),
+            5: sp.bytes("0x35"),
+            6: sp.bytes("0x36"),
+            7: sp.bytes("0x37"),
+            8: sp.bytes("0x38"),
+            9: sp.bytes("0x39"),
+        }
+        sp.cast(d, sp.int)
+        assert d >= 0 and d < 10
+        return table[d]
+
+    def from_nat(n):
+        sp.cast(n, sp.nat)
+        out = sp.bytes("0x")
+        v=n
+
+        # Special-case zero
+        if v == 0:
+            out = sp.bytes("0x30")
+        else:
+            pieces = []
+            # Collect digits least-significant to most-significant
+            while v > 0:
+                (q, r) = sp.ediv(v, 10).unwrap_some()  # q, r are nat
+                pieces.push(_digit_to_byte(sp.to_int(r)))
+                v = q
+            # Concatenate in correct order thanks to push semantics
+            out = sp.concat(pieces)
+        return out
+
+    def to_nat(b: sp.bytes) -> sp.nat:
+        n_bytes = sp.len(b)
+        bit_masks = [
+            sp.bytes("0x01"),
+            sp.bytes("0x02"),
+            sp.bytes("0x04"),
+            sp.bytes("0x08"),
+            sp.bytes("0x10"),
+            sp.bytes("0x20"),
+            sp.bytes("0x40"),
+            sp.bytes("0x80"),
+        ]
+        res = 0
+        for i in range(n_bytes):
+            byte = sp.slice(i, 1, b).unwrap_some()
+            for bit_mask in bit_masks:
+                if sp.and_bytes(byte, bit_mask) == bit_mask:
+                    res = (res << 1) + 1
+                else:
+                    res = res << 1
+        return res
+
+@sp.module
+def benchmarks():
+    import bytes_utils
+    import legacy_bytes_utils
+    import bootloader
+
+    class BytesUtilsBenchmark(sp.Contract):
+        """Runs the old and new bytes_utils conversions so their gas can be compared on a node."""
+        def __init__(self):
+            self.data.nat_out = sp.nat(0)
+            self.data.bytes_out = sp.bytes("0x")
+
+        @sp.entrypoint
+        def to_nat_legacy(self, b: sp.bytes):
+            self.data.nat_out = legacy_bytes_utils.to_nat(b)
+
+        @sp.entrypoint
+        def to_nat(self, b: sp.bytes):
+            self.data.nat_out = bytes_utils.to_nat(b)
+
+        @sp.entrypoint
+        def from_nat_legacy(self, n: sp.nat):
+            self.data.bytes_out = legacy_bytes_utils.from_nat(n)
+
+        @sp.entrypoint
+        def from_nat(self, n: sp.nat):
+            self.data.bytes_out = bytes_utils.from_nat(n)
+
+    class LambdaBenchmark(sp.Contract):
+        """Runs each bootloader lambda on the same parameters so their gas can be compared on a node."""
+        def __init__(self):
+            self.data.token_info = sp.cast({}, sp.map[sp.string, sp.bytes])
+
+        @sp.entrypoint
+        def render_v0_0_1(self, params: bootloader.t_lambda_params):
+            self.data.token_info = bootloader.v0_0_1(params)
+
+        @sp.entrypoint
+        def render_v0_0_2(self, params: bootloader.t_lambda_params):
+            self.data.token_info = bootloader.v0_0_2(params)
+
+        @sp.entrypoint
+        def render_v0_0_3(self, params: bootloader.t_lambda_params):
+            self.data.token_info = bootloader.v0_0_3(params)
+
+    t_render_params: type = sp.record(
+        bootloader_id=sp.nat,
+        token_id=sp.nat,
+        seed=sp.bytes,
+        iteration_number=sp.nat,
+        generator_name=sp.bytes,
+        generator_author_bytes=sp.bytes,
+        generator_version=sp.nat,
+        generator_code=sp.bytes,
+        libraries=sp.list[sp.bytes],
+    )
+
+    class RenderBenchmark(sp.Contract):
+        """Renders from a stored bootloader, reading its big_map entry once per field or once in total,
+        so the gas of the two access patterns can be compared on a node."""
+        def __init__(self):
+            self.data.bootloaders = sp.cast(sp.big_map({}), sp.big_map[sp.nat, bootloader.t_bootloader])
+            self.data.token_info = sp.cast({}, sp.map[sp.string, sp.bytes])
+
+        @sp.entrypoint
+        def set_fragments(self, bootloader_id: sp.nat, fragments: sp.list[sp.bytes]):
+            self.data.bootloaders[bootloader_id] = sp.record(
+                version=sp.bytes("0x302e302e32"),
+                fragments=fragments,
+                fun=bootloader.v0_0_2,
+            )
+
+        @sp.entrypoint
+        def render_read_per_field(self, params: t_render_params):
+            self.data.token_info = self.data.bootloaders[params.bootloader_id].fun(sp.record(
+                fragments=self.data.bootloaders[params.bootloader_id].fragments,
+                token_id=params.token_id,
+                seed=params.seed,
+                iteration_number=params.iteration_number,
+                generator_name=params.generator_name,
+                generator_author_bytes=params.generator_author_bytes,
+                generator_version=params.generator_version,
+                generator_code=params.generator_code,
+                libraries=params.libraries
+            ))
+
+        @sp.entrypoint
+        def render_read_once(self, params: t_render_params):
+            loader = self.data.bootloaders[params.bootloader_id]
+            self.data.token_info = loader.fun(sp.record(
+                fragments=loader.fragments,
+                token_id=params.token_id,
+                seed=params.seed,
+                iteration_number=params.iteration_number,
+                generator_name=params.generator_name,
+                generator_author_bytes=params.generator_author_bytes,
+                generator_version=params.generator_version,
+                generator_code=params.generator_code,
+                libraries=params.libraries
+            ))
@@ -18,10 +18,73 @@ def bootloader():
         generator_name=sp.bytes,
         generator_author_bytes=sp.bytes,
         generator_version=sp.nat,
-        generator_code=sp.bytes
+        generator_code=sp.bytes,
+        libraries=sp.list[sp.bytes],
     )
     t_lambda: type = sp.lambda_(t_lambda_params, sp.map[sp.string, sp.bytes])
 
+    t_bootloader: type = sp.record(
+        version=sp.bytes,
+        fragments=sp.list[sp.bytes],
+        fun=t_lambda,
+    )
+
+    t_sale: type = sp.record(
+        paused=sp.bool,
+        start_time=sp.option[sp.timestamp],
+        price=sp.mutez,
+        editions=sp.nat,
+        max_per_wallet=sp.option[sp.nat],
+    )
+
+    t_generator: type = sp.record(
+        name=sp.bytes,
+        created=sp.timestamp,
+        last_update=sp.timestamp,
+        description=sp.bytes,
+        author=sp.address,
+        author_bytes=sp.bytes,
+        code=sp.bytes,
+        version=sp.nat,
+        type_id=sp.nat,
+    )
+
+    t_generator_state: type = sp.record(
+        n_tokens=sp.nat,
+        reserved_editions=sp.nat,
+        flag=sp.nat,
+        sale=sp.option[t_sale],
+    )
+
+    def render(params):
+        # callers read the bootloader record from its big_map once and pass it in, so that
+        # the lambda and the fragments are deserialized a single time per render
+        loader = sp.cast(params.loader, t_bootloader)
+        generator = sp.cast(params.generator, t_generator)
+        return loader.fun(sp.record(
+            fragments=loader.fragments,
+            token_id=params.token_id,
+            seed=params.seed,
+            iteration_number=params.iteration_number,
+            generator_name=generator.name,
+            generator_author_bytes=generator.author_bytes,
+            generator_version=generator.version,
+            generator_code=generator.code,
+            libraries=params.libraries
+        ))
+
+    def spliced_libraries(params):
+        # code of the given libraries, in the order they are spliced
+        # push prepends, so the list is built reversed and then flipped back
+        libraries = sp.cast(params.libraries, sp.big_map[sp.bytes, sp.bytes])
+        reversed_libraries = []
+        for library_hash in params.hashes:
+            reversed_libraries.push(libraries[library_hash])
+        ordered = []
+        for library in reversed_libraries:
+            ordered.push(library)
+        return ordered
+
     # Order of inheritance: [Admin], [<policy>], <base class>, [<other mixins>].
     class Bootloader(
         main.Admin,
@@ -43,19 +106,20 @@ def bootloader():
                 generator_id=sp.nat, 
                 generator_version=sp.nat,
                 seed=sp.option[sp.bytes],
+                # ASCII decimal form of the seed as passed to the lambdas, cached on first use
+                decimal_seed=sp.option[sp.bytes],
                 iteration_number=sp.nat,
             )])
             self.data.treasury = admin_address
             self.data.platform_fee_bps = 2000
+            # when set, mint proceeds accrue in balances and are paid out by withdraw/withdraw_many
+            self.data.accrue_payments = False
+            self.data.balances = sp.cast(sp.big_map({}), sp.big_map[sp.address, sp.mutez])
             self.data.rng_contract = rng_contract
             self.data.next_bootloader_id = 0
             self.data.moderators = sp.cast(sp.big_map({}), sp.big_map[sp.address, sp.unit])
             self.data.generator_mints = sp.cast(sp.big_map({}), sp.big_map[sp.pair[sp.nat, sp.address], sp.nat])
-            self.data.bootloaders = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.record(
-                version=sp.bytes,
-                fragments=sp.list[sp.bytes],
-                fun=t_lambda,
-            )])
+            self.data.bootloaders = sp.cast(sp.big_map({}), sp.big_map[sp.nat, t_bootloader])
             self.data.bootloader_storage_limits = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.record(
                     code=sp.nat,
                     name=sp.nat,
@@ -63,27 +127,40 @@ def bootloader():
                     author=sp.nat
                 )
             ])
-            self.data.generators = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.record(
-                name=sp.bytes,
-                created=sp.timestamp,
-                last_update=sp.timestamp,
-                description=sp.bytes,
-                author=sp.address, 
-                author_bytes=sp.bytes,
+            # 0 (default) = eager: placeholder artifact at mint, re-rendered when the seed arrives
+            # 1 = deferred: artifact is rendered once, when the seed arrives
+            # 2 = lazy: nothing is rendered on-chain, the token_metadata off-chain view computes it
+            #    from the current generator, so its code and libraries are frozen once it has minted
+            self.data.bootloader_render_modes = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.nat])
+            # bootloaders with at least one generator, whose render mode can no longer change
+            self.data.bootloaders_in_use = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.unit])
+            # bootloaders whose lambda splices params.libraries (v0_0_3 and later)
+            self.data.bootloader_library_support = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.unit])
+            self.data.generators = sp.cast(sp.big_map({}), sp.big_map[sp.nat, t_generator])
+            # mutable counters and sale config live apart from the (large) generator record
+            # so that mints only rewrite a few hundred bytes instead of the whole code blob
+            self.data.generator_state = sp.cast(sp.big_map({}), sp.big_map[sp.nat, t_generator_state])
+            # immutable code shared between generators, keyed by sha256 of the code
+            self.data.libraries = sp.cast(sp.big_map({}), sp.big_map[sp.bytes, sp.bytes])
+            self.data.library_size_limit = 30000
+            # generator id -> hashes of the libraries spliced before its code, in order
+            self.data.generator_libraries = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.list[sp.bytes]])
+            # generator code staged over several operations, see begin_upload
+            self.data.next_upload_id = 0
+            self.data.uploads = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.record(
+                uploader=sp.address,
+                bootloader_id=sp.nat,
                 code=sp.bytes,
-                n_tokens=sp.nat,
-                reserved_editions=sp.nat,
-                flag=sp.nat,
-                version=sp.nat,
-                type_id=sp.nat,
-                sale=sp.option[sp.record(
-                    paused=sp.bool,
-                    start_time=sp.option[sp.timestamp],
-                    price=sp.mutez,
-                    editions=sp.nat,
-                    max_per_wallet=sp.option[sp.nat],
-                )]
             )])
+            # first token id of a batch -> number of tokens sharing its entropy request
+            self.data.entropy_batches = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.nat])
+            # cap on mint_batch/airdrop_batch counts, set when the randomiser reveals asynchronously
+            # so that a single batch fits in a set_entropy_batch callback; the randomiser budgets
+            # the tokens revealed per callback, reading batch sizes from get_entropy_batch_size
+            self.data.max_batch_count = sp.cast(None, sp.option[sp.nat])
+            # generator id -> merkle root of the (address, quota) pairs allowed to mint_allowlisted
+            self.data.allowlists = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.bytes])
+            self.data.allowlist_mints = sp.cast(sp.big_map({}), sp.big_map[sp.pair[sp.nat, sp.address], sp.nat])
             # 0x30 = "0".encode().hex()
             self.private.EMPTY_SEED = sp.bytes('0x30')
         
@@ -103,33 +180,75 @@ def bootloader():
             self.data.bootloaders[self.data.next_bootloader_id] = sp.record(version=version, fragments=fragments, fun=fun)
             self.data.bootloader_storage_limits[self.data.next_bootloader_id] = storage_limits
             self.data.next_bootloader_id += 1
-        
+
         @sp.entrypoint
-        def create_generator(self, name: sp.bytes, description: sp.bytes, code: sp.bytes, author_bytes: sp.bytes, reserved_editions: sp.nat, bootloader_id: sp.nat):
+        def set_bootloader_render_mode(self, bootloader_id: sp.nat, render_mode: sp.nat):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
             assert self.data.bootloaders.contains(bootloader_id), "UNKNOWN_BOOTLOADER"
-            storage_limits = self.data.bootloader_storage_limits[bootloader_id]
-            assert sp.len(name) <= storage_limits.name, "NAME_TOO_LONG"
-            assert sp.len(description) <= storage_limits.desc, "DESC_TOO_LONG"
-            assert sp.len(code) <= storage_limits.code, "CODE_TOO_LONG"
-            assert sp.len(author_bytes) <= storage_limits.author, "AUTHOR_TOO_LONG"
+            assert render_mode <= 2, "INVALID_RENDER_MODE"
+            # the mode decides how tokens are rendered and revealed, switching it under minted
+            # tokens would leave them without metadata or with stale metadata
+            assert not self.data.bootloaders_in_use.contains(bootloader_id), "BOOTLOADER_IN_USE"
+            self.data.bootloader_render_modes[bootloader_id] = render_mode
 
-            self.data.generators[self.data.next_generator_id] = sp.record(
+        @sp.entrypoint
+        def set_bootloader_library_support(self, bootloader_id: sp.nat, supported: sp.bool):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            assert self.data.bootloaders.contains(bootloader_id), "UNKNOWN_BOOTLOADER"
+            if supported:
+                self.data.bootloader_library_support[bootloader_id] = ()
+            else:
+                del self.data.bootloader_library_support[bootloader_id]
+        
+        @sp.entrypoint
+        def create_generator(self, name: sp.bytes, description: sp.bytes, code: sp.bytes, author_bytes: sp.bytes, reserved_editions: sp.nat, bootloader_id: sp.nat):
+            self._create_generator(sp.record(
                 name=name,
-                created = sp.now,
-                last_update= sp.now,
                 description=description,
-                author=sp.sender,
-                author_bytes=author_bytes,
                 code=code,
-                n_tokens=0,
+                author_bytes=author_bytes,
                 reserved_editions=reserved_editions,
-                flag=0,
-                version=1,
-                type_id=bootloader_id,
-                sale=None,
+                bootloader_id=bootloader_id,
+            ))
+
+        @sp.entrypoint
+        def begin_upload(self, bootloader_id: sp.nat):
+            # stages code that does not fit in a single operation, the upload id is next_upload_id
+            assert self.data.bootloaders.contains(bootloader_id), "UNKNOWN_BOOTLOADER"
+            self.data.uploads[self.data.next_upload_id] = sp.record(
+                uploader=sp.sender,
+                bootloader_id=bootloader_id,
+                code=sp.bytes("0x"),
             )
+            self.data.next_upload_id += 1
 
-            self.data.next_generator_id += 1
+        @sp.entrypoint
+        def append_chunk(self, upload_id: sp.nat, chunk: sp.bytes):
+            upload = self.data.uploads.get_opt(upload_id).unwrap_some(error="UNKNOWN_UPLOAD")
+            assert sp.sender == upload.uploader, "ONLY_UPLOADER"
+            code = upload.code + chunk
+            assert sp.len(code) <= self.data.bootloader_storage_limits[upload.bootloader_id].code, "CODE_TOO_LONG"
+            self.data.uploads[upload_id].code = code
+
+        @sp.entrypoint
+        def cancel_upload(self, upload_id: sp.nat):
+            upload = self.data.uploads.get_opt(upload_id).unwrap_some(error="UNKNOWN_UPLOAD")
+            assert sp.sender == upload.uploader, "ONLY_UPLOADER"
+            del self.data.uploads[upload_id]
+
+        @sp.entrypoint
+        def finalize_generator(self, upload_id: sp.nat, name: sp.bytes, description: sp.bytes, author_bytes: sp.bytes, reserved_editions: sp.nat):
+            upload = self.data.uploads.get_opt(upload_id).unwrap_some(error="UNKNOWN_UPLOAD")
+            assert sp.sender == upload.uploader, "ONLY_UPLOADER"
+            del self.data.uploads[upload_id]
+            self._create_generator(sp.record(
+                name=name,
+                description=description,
+                code=upload.code,
+                author_bytes=author_bytes,
+                reserved_editions=reserved_editions,
+                bootloader_id=upload.bootloader_id,
+            ))
 
         @sp.entrypoint
         def update_generator(self, generator_id: sp.nat, name: sp.bytes, description: sp.bytes, code: sp.bytes, author_bytes: sp.bytes, reserved_editions: sp.nat):
@@ -139,13 +258,17 @@ def bootloader():
             storage_limits = self.data.bootloader_storage_limits[generator.type_id]
             assert sp.len(name) <= storage_limits.name, "NAME_TOO_LONG"
             assert sp.len(description) <= storage_limits.desc, "DESC_TOO_LONG"
-            assert sp.len(code) <= storage_limits.code, "CODE_TOO_LONG"
+            # the libraries are spliced into every artifact, they count against the code limit
+            assert sp.len(code) + self._libraries_size(generator_id) <= storage_limits.code, "CODE_TOO_LONG"
             assert sp.len(author_bytes) <= storage_limits.author, "AUTHOR_TOO_LONG"
+            if code != generator.code:
+                assert not self._lazy_tokens_minted(generator_id), "LAZY_TOKENS_MINTED"
 
             # if geneartor has sale configured. Ensure reserved_editions are not more than remaining capacity
-            match generator.sale:
+            state = self.data.generator_state[generator_id]
+            match state.sale:
                 case Some(sale):
-                    assert generator.n_tokens + reserved_editions <= sale.editions, "RESERVE_EXCEEDS_CAPACITY"
+                    assert state.n_tokens + reserved_editions <= sale.editions, "RESERVE_EXCEEDS_CAPACITY"
 
             self.data.generators[generator_id] = sp.record(
                 name=name,
@@ -155,20 +278,121 @@ def bootloader():
                 author=sp.sender,
                 author_bytes=author_bytes,
                 code=code,
-                n_tokens=generator.n_tokens,
-                reserved_editions=reserved_editions,
-                flag=generator.flag,
-                sale=generator.sale,
                 type_id=generator.type_id,
                 version=generator.version +1,
             )
-        
+            self.data.generator_state[generator_id].reserved_editions = reserved_editions
+            sp.emit(sp.record(generator_id=generator_id, version=generator.version + 1), tag="update_generator")
+
+        @sp.entrypoint
+        def update_generator_fields(self, generator_id: sp.nat, name: sp.option[sp.bytes], description: sp.option[sp.bytes], code: sp.option[sp.bytes], author_bytes: sp.option[sp.bytes], reserved_editions: sp.option[sp.nat]):
+            # partial update: only the fields that are set are checked and written,
+            # and the version only changes with the code
+            generator = self.data.generators[generator_id]
+            assert sp.sender == generator.author, "ONLY_AUTHOR"
+            storage_limits = self.data.bootloader_storage_limits[generator.type_id]
+
+            match name:
+                case Some(new_name):
+                    assert sp.len(new_name) <= storage_limits.name, "NAME_TOO_LONG"
+                    generator.name = new_name
+            match description:
+                case Some(new_description):
+                    assert sp.len(new_description) <= storage_limits.desc, "DESC_TOO_LONG"
+                    generator.description = new_description
+            match code:
+                case Some(new_code):
+                    assert not self._lazy_tokens_minted(generator_id), "LAZY_TOKENS_MINTED"
+                    assert sp.len(new_code) + self._libraries_size(generator_id) <= storage_limits.code, "CODE_TOO_LONG"
+                    generator.code = new_code
+                    generator.version += 1
+            match author_bytes:
+                case Some(new_author_bytes):
+                    assert sp.len(new_author_bytes) <= storage_limits.author, "AUTHOR_TOO_LONG"
+                    generator.author_bytes = new_author_bytes
+            generator.last_update = sp.now
+            self.data.generators[generator_id] = generator
+            sp.emit(sp.record(generator_id=generator_id, version=generator.version), tag="update_generator")
+
+            match reserved_editions:
+                case Some(new_reserved_editions):
+                    state = self.data.generator_state[generator_id]
+                    match state.sale:
+                        case Some(sale):
+                            assert state.n_tokens + new_reserved_editions <= sale.editions, "RESERVE_EXCEEDS_CAPACITY"
+                    self.data.generator_state[generator_id].reserved_editions = new_reserved_editions
+
+        @sp.entrypoint
+        def patch_generator_code(self, generator_id: sp.nat, patches: sp.list[sp.record(offset=sp.nat, delete_len=sp.nat, insert=sp.bytes)]):
+            # splices are applied in order, each offset refers to the code as left by the previous splice
+            generator = self.data.generators[generator_id]
+            assert sp.sender == generator.author, "ONLY_AUTHOR"
+            assert not self._lazy_tokens_minted(generator_id), "LAZY_TOKENS_MINTED"
+
+            code = generator.code
+            for patch in patches:
+                end = patch.offset + patch.delete_len
+                assert end <= sp.len(code), "INVALID_PATCH"
+                # SLICE returns None for an empty range at the end of the bytes, so empty
+                # heads and tails (prepends, appends, edits of empty code) are not sliced
+                head = sp.bytes("0x")
+                if patch.offset > 0:
+                    head = sp.slice(0, patch.offset, code).unwrap_some()
+                tail = sp.bytes("0x")
+                if end < sp.len(code):
+                    tail = sp.slice(end, sp.as_nat(sp.len(code) - end), code).unwrap_some()
+                code = sp.concat([head, patch.insert, tail])
+            assert sp.len(code) + self._libraries_size(generator_id) <= self.data.bootloader_storage_limits[generator.type_id].code, "CODE_TOO_LONG"
+
+            generator.code = code
+            generator.version += 1
+            generator.last_update = sp.now
+            self.data.generators[generator_id] = generator
+            sp.emit(sp.record(generator_id=generator_id, version=generator.version), tag="update_generator")
+
+        @sp.entrypoint
+        def set_library_size_limit(self, library_size_limit: sp.nat):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            self.data.library_size_limit = library_size_limit
+
+        @sp.entrypoint
+        def add_library(self, code: sp.bytes):
+            # libraries are immutable and addressed by their hash, adding known code is a no-op
+            assert sp.len(code) <= self.data.library_size_limit, "LIBRARY_TOO_LONG"
+            library_hash = sp.sha256(code)
+            if not self.data.libraries.contains(library_hash):
+                self.data.libraries[library_hash] = code
+
+        @sp.entrypoint
+        def set_generator_libraries(self, generator_id: sp.nat, library_hashes: sp.list[sp.bytes]):
+            generator = self.data.generators[generator_id]
+            assert sp.sender == generator.author, "ONLY_AUTHOR"
+            assert not self._lazy_tokens_minted(generator_id), "LAZY_TOKENS_MINTED"
+            if sp.len(library_hashes) > 0:
+                # older lambdas ignore params.libraries, linking them would only bump the version
+                assert self.data.bootloader_library_support.contains(generator.type_id), "LIBRARIES_NOT_SUPPORTED"
+            # the libraries are spliced into every artifact, they count against the code limit
+            size = sp.len(generator.code)
+            for library_hash in library_hashes:
+                size += sp.len(self.data.libraries.get_opt(library_hash).unwrap_some(error="UNKNOWN_LIBRARY"))
+            assert size <= self.data.bootloader_storage_limits[generator.type_id].code, "CODE_TOO_LONG"
+            if sp.len(library_hashes) == 0:
+                del self.data.generator_libraries[generator_id]
+            else:
+                self.data.generator_libraries[generator_id] = library_hashes
+            # the artifact changes with its libraries, so tokens can be regenerated
+            self.data.generators[generator_id].version = generator.version + 1
+            self.data.generators[generator_id].last_update = sp.now
+            sp.emit(sp.record(generator_id=generator_id, version=generator.version + 1), tag="update_generator")
+
         @sp.entrypoint
         def delete_generator(self, generator_id: sp.nat):
             generator = self.data.generators[generator_id]
             assert sp.sender == generator.author, "ONLY_AUTHOR"
-            assert generator.n_tokens == 0, "TOKENS_MINTED"
+            assert self.data.generator_state[generator_id].n_tokens == 0, "TOKENS_MINTED"
             del self.data.generators[generator_id]
+            del self.data.generator_state[generator_id]
+            del self.data.generator_libraries[generator_id]
 
         @sp.entrypoint
         def set_metadata(self, updates: sp.map[sp.string, sp.bytes]):
@@ -185,7 +409,8 @@ def bootloader():
         def flag_generator(self, generator_id: sp.nat, flag: sp.nat):
             # used for UI moderation
             assert self.data.moderators.contains(sp.sender) or sp.sender == self.data.administrator, "ONLY_MODS"
-            self.data.generators[generator_id].flag = flag
+            self.data.generator_state[generator_id].flag = flag
+            sp.emit(sp.record(generator_id=generator_id, flag=flag), tag="flag_generator")
 
         @sp.entrypoint
         def update_thumbnail(self, token_id: sp.nat, thumbnailUri: sp.bytes):
@@ -200,21 +425,42 @@ def bootloader():
         def set_sale(self, generator_id: sp.nat, start_time: sp.option[sp.timestamp], price: sp.mutez, paused: sp.bool, editions: sp.nat, max_per_wallet: sp.option[sp.nat]):
             generator = self.data.generators[generator_id]
             assert sp.sender == generator.author, "ONLY_AUTHOR"
+            state = self.data.generator_state[generator_id]
             # only allow reducing edition size
-            match generator.sale:
+            match state.sale:
                 case Some(sale):
                     # but only if no tokens were minted yet
-                    if generator.n_tokens > 0:
+                    if state.n_tokens > 0:
                         assert editions <= sale.editions, "NO_ED_INCREMENT"
-            assert editions >= generator.n_tokens + generator.reserved_editions, "ED_LT_MINTED"
-            self.data.generators[generator_id].sale = sp.Some(sp.record(
+            assert editions >= state.n_tokens + state.reserved_editions, "ED_LT_MINTED"
+            sale = sp.record(
                 start_time=start_time,
                 price=price,
                 paused=paused,
                 editions=editions,
                 max_per_wallet=max_per_wallet,
-            ))
+            )
+            self.data.generator_state[generator_id].sale = sp.Some(sale)
+            sp.emit(sp.record(generator_id=generator_id, sale=sale), tag="set_sale")
         
+        @sp.entrypoint
+        def set_allowlist(self, generator_id: sp.nat, root: sp.option[sp.bytes]):
+            # None closes the allowlist phase
+            generator = self.data.generators[generator_id]
+            assert sp.sender == generator.author, "ONLY_AUTHOR"
+            match root:
+                case Some(merkle_root):
+                    assert sp.len(merkle_root) == 32, "INVALID_ROOT"
+                    self.data.allowlists[generator_id] = merkle_root
+                case None:
+                    del self.data.allowlists[generator_id]
+            sp.emit(sp.record(generator_id=generator_id, root=root), tag="set_allowlist")
+
+        @sp.entrypoint
+        def set_max_batch_count(self, max_batch_count: sp.option[sp.nat]):
+            assert self.data.moderators.contains(sp.sender) or sp.sender == self.data.administrator, "ONLY_MODS"
+            self.data.max_batch_count = max_batch_count
+
         @sp.entrypoint
         def set_treasury(self, address: sp.address):
             assert self.data.moderators.contains(sp.sender) or sp.sender == self.data.administrator, "ONLY_MODS"
@@ -227,6 +473,44 @@ def bootloader():
             assert platform_fee_bps <= 10_000, "BPS_TOO_HIGH"
             self.data.platform_fee_bps = platform_fee_bps
         
+        @sp.entrypoint
+        def set_accrue_payments(self, accrue_payments: sp.bool):
+            assert self.data.moderators.contains(sp.sender) or sp.sender == self.data.administrator, "ONLY_MODS"
+            self.data.accrue_payments = accrue_payments
+
+        @sp.entrypoint
+        def withdraw(self):
+            amount = self.data.balances.get(sp.sender, default=sp.mutez(0))
+            assert amount > sp.mutez(0), "NO_BALANCE"
+            del self.data.balances[sp.sender]
+            sp.send(sp.sender, amount)
+
+        @sp.entrypoint
+        def withdraw_many(self, addresses: sp.list[sp.address]):
+            assert self.data.moderators.contains(sp.sender) or sp.sender == self.data.administrator, "ONLY_MODS"
+            for address in addresses:
+                match self.data.balances.get_opt(address):
+                    case Some(amount):
+                        del self.data.balances[address]
+                        sp.send(address, amount)
+
+        @sp.entrypoint
+        def burn(self, batch):
+            # main.BurnNft, also dropping the bootloader's own entries so that burnt tokens stop
+            # paying for storage; permissions are still checked by the transfer policy
+            sp.cast(batch, sp.list[sp.record(from_=sp.address, token_id=sp.nat, amount=sp.nat).layout(("from_", ("token_id", "amount")))])
+            assert self.private.policy.supports_transfer, "FA2_TX_DENIED"
+            for action in batch:
+                assert self.is_defined_(action.token_id), "FA2_TOKEN_UNDEFINED"
+                self.check_tx_transfer_permissions_(sp.record(from_=action.from_, to_=action.from_, token_id=action.token_id))
+                if action.amount > 0:
+                    assert (action.amount == 1) and (self.data.ledger[action.token_id] == action.from_), "FA2_INSUFFICIENT_BALANCE"
+                    del self.data.ledger[action.token_id]
+                    del self.data.token_metadata[action.token_id]
+                    # tokens waiting for their entropy keep token_extra until set_entropy, which drops it
+                    if self.data.token_extra[action.token_id].seed.is_some():
+                        del self.data.token_extra[action.token_id]
+
         @sp.entrypoint
         def regenerate_token(self, token_id: sp.nat):
             assert self.data.ledger[token_id] == sp.sender, "ONLY_OWNER"
@@ -234,131 +518,646 @@ def bootloader():
             generator = self.data.generators[token_extra.generator_id]
             assert generator.version > token_extra.generator_version, "NO_UPDATE_POSSIBLE"
             assert token_extra.seed.is_some(), "SEED_NOT_SET"
-            self.data.token_metadata[token_id] = sp.record(
-                token_id=token_id, 
-                token_info=self.data.bootloaders[generator.type_id].fun(sp.record(
-                    fragments=self.data.bootloaders[generator.type_id].fragments,
-                    token_id=token_id,
-                    seed=bytes_utils.from_nat(bytes_utils.to_nat(token_extra.seed.unwrap_some())),
-                    iteration_number=token_extra.iteration_number,
-                    generator_name=generator.name,
-                    generator_author_bytes=generator.author_bytes,
-                    generator_version=generator.version,
-                    generator_code=generator.code
-            )))
+            # lazy tokens are always rendered from the current generator, whose code cannot change
+            # once it has minted, only the version is tracked
+            if self.data.bootloader_render_modes.get(generator.type_id, default=0) != 2:
+                self.data.token_metadata[token_id] = sp.record(
+                    token_id=token_id, 
+                    token_info=render(sp.record(
+                        loader=self.data.bootloaders[generator.type_id],
+                        token_id=token_id,
+                        seed=self._decimal_seed(token_id),
+                        iteration_number=token_extra.iteration_number,
+                        generator=generator,
+                        libraries=self._libraries(sp.record(generator_id=token_extra.generator_id, type_id=generator.type_id))
+                )))
 
             self.data.token_extra[token_id].generator_version = generator.version
+            sp.emit(sp.record(token_id=token_id, generator_version=generator.version), tag="regenerate_token")
         
+        @sp.entrypoint
+        def regenerate_tokens(self, token_ids: sp.list[sp.nat]):
+            # generators, their libraries, bootloaders and render modes are read once per batch
+            generators = sp.cast({}, sp.map[sp.nat, t_generator])
+            generator_libraries = sp.cast({}, sp.map[sp.nat, sp.list[sp.bytes]])
+            loaders = sp.cast({}, sp.map[sp.nat, t_bootloader])
+            render_modes = sp.cast({}, sp.map[sp.nat, sp.nat])
+            for token_id in token_ids:
+                assert self.data.ledger[token_id] == sp.sender, "ONLY_OWNER"
+                token_extra = self.data.token_extra[token_id]
+                generator_id = token_extra.generator_id
+                if not generators.contains(generator_id):
+                    generators[generator_id] = self.data.generators[generator_id]
+                generator = generators[generator_id]
+                assert generator.version > token_extra.generator_version, "NO_UPDATE_POSSIBLE"
+                assert token_extra.seed.is_some(), "SEED_NOT_SET"
+
+                if not render_modes.contains(generator.type_id):
+                    render_modes[generator.type_id] = self.data.bootloader_render_modes.get(generator.type_id, default=0)
+                if render_modes[generator.type_id] != 2:
+                    if not loaders.contains(generator.type_id):
+                        loaders[generator.type_id] = self.data.bootloaders[generator.type_id]
+                    if not generator_libraries.contains(generator_id):
+                        generator_libraries[generator_id] = self._libraries(sp.record(generator_id=generator_id, type_id=generator.type_id))
+                    self.data.token_metadata[token_id] = sp.record(
+                        token_id=token_id,
+                        token_info=render(sp.record(
+                            loader=loaders[generator.type_id],
+                            token_id=token_id,
+                            seed=self._decimal_seed(token_id),
+                            iteration_number=token_extra.iteration_number,
+                            generator=generator,
+                            libraries=generator_libraries[generator_id]
+                    )))
+
+                self.data.token_extra[token_id].generator_version = generator.version
+                sp.emit(sp.record(token_id=token_id, generator_version=generator.version), tag="regenerate_token")
+
+        @sp.entrypoint
+        def cache_decimal_seeds(self, token_ids: sp.list[sp.nat]):
+            # migration for tokens revealed without a decimal seed (lazy tokens, or revealed
+            # before it was stored), anyone can pay for it
+            # burnt tokens have no token_extra left and are skipped
+            for token_id in token_ids:
+                match self.data.token_extra.get_opt(token_id):
+                    case Some(token_extra):
+                        if token_extra.decimal_seed.is_none():
+                            match token_extra.seed:
+                                case Some(seed):
+                                    self.data.token_extra[token_id].decimal_seed = sp.Some(bytes_utils.from_nat(bytes_utils.to_nat(seed)))
+
         @sp.entrypoint
         def airdrop(self, generator_id: sp.nat, recipient: sp.address, entropy: sp.bytes):
             generator = self.data.generators[generator_id]
             assert sp.sender == generator.author, "ONLY_AUTHOR"
-            assert generator.reserved_editions > 0, "NO_RESERVED_LEFT"
-            match generator.sale:
+            state = self.data.generator_state[generator_id]
+            assert state.reserved_editions > 0, "NO_RESERVED_LEFT"
+            match state.sale:
                 case Some(sale):
-                    assert generator.n_tokens < sale.editions, "NO_RESERVED_LEFT"
+                    assert state.n_tokens < sale.editions, "NO_RESERVED_LEFT"
 
-            self.data.generators[generator_id].reserved_editions = sp.as_nat(generator.reserved_editions - 1)
+            self.data.generator_state[generator_id].reserved_editions = sp.as_nat(state.reserved_editions - 1)
 
             token_id = self.data.next_token_id
 
-            self.data.token_metadata[token_id] = sp.record(
-                token_id=token_id, 
-                token_info=self.data.bootloaders[generator.type_id].fun(sp.record(
-                fragments=self.data.bootloaders[generator.type_id].fragments,
-                    token_id=token_id,
-                    seed=self.private.EMPTY_SEED,
-                    iteration_number=generator.n_tokens+1,
-                    generator_name=generator.name,
-                    generator_author_bytes=generator.author_bytes,
-                    generator_version=generator.version,
-                    generator_code=generator.code
-            )))
+            if self.data.bootloader_render_modes.get(generator.type_id, default=0) == 0:
+                self.data.token_metadata[token_id] = sp.record(
+                    token_id=token_id, 
+                    token_info=render(sp.record(
+                        loader=self.data.bootloaders[generator.type_id],
+                        token_id=token_id,
+                        seed=self.private.EMPTY_SEED,
+                        iteration_number=state.n_tokens+1,
+                        generator=generator,
+                        libraries=self._libraries(sp.record(generator_id=generator_id, type_id=generator.type_id))
+                )))
+            else:
+                # deferred/lazy: keep the token defined for FA2 but leave rendering to set_entropy or the view
+                self.data.token_metadata[token_id] = sp.record(token_id=token_id, token_info={})
 
 
             self.data.ledger[token_id] = recipient
-            self.data.generators[generator_id].n_tokens += 1
-            self.data.token_extra[token_id] = sp.record(generator_id=generator_id, seed=None, generator_version=generator.version, iteration_number=generator.n_tokens+1)
+            self.data.generator_state[generator_id].n_tokens += 1
+            self.data.token_extra[token_id] = sp.record(generator_id=generator_id, seed=None, decimal_seed=None, generator_version=generator.version, iteration_number=state.n_tokens+1)
             self.data.next_token_id += 1
             self._request_entropy(sp.record(token_id=token_id, entropy=entropy))
+            sp.emit(sp.record(generator_id=generator_id, first_token_id=token_id, recipients=[recipient]), tag="airdrop")
 
         @sp.entrypoint
-        def mint(self, generator_id: sp.nat, entropy: sp.bytes): 
+        def airdrop_batch(self, generator_id: sp.nat, recipients: sp.list[sp.address], entropy: sp.bytes):
+            count = sp.len(recipients)
+            assert count > 0, "INVALID_COUNT"
+            match self.data.max_batch_count:
+                case Some(max_batch_count):
+                    assert count <= max_batch_count, "BATCH_TOO_LARGE"
             generator = self.data.generators[generator_id]
-            assert generator.sale.is_some(), "NO_SALE_CONFIG"
-            match generator.sale:
+            assert sp.sender == generator.author, "ONLY_AUTHOR"
+            state = self.data.generator_state[generator_id]
+            assert state.reserved_editions >= count, "NO_RESERVED_LEFT"
+            match state.sale:
                 case Some(sale):
-                    assert not sale.paused, "SALE_PAUSED"
-                    assert sp.amount == sale.price, "PRICE_MISMATCH"
-
-                    match sale.start_time:
-                        case Some(start_time):
-                            assert sp.now >= start_time, "SALE_NOT_STARTED"
-                    
-                    assert generator.n_tokens + generator.reserved_editions < sale.editions, "PUBLIC_SOLD_OUT"
-                    
-                    # enforce (optional) max per wallet
-                    minted_key = (generator_id, sp.sender)
-                    n_minted = self.data.generator_mints.get(minted_key, default=0)
-                    match sale.max_per_wallet:
-                        case Some(max_per_wallet):
-                            assert max_per_wallet > n_minted, "EXCEEDS_MAX_PER_WALLET"
-                    self.data.generator_mints[minted_key] = n_minted + 1
-
-
-                    if sp.amount > sp.mutez(0):
-                        platform_fee = sp.split_tokens(sp.amount, self.data.platform_fee_bps, 10_000)
-                        rest = sp.amount - platform_fee
-                        if platform_fee > sp.mutez(0):
-                            sp.send(self.data.treasury, platform_fee)
-                        if rest > sp.mutez(0):
-                            sp.send(generator.author, rest)
-
-                    token_id = self.data.next_token_id
+                    assert state.n_tokens + count <= sale.editions, "NO_RESERVED_LEFT"
+
+            self.data.generator_state[generator_id].reserved_editions = sp.as_nat(state.reserved_editions - count)
+
+            eager = self.data.bootloader_render_modes.get(generator.type_id, default=0) == 0
+            loader = self.data.bootloaders[generator.type_id]
+            libraries = self._libraries(sp.record(generator_id=generator_id, type_id=generator.type_id))
+            first_token_id = self.data.next_token_id
+            token_id = first_token_id
+            iteration_number = state.n_tokens + 1
+            for recipient in recipients:
+                if eager:
                     self.data.token_metadata[token_id] = sp.record(
-                        token_id=token_id, 
-                        token_info=self.data.bootloaders[generator.type_id].fun(sp.record(
-                        fragments=self.data.bootloaders[generator.type_id].fragments,
+                        token_id=token_id,
+                        token_info=render(sp.record(
+                            loader=loader,
                             token_id=token_id,
                             seed=self.private.EMPTY_SEED,
-                            iteration_number=generator.n_tokens+1,
-                            generator_name=generator.name,
-                            generator_author_bytes=generator.author_bytes,
-                            generator_version=generator.version,
-                            generator_code=generator.code
+                            iteration_number=iteration_number,
+                            generator=generator,
+                            libraries=libraries
                     )))
+                else:
+                    self.data.token_metadata[token_id] = sp.record(token_id=token_id, token_info={})
+                self.data.ledger[token_id] = recipient
+                self.data.token_extra[token_id] = sp.record(generator_id=generator_id, seed=None, decimal_seed=None, generator_version=generator.version, iteration_number=iteration_number)
+                token_id += 1
+                iteration_number += 1
 
-                    self.data.ledger[token_id] = sp.sender
-                    self.data.generators[generator_id].n_tokens += 1
-                    self.data.token_extra[token_id] = sp.record(generator_id=generator_id, seed=None, generator_version=generator.version, iteration_number=generator.n_tokens+1)
-                    self.data.next_token_id += 1
-                    self._request_entropy(sp.record(token_id=token_id,entropy=entropy))
-                case None:
-                    raise "NO_SALE_CONFIGURED"
+            self.data.generator_state[generator_id].n_tokens += count
+            self.data.next_token_id = token_id
+            # a single entropy request covers the batch, set_entropy derives the per-token seeds
+            self.data.entropy_batches[first_token_id] = count
+            self._request_entropy(sp.record(token_id=first_token_id, entropy=entropy))
+            sp.emit(sp.record(generator_id=generator_id, first_token_id=first_token_id, recipients=recipients), tag="airdrop")
+
+        @sp.entrypoint
+        def mint(self, generator_id: sp.nat, entropy: sp.bytes):
+            minted = self._mint(sp.record(generator_id=generator_id, allowlisted=False))
+            self._distribute_proceeds(minted.author)
+            self._request_entropy(sp.record(token_id=minted.token_id, entropy=entropy))
+            sp.emit(sp.record(generator_id=generator_id, first_token_id=minted.token_id, count=sp.nat(1), owner=sp.sender), tag="mint")
+
+        @sp.entrypoint
+        def mint_allowlisted(self, generator_id: sp.nat, entropy: sp.bytes, quota: sp.nat, proof: sp.list[sp.bytes]):
+            # proof is the list of sibling hashes from the (sender, quota) leaf up to the root,
+            # each pair being hashed in ascending order as done by allowlist.py
+            root = self.data.allowlists.get_opt(generator_id).unwrap_some(error="NO_ALLOWLIST")
+            node = sp.sha256(sp.pack((sp.sender, quota)))
+            for sibling in proof:
+                if node < sibling:
+                    node = sp.sha256(node + sibling)
+                else:
+                    node = sp.sha256(sibling + node)
+            assert node == root, "INVALID_PROOF"
+
+            allowlist_key = (generator_id, sp.sender)
+            n_allowlisted = self.data.allowlist_mints.get(allowlist_key, default=0)
+            assert n_allowlisted < quota, "EXCEEDS_ALLOWLIST_QUOTA"
+            self.data.allowlist_mints[allowlist_key] = n_allowlisted + 1
+            minted = self._mint(sp.record(generator_id=generator_id, allowlisted=True))
+            self._distribute_proceeds(minted.author)
+            self._request_entropy(sp.record(token_id=minted.token_id, entropy=entropy))
+            sp.emit(sp.record(generator_id=generator_id, first_token_id=minted.token_id, count=sp.nat(1), owner=sp.sender), tag="mint")
+
+        @sp.entrypoint
+        def mint_batch(self, generator_id: sp.nat, count: sp.nat, entropy: sp.bytes):
+            assert count > 0, "INVALID_COUNT"
+            match self.data.max_batch_count:
+                case Some(max_batch_count):
+                    assert count <= max_batch_count, "BATCH_TOO_LARGE"
+            generator = self.data.generators[generator_id]
+            state = self.data.generator_state[generator_id]
+            sale = state.sale.unwrap_some(error="NO_SALE_CONFIG")
+            assert not sale.paused, "SALE_PAUSED"
+            assert sp.amount == sp.split_tokens(sale.price, count, 1), "PRICE_MISMATCH"
+
+            match sale.start_time:
+                case Some(start_time):
+                    assert sp.now >= start_time, "SALE_NOT_STARTED"
+
+            assert state.n_tokens + state.reserved_editions + count <= sale.editions, "PUBLIC_SOLD_OUT"
+
+            # enforce (optional) max per wallet for the whole batch
+            minted_key = (generator_id, sp.sender)
+            n_minted = self.data.generator_mints.get(minted_key, default=0)
+            match sale.max_per_wallet:
+                case Some(max_per_wallet):
+                    assert n_minted + count <= max_per_wallet, "EXCEEDS_MAX_PER_WALLET"
+            self.data.generator_mints[minted_key] = n_minted + count
+
+            self._distribute_proceeds(generator.author)
+
+            eager = self.data.bootloader_render_modes.get(generator.type_id, default=0) == 0
+            loader = self.data.bootloaders[generator.type_id]
+            libraries = self._libraries(sp.record(generator_id=generator_id, type_id=generator.type_id))
+            first_token_id = self.data.next_token_id
+            for i in range(count):
+                token_id = first_token_id + i
+                if eager:
+                    self.data.token_metadata[token_id] = sp.record(
+                        token_id=token_id,
+                        token_info=render(sp.record(
+                            loader=loader,
+                            token_id=token_id,
+                            seed=self.private.EMPTY_SEED,
+                            iteration_number=state.n_tokens+i+1,
+                            generator=generator,
+                            libraries=libraries
+                    )))
+                else:
+                    self.data.token_metadata[token_id] = sp.record(token_id=token_id, token_info={})
+                self.data.ledger[token_id] = sp.sender
+                self.data.token_extra[token_id] = sp.record(generator_id=generator_id, seed=None, decimal_seed=None, generator_version=generator.version, iteration_number=state.n_tokens+i+1)
+
+            self.data.generator_state[generator_id].n_tokens += count
+            self.data.next_token_id += count
+            # a single entropy request covers the batch, set_entropy derives the per-token seeds
+            self.data.entropy_batches[first_token_id] = count
+            self._request_entropy(sp.record(token_id=first_token_id, entropy=entropy))
+            sp.emit(sp.record(generator_id=generator_id, first_token_id=first_token_id, count=count, owner=sp.sender), tag="mint")
 
         @sp.entrypoint
         def set_entropy(self, params: sp.record(token_id=sp.nat, entropy=sp.bytes)):
             assert sp.sender == self.data.rng_contract, "INVALID_RNG_CONTRACT"
-            assert len(params.entropy) == 32, "INVALID_SEED_LENGTH"
-            token_extra = self.data.token_extra[params.token_id]
+            # all tokens of a batch belong to the same generator
+            generator_id = self.data.token_extra[params.token_id].generator_id
+            generator = self.data.generators[generator_id]
+            libraries = self._libraries(sp.record(generator_id=generator_id, type_id=generator.type_id))
+            self._reveal(sp.record(
+                token_id=params.token_id,
+                entropy=params.entropy,
+                generator=generator,
+                libraries=libraries,
+                loader=self.data.bootloaders[generator.type_id],
+                render_mode=self.data.bootloader_render_modes.get(generator.type_id, default=0),
+            ))
+
+        @sp.entrypoint
+        def set_entropy_batch(self, entries: sp.list[sp.record(token_id=sp.nat, entropy=sp.bytes)]):
+            assert sp.sender == self.data.rng_contract, "INVALID_RNG_CONTRACT"
+            # generators and bootloaders are read from their big_maps once per batch
+            generators = sp.cast({}, sp.map[sp.nat, t_generator])
+            generator_libraries = sp.cast({}, sp.map[sp.nat, sp.list[sp.bytes]])
+            loaders = sp.cast({}, sp.map[sp.nat, t_bootloader])
+            render_modes = sp.cast({}, sp.map[sp.nat, sp.nat])
+            for entry in entries:
+                # a request made again with request_entropy_again can be revealed twice, the late
+                # reveal is ignored instead of failing the callback of every other request
+                pending = False
+                match self.data.token_extra.get_opt(entry.token_id):
+                    case Some(token_extra):
+                        pending = token_extra.seed.is_none()
+                if pending:
+                    generator_id = self.data.token_extra[entry.token_id].generator_id
+                    if not generators.contains(generator_id):
+                        generators[generator_id] = self.data.generators[generator_id]
+                        generator_libraries[generator_id] = self._libraries(sp.record(generator_id=generator_id, type_id=generators[generator_id].type_id))
+                    generator = generators[generator_id]
+                    if not loaders.contains(generator.type_id):
+                        loaders[generator.type_id] = self.data.bootloaders[generator.type_id]
+                        render_modes[generator.type_id] = self.data.bootloader_render_modes.get(generator.type_id, default=0)
+                    self._reveal(sp.record(
+                        token_id=entry.token_id,
+                        entropy=entry.entropy,
+                        generator=generator,
+                        libraries=generator_libraries[generator_id],
+                        loader=loaders[generator.type_id],
+                        render_mode=render_modes[generator.type_id],
+                    ))
+
+        @sp.entrypoint
+        def request_entropy_again(self, token_id: sp.nat, entropy: sp.bytes):
+            # recovers tokens whose request was dropped by the randomiser, token_id is the
+            # first_token_id of the mint event and the whole batch is revealed again
+            token_extra = self.data.token_extra.get_opt(token_id).unwrap_some(error="FA2_TOKEN_UNDEFINED")
             assert token_extra.seed.is_none(), "SEED_SET"
+            is_owner = self.data.ledger.get_opt(token_id) == sp.Some(sp.sender)
+            assert is_owner or self.data.moderators.contains(sp.sender) or sp.sender == self.data.administrator, "ONLY_OWNER_OR_MODS"
+            assert self._is_request_start(token_id), "NOT_FIRST_TOKEN"
+            self._request_entropy(sp.record(token_id=token_id, entropy=entropy))
+
+        @sp.onchain_view
+        def get_entropy_batch_size(self, token_id: sp.nat):
+            """Number of tokens revealed by the entropy requested for token_id"""
+            return self.data.entropy_batches.get(token_id, default=1)
+
+        @sp.onchain_view
+        def get_token_preview(self, token_id: sp.nat):
+            # renders the token as it would be stored, using the placeholder seed while the reveal is pending
+            token_extra = self.data.token_extra[token_id]
             generator = self.data.generators[token_extra.generator_id]
+            # EMPTY_SEED, self.private is out of reach of views
+            seed = sp.bytes("0x30")
+            match token_extra.decimal_seed:
+                case Some(decimal_seed):
+                    seed = decimal_seed
+                case None:
+                    match token_extra.seed:
+                        case Some(entropy):
+                            seed = bytes_utils.from_nat(bytes_utils.to_nat(entropy))
+            return render(sp.record(
+                loader=self.data.bootloaders[generator.type_id],
+                token_id=token_id,
+                seed=seed,
+                iteration_number=token_extra.iteration_number,
+                generator=generator,
+                libraries=self._libraries(sp.record(generator_id=token_extra.generator_id, type_id=generator.type_id))
+            ))
 
-            existing_token_id = self.data.token_metadata[params.token_id]
-            self.data.token_metadata[params.token_id] = sp.record(
-                token_id=params.token_id,
-                token_info=self.data.bootloaders[generator.type_id].fun(sp.record(
-                        fragments=self.data.bootloaders[generator.type_id].fragments,
-                            token_id=params.token_id,
-                            seed=bytes_utils.from_nat(bytes_utils.to_nat(params.entropy)),
-                            iteration_number=token_extra.iteration_number,
-                            generator_name=generator.name,
-                            generator_author_bytes=generator.author_bytes,
-                            generator_version=generator.version,
-                            generator_code=generator.code
-                    ))
+        @sp.offchain_view
+        def token_metadata(self, token_id: sp.nat):
+            """TZIP-12 token metadata, rendered on demand for tokens without a stored artifact.
+
+            Lazy tokens never store their artifact, and deferred tokens only once their seed
+            is revealed, so the view renders whenever the stored token_info has no artifactUri
+            (deferred tokens then show the empty seed placeholder, as eager tokens do). Lazy
+            tokens are rendered from the current generator: its code and libraries are frozen
+            once it has minted, but updates to its name and author_bytes still apply.
+
+            Entries stored in the token_metadata big_map (e.g. a thumbnailUri set by
+            update_thumbnail) take precedence over the rendered ones.
+            """
+            token_info = self.data.token_metadata[token_id].token_info
+            if not token_info.contains("artifactUri"):
+                token_extra = self.data.token_extra[token_id]
+                generator = self.data.generators[token_extra.generator_id]
+                # EMPTY_SEED, self.private is out of reach of views
+                seed = sp.bytes("0x30")
+                match token_extra.decimal_seed:
+                    case Some(decimal_seed):
+                        seed = decimal_seed
+                    case None:
+                        match token_extra.seed:
+                            case Some(entropy):
+                                seed = bytes_utils.from_nat(bytes_utils.to_nat(entropy))
+                rendered = render(sp.record(
+                    loader=self.data.bootloaders[generator.type_id],
+                    token_id=token_id,
+                    seed=seed,
+                    iteration_number=token_extra.iteration_number,
+                    generator=generator,
+                    libraries=self._libraries(sp.record(generator_id=token_extra.generator_id, type_id=generator.type_id))
+                ))
+                for item in token_info.items():
+                    rendered[item.key] = item.value
+                token_info = rendered
+            return sp.record(token_id=token_id, token_info=token_info)
+
+        @sp.onchain_view
+        def get_generator(self, generator_id: sp.nat):
+            # merged view of the generator record and its mutable state, as stored before the split
+            generator = self.data.generators[generator_id]
+            state = self.data.generator_state[generator_id]
+            return sp.record(
+                name=generator.name,
+                created=generator.created,
+                last_update=generator.last_update,
+                description=generator.description,
+                author=generator.author,
+                author_bytes=generator.author_bytes,
+                code=generator.code,
+                n_tokens=state.n_tokens,
+                reserved_editions=state.reserved_editions,
+                flag=state.flag,
+                version=generator.version,
+                type_id=generator.type_id,
+                sale=state.sale,
+            )
+
+        @sp.private(with_storage="read-write", with_operations=True)
+        def _reveal(self, params):
+            assert len(params.entropy) == 32, "INVALID_SEED_LENGTH"
+
+            # tokens of a batch mint or airdrop share the entropy of their first token, each one
+            # gets its own seed derived as sha256(entropy + pack(token_id))
+            n_tokens = 1
+            derive_seeds = False
+            match self.data.entropy_batches.get_opt(params.token_id):
+                case Some(batch_size):
+                    n_tokens = batch_size
+                    derive_seeds = True
+                    del self.data.entropy_batches[params.token_id]
+
+            for i in range(n_tokens):
+                token_id = params.token_id + i
+                token_extra = self.data.token_extra[token_id]
+                assert token_extra.seed.is_none(), "SEED_SET"
+                seed = params.entropy
+                if derive_seeds:
+                    seed = sp.sha256(params.entropy + sp.pack(token_id))
+
+                if not self.data.ledger.contains(token_id):
+                    # burnt before its reveal, the entry was only kept until now
+                    del self.data.token_extra[token_id]
+                else:
+                    # lazy tokens only need the seed, their metadata is computed by the token_metadata view
+                    if params.render_mode != 2:
+                        # kept next to the seed so that regenerations skip the conversion
+                        decimal_seed = bytes_utils.from_nat(bytes_utils.to_nat(seed))
+                        self.data.token_extra[token_id].decimal_seed = sp.Some(decimal_seed)
+                        self.data.token_metadata[token_id] = sp.record(
+                            token_id=token_id,
+                            token_info=render(sp.record(
+                                loader=params.loader,
+                                token_id=token_id,
+                                seed=decimal_seed,
+                                iteration_number=token_extra.iteration_number,
+                                generator=params.generator,
+                                libraries=params.libraries
+                            ))
+                        )
+                    self.data.token_extra[token_id].seed = sp.Some(seed)
+            # batch seeds are not listed, consumers derive them from the entropy as above
+            sp.emit(sp.record(first_token_id=params.token_id, count=n_tokens, entropy=params.entropy), tag="set_entropy")
+
+        @sp.onchain_view
+        def get_generator_summary(self, generator_id: sp.nat):
+            # get_generator without the code and description, for callers that only need the counters
+            generator = self.data.generators[generator_id]
+            state = self.data.generator_state[generator_id]
+            return sp.record(
+                name=generator.name,
+                created=generator.created,
+                last_update=generator.last_update,
+                author=generator.author,
+                author_bytes=generator.author_bytes,
+                version=generator.version,
+                type_id=generator.type_id,
+                n_tokens=state.n_tokens,
+                reserved_editions=state.reserved_editions,
+                flag=state.flag,
+                sale=state.sale,
+            )
+
+        @sp.onchain_view
+        def get_sale(self, generator_id: sp.nat):
+            return self.data.generator_state[generator_id].sale
+
+        @sp.onchain_view
+        def get_token_extra(self, token_id: sp.nat):
+            return self.data.token_extra[token_id]
+
+        @sp.onchain_view
+        def get_mint_count(self, params: sp.record(generator_id=sp.nat, address=sp.address)):
+            return self.data.generator_mints.get((params.generator_id, params.address), default=0)
+
+        @sp.onchain_view
+        def remaining_editions(self, generator_id: sp.nat):
+            # editions still open to the public sale, reserved editions excluded
+            state = self.data.generator_state[generator_id]
+            remaining = 0
+            match state.sale:
+                case Some(sale):
+                    if sale.editions > state.n_tokens + state.reserved_editions:
+                        remaining = sp.as_nat(sale.editions - (state.n_tokens + state.reserved_editions))
+            return remaining
+
+        @sp.private(with_storage="read-write")
+        def _decimal_seed(self, token_id):
+            # the bytes -> nat -> decimal conversion of a 32 byte seed is costly, do it once per token
+            token_extra = self.data.token_extra[token_id]
+            decimal_seed = sp.bytes("0x")
+            match token_extra.decimal_seed:
+                case Some(cached):
+                    decimal_seed = cached
+                case None:
+                    decimal_seed = bytes_utils.from_nat(bytes_utils.to_nat(token_extra.seed.unwrap_some(error="SEED_NOT_SET")))
+                    self.data.token_extra[token_id].decimal_seed = sp.Some(decimal_seed)
+            return decimal_seed
+
+        @sp.private(with_storage="read-only")
+        def _libraries(self, params):
+            # code of the libraries referenced by a generator, in the order they are spliced;
+            # bootloaders whose lambda ignores params.libraries skip the lookups
+            hashes = sp.cast([], sp.list[sp.bytes])
+            if self.data.bootloader_library_support.contains(params.type_id):
+                hashes = self.data.generator_libraries.get(params.generator_id, default=[])
+            return spliced_libraries(sp.record(hashes=hashes, libraries=self.data.libraries))
+
+        @sp.private(with_storage="read-only")
+        def _libraries_size(self, generator_id):
+            size = 0
+            for library_hash in self.data.generator_libraries.get(generator_id, default=[]):
+                size += sp.len(self.data.libraries[library_hash])
+            return size
+
+        @sp.private(with_storage="read-only")
+        def _lazy_tokens_minted(self, generator_id):
+            # lazy tokens are rendered from the current generator, new code would change their art
+            generator = self.data.generators[generator_id]
+            lazy = self.data.bootloader_render_modes.get(generator.type_id, default=0) == 2
+            return lazy and self.data.generator_state[generator_id].n_tokens > 0
+
+        @sp.private(with_storage="read-write", with_operations=True)
+        def _create_generator(self, params):
+            assert self.data.bootloaders.contains(params.bootloader_id), "UNKNOWN_BOOTLOADER"
+            storage_limits = self.data.bootloader_storage_limits[params.bootloader_id]
+            assert sp.len(params.name) <= storage_limits.name, "NAME_TOO_LONG"
+            assert sp.len(params.description) <= storage_limits.desc, "DESC_TOO_LONG"
+            assert sp.len(params.code) <= storage_limits.code, "CODE_TOO_LONG"
+            assert sp.len(params.author_bytes) <= storage_limits.author, "AUTHOR_TOO_LONG"
+
+            self.data.generators[self.data.next_generator_id] = sp.record(
+                name=params.name,
+                created = sp.now,
+                last_update= sp.now,
+                description=params.description,
+                author=sp.sender,
+                author_bytes=params.author_bytes,
+                code=params.code,
+                version=1,
+                type_id=params.bootloader_id,
+            )
+            self.data.bootloaders_in_use[params.bootloader_id] = ()
+            self.data.generator_state[self.data.next_generator_id] = sp.record(
+                n_tokens=0,
+                reserved_editions=params.reserved_editions,
+                flag=0,
+                sale=None,
             )
-            self.data.token_extra[params.token_id].seed = sp.Some(params.entropy)
+
+            sp.emit(sp.record(generator_id=self.data.next_generator_id, author=sp.sender, bootloader_id=params.bootloader_id), tag="create_generator")
+            self.data.next_generator_id += 1
+
+        @sp.private(with_storage="read-write", with_operations=True)
+        def _distribute_proceeds(self, author):
+            # splits sp.amount between the treasury and the author, either paid out right away
+            # or credited to their balances in accrual mode
+            if sp.amount > sp.mutez(0):
+                platform_fee = sp.split_tokens(sp.amount, self.data.platform_fee_bps, 10_000)
+                rest = sp.amount - platform_fee
+                if self.data.accrue_payments:
+                    if platform_fee > sp.mutez(0):
+                        self.data.balances[self.data.treasury] = self.data.balances.get(self.data.treasury, default=sp.mutez(0)) + platform_fee
+                    if rest > sp.mutez(0):
+                        self.data.balances[author] = self.data.balances.get(author, default=sp.mutez(0)) + rest
+                else:
+                    if platform_fee > sp.mutez(0):
+                        sp.send(self.data.treasury, platform_fee)
+                    if rest > sp.mutez(0):
+                        sp.send(author, rest)
+
+        @sp.private(with_storage="read-write")
+        def _mint(self, params):
+            # checks the sale and stores the token; privates cannot call each other, so the
+            # caller pays the proceeds and requests the entropy of the returned token id.
+            # allowlisted mints may happen before the sale's start_time
+            generator_id = params.generator_id
+            generator = self.data.generators[generator_id]
+            state = self.data.generator_state[generator_id]
+            sale = state.sale.unwrap_some(error="NO_SALE_CONFIG")
+            assert not sale.paused, "SALE_PAUSED"
+            assert sp.amount == sale.price, "PRICE_MISMATCH"
+
+            if not params.allowlisted:
+                match sale.start_time:
+                    case Some(start_time):
+                        assert sp.now >= start_time, "SALE_NOT_STARTED"
+
+            assert state.n_tokens + state.reserved_editions < sale.editions, "PUBLIC_SOLD_OUT"
+
+            # enforce (optional) max per wallet
+            minted_key = (generator_id, sp.sender)
+            n_minted = self.data.generator_mints.get(minted_key, default=0)
+            match sale.max_per_wallet:
+                case Some(max_per_wallet):
+                    assert max_per_wallet > n_minted, "EXCEEDS_MAX_PER_WALLET"
+            self.data.generator_mints[minted_key] = n_minted + 1
+
+            token_id = self.data.next_token_id
+            if self.data.bootloader_render_modes.get(generator.type_id, default=0) == 0:
+                # as _libraries, which privates cannot call
+                hashes = sp.cast([], sp.list[sp.bytes])
+                if self.data.bootloader_library_support.contains(generator.type_id):
+                    hashes = self.data.generator_libraries.get(generator_id, default=[])
+                libraries = spliced_libraries(sp.record(hashes=hashes, libraries=self.data.libraries))
+                self.data.token_metadata[token_id] = sp.record(
+                    token_id=token_id,
+                    token_info=render(sp.record(
+                        loader=self.data.bootloaders[generator.type_id],
+                        token_id=token_id,
+                        # EMPTY_SEED, self.private is out of reach of privates
+                        seed=sp.bytes("0x30"),
+                        iteration_number=state.n_tokens+1,
+                        generator=generator,
+                        libraries=libraries
+                )))
+            else:
+                # deferred/lazy: keep the token defined for FA2 but leave rendering to set_entropy or the view
+                self.data.token_metadata[token_id] = sp.record(token_id=token_id, token_info={})
+
+            self.data.ledger[token_id] = sp.sender
+            self.data.generator_state[generator_id].n_tokens += 1
+            self.data.token_extra[token_id] = sp.record(generator_id=generator_id, seed=None, decimal_seed=None, generator_version=generator.version, iteration_number=state.n_tokens+1)
+            self.data.next_token_id += 1
+            return sp.record(token_id=token_id, author=generator.author)
+
+        @sp.private(with_storage="read-only")
+        def _is_request_start(self, token_id):
+            # a pending token starts its own request unless it is covered by an earlier pending
+            # batch; revealing a batch reveals all its tokens, so the walk back stops at the
+            # first revealed (or revealed and burnt) token
+            result = True
+            if not self.data.entropy_batches.contains(token_id):
+                k = token_id
+                done = False
+                while not done:
+                    if k == 0:
+                        done = True
+                    else:
+                        k = sp.as_nat(k - 1)
+                        if self.data.entropy_batches.contains(k):
+                            result = k + self.data.entropy_batches[k] <= token_id
+                            done = True
+                        else:
+                            match self.data.token_extra.get_opt(k):
+                                case None:
+                                    done = True
+                                case Some(previous):
+                                    done = previous.seed.is_some()
+            return result
 
         @sp.private(with_storage="read-only", with_operations=True)
         def _request_entropy(self, params):
@@ -378,7 +1177,8 @@ def bootloader():
             generator_name=sp.bytes,
             generator_author_bytes=sp.bytes,
             generator_version=sp.nat,
-            generator_code=sp.bytes
+            generator_code=sp.bytes,
+            libraries=sp.list[sp.bytes],
         ))
         svg_string =    list_utils.element_at((p.fragments, 0)) + \
                         p.seed + \
@@ -418,7 +1218,8 @@ def bootloader():
             generator_name=sp.bytes,
             generator_author_bytes=sp.bytes,
             generator_version=sp.nat,
-            generator_code=sp.bytes
+            generator_code=sp.bytes,
+            libraries=sp.list[sp.bytes],
         ))
         svg_string =    list_utils.element_at((p.fragments, 0)) + \
                         p.seed + \
@@ -449,3 +1250,116 @@ def bootloader():
             "symbol": sp.bytes("0x42544C4452"),
             "decimals": sp.bytes("0x30"),
         }
+
+    def v0_0_2(params):
+        # same output as v0_0_1, but the fragments list is walked once instead of
+        # four times and the iteration number is only converted once
+        p = sp.cast(params, t_lambda_params)
+        (frag_0, frag_1, frag_2, frag_3) = list_utils.unpack_4(p.fragments)
+        iteration_bytes = bytes_utils.from_nat(p.iteration_number)
+
+        svg_string = frag_0 + p.seed + frag_1 + iteration_bytes + frag_2 + p.generator_code + frag_3
+
+        # "https://media.bootloader.art/thumbnail/" + token_id + "?v=" + generator_version
+        thumbnail_uri_bytes = (
+            sp.bytes("0x68747470733a2f2f6d656469612e626f6f746c6f616465722e6172742f7468756d626e61696c2f")
+            + bytes_utils.from_nat(p.token_id)
+            + sp.bytes("0x3F763D")
+            + bytes_utils.from_nat(p.generator_version)
+        )
+
+        return {
+            "name": p.generator_name + sp.bytes("0x2023") + iteration_bytes,
+            "artifactUri": svg_string,
+            "thumbnailUri": thumbnail_uri_bytes,
+            "royalties": sp.bytes("0x7B22646563696D616C73223A322C22736861726573223A7B22") + p.generator_author_bytes + sp.bytes("0x223A357D7D"),
+            "creators": sp.bytes("0x5B22") + p.generator_author_bytes + sp.bytes('0x225D'),
+            "symbol": sp.bytes("0x42544C4452"),
+            "decimals": sp.bytes("0x30"),
+        }
+
+    def v0_0_3(params):
+        # v0_0_2 with the generator libraries spliced in front of the generator code
+        p = sp.cast(params, t_lambda_params)
+        (frag_0, frag_1, frag_2, frag_3) = list_utils.unpack_4(p.fragments)
+        iteration_bytes = bytes_utils.from_nat(p.iteration_number)
+
+        # each library is followed by ";\n" so that it cannot run into the next one
+        libraries = sp.bytes("0x")
+        for library in p.libraries:
+            libraries = libraries + library + sp.bytes("0x3b0a")
+        svg_string = frag_0 + p.seed + frag_1 + iteration_bytes + frag_2 + libraries + p.generator_code + frag_3
+
+        # "https://media.bootloader.art/thumbnail/" + token_id + "?v=" + generator_version
+        thumbnail_uri_bytes = (
+            sp.bytes("0x68747470733a2f2f6d656469612e626f6f746c6f616465722e6172742f7468756d626e61696c2f")
+            + bytes_utils.from_nat(p.token_id)
+            + sp.bytes("0x3F763D")
+            + bytes_utils.from_nat(p.generator_version)
+        )
+
+        return {
+            "name": p.generator_name + sp.bytes("0x2023") + iteration_bytes,
+            "artifactUri": svg_string,
+            "thumbnailUri": thumbnail_uri_bytes,
+            "royalties": sp.bytes("0x7B22646563696D616C73223A322C22736861726573223A7B22") + p.generator_author_bytes + sp.bytes("0x223A357D7D"),
+            "creators": sp.bytes("0x5B22") + p.generator_author_bytes + sp.bytes('0x225D'),
+            "symbol": sp.bytes("0x42544C4452"),
+            "decimals": sp.bytes("0x30"),
+        }
+
+    def v0_0_3_ghostnet(params):
+        p = sp.cast(params, t_lambda_params)
+        (frag_0, frag_1, frag_2, frag_3) = list_utils.unpack_4(p.fragments)
+        iteration_bytes = bytes_utils.from_nat(p.iteration_number)
+
+        # each library is followed by ";\n" so that it cannot run into the next one
+        libraries = sp.bytes("0x")
+        for library in p.libraries:
+            libraries = libraries + library + sp.bytes("0x3b0a")
+        svg_string = frag_0 + p.seed + frag_1 + iteration_bytes + frag_2 + libraries + p.generator_code + frag_3
+
+        # "https://media.bootloader.art/thumbnail/" + token_id + "?v=" + generator_version + &n=g (ghostnet flag)
+        thumbnail_uri_bytes = (
+            sp.bytes("0x68747470733a2f2f6d656469612e626f6f746c6f616465722e6172742f7468756d626e61696c2f")
+            + bytes_utils.from_nat(p.token_id)
+            + sp.bytes("0x3F763D")
+            + bytes_utils.from_nat(p.generator_version)
+            + sp.bytes("0x266E3D67")
+        )
+
+        return {
+            "name": p.generator_name + sp.bytes("0x2023") + iteration_bytes,
+            "artifactUri": svg_string,
+            "thumbnailUri": thumbnail_uri_bytes,
+            "royalties": sp.bytes("0x7B22646563696D616C73223A322C22736861726573223A7B22") + p.generator_author_bytes + sp.bytes("0x223A357D7D"),
+            "creators": sp.bytes("0x5B22") + p.generator_author_bytes + sp.bytes('0x225D'),
+            "symbol": sp.bytes("0x42544C4452"),
+            "decimals": sp.bytes("0x30"),
+        }
+
+    def v0_0_2_ghostnet(params):
+        p = sp.cast(params, t_lambda_params)
+        (frag_0, frag_1, frag_2, frag_3) = list_utils.unpack_4(p.fragments)
+        iteration_bytes = bytes_utils.from_nat(p.iteration_number)
+
+        svg_string = frag_0 + p.seed + frag_1 + iteration_bytes + frag_2 + p.generator_code + frag_3
+
+        # "https://media.bootloader.art/thumbnail/" + token_id + "?v=" + generator_version + &n=g (ghostnet flag)
+        thumbnail_uri_bytes = (
+            sp.bytes("0x68747470733a2f2f6d656469612e626f6f746c6f616465722e6172742f7468756d626e61696c2f")
+            + bytes_utils.from_nat(p.token_id)
+            + sp.bytes("0x3F763D")
+            + bytes_utils.from_nat(p.generator_version)
+            + sp.bytes("0x266E3D67")
+        )
+
+        return {
+            "name": p.generator_name + sp.bytes("0x2023") + iteration_bytes,
+            "artifactUri": svg_string,
+            "thumbnailUri": thumbnail_uri_bytes,
+            "royalties": sp.bytes("0x7B22646563696D616C73223A322C22736861726573223A7B22") + p.generator_author_bytes + sp.bytes("0x223A357D7D"),
+            "creators": sp.bytes("0x5B22") + p.generator_author_bytes + sp.bytes('0x225D'),
+            "symbol": sp.bytes("0x42544C4452"),
+            "decimals": sp.bytes("0x30"),
+        }
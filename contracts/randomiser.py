@@ -26,16 +26,48 @@ def randomiser():
             sp.transfer(sp.record(token_id=token_id, entropy=mock_entropy), sp.mutez(0), contract)
 
     class CentralisedRandomiser(sp.Contract):
-        """In a future update we can change the randomiser to be async (not immediately call back the bootloader contract)
-        This would allow integrating a more robust commit-reveal scheme. For now we prefer instant reveal over security.
+        """By default entropy is revealed instantly, in the same operation as the request.
+
+        With async_mode set, request_entropy only queues the request. A keeper then calls
+        the default entrypoint, which refreshes the external-state hash once and reveals
+        queued requests from earlier blocks, sending a single set_entropy_batch callback
+        per requesting contract. A request can reveal several tokens, as reported by the
+        requester's get_entropy_batch_size view, and reveal_batch_size caps the number
+        of tokens revealed per call so that the callbacks fit in the gas of an operation.
+
+        Only contracts added by the administrator with add_requester can queue requests.
+        A request whose callback keeps failing can be dropped with drop_request, and the
+        requests of a removed requester are dropped when their turn comes, so that one
+        bad requester cannot stall the queue.
+
+        With pool_mode set, the external-state hash b is only refreshed by calls to the
+        default entrypoint, and request_entropy reveals instantly by hashing b with the
+        user entropy, token_id and level, keeping the external views out of mints.
         """
-        def __init__(self, ):
+        def __init__(self):
+            # replaced by deploy.py
+            self.data.administrator = sp.address("tz1burnburnburnburnburnburnburjAYjjX")
             self.data.metadata = sp.cast(sp.big_map({}), sp.big_map[sp.string, sp.bytes])
+            # queue of pending requests in async mode, revealed in order from next_reveal_id
             self.data.requests = sp.cast(sp.big_map({}), sp.big_map[sp.nat, sp.record(
-                user_entropy=sp.bytes
+                requester=sp.address,
+                token_id=sp.nat,
+                # number of tokens revealed by the request
+                tokens=sp.nat,
+                user_entropy=sp.bytes,
+                level=sp.nat,
             )])
+            # contracts allowed to queue requests in async mode, they must have a set_entropy_batch
+            # entrypoint and a get_entropy_batch_size view
+            self.data.requesters = sp.cast(sp.big_map({}), sp.big_map[sp.address, sp.unit])
+            self.data.next_request_id = 0
+            self.data.next_reveal_id = 0
+            # tokens revealed per default call, a request larger than this is revealed on its own
+            self.data.reveal_batch_size = 50
             self.data.b = sp.bytes("0x888888")
             self.data.testnet_mode = False
+            self.data.async_mode = False
+            self.data.pool_mode = False
 
         @sp.private(with_storage="read-write", with_operations=False)
         def _testnet_obscurer(self, bytes_in):
@@ -103,19 +135,101 @@ def randomiser():
                 self.data.b = self._testnet_obscurer(self.data.b)
             else:
                 self.data.b = self._mainnet_obscurer(self.data.b)
-        
+            if self.data.async_mode:
+                self._reveal_pending()
+
+        @sp.private(with_storage="read-write", with_operations=True)
+        def _reveal_pending(self):
+            # requests from the current block are left for a later call, so their
+            # entropy depends on state that was unknown when they were made
+            batches = sp.cast({}, sp.map[sp.address, sp.list[sp.record(token_id=sp.nat, entropy=sp.bytes)]])
+            revealed = 0
+            done = False
+            while not done:
+                if revealed >= self.data.reveal_batch_size or self.data.next_reveal_id == self.data.next_request_id:
+                    done = True
+                else:
+                    match self.data.requests.get_opt(self.data.next_reveal_id):
+                        case None:
+                            # dropped by the administrator
+                            self.data.next_reveal_id += 1
+                        case Some(request):
+                            over_budget = revealed > 0 and revealed + request.tokens > self.data.reveal_batch_size
+                            if request.level >= sp.level or over_budget:
+                                done = True
+                            else:
+                                # requests of a removed requester are dropped instead of revealed
+                                if self.data.requesters.contains(request.requester):
+                                    entries = batches.get(request.requester, default=[])
+                                    entries.push(sp.record(
+                                        token_id=request.token_id,
+                                        entropy=sp.sha256(self.data.b + request.user_entropy + sp.pack(request.token_id))
+                                    ))
+                                    batches[request.requester] = entries
+                                    revealed += request.tokens
+                                del self.data.requests[self.data.next_reveal_id]
+                                self.data.next_reveal_id += 1
+
+            for batch in batches.items():
+                contract = sp.contract(sp.list[sp.record(token_id=sp.nat, entropy=sp.bytes)], batch.key, entrypoint="set_entropy_batch").unwrap_some()
+                sp.transfer(batch.value, sp.mutez(0), contract)
+
+        @sp.entrypoint
+        def set_administrator(self, address: sp.address):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            self.data.administrator = address
+
+        @sp.entrypoint
+        def add_requester(self, address: sp.address):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            self.data.requesters[address] = ()
+
+        @sp.entrypoint
+        def remove_requester(self, address: sp.address):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            del self.data.requesters[address]
+
+        @sp.entrypoint
+        def set_reveal_batch_size(self, reveal_batch_size: sp.nat):
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            assert reveal_batch_size > 0, "INVALID_BATCH_SIZE"
+            self.data.reveal_batch_size = reveal_batch_size
+
+        @sp.entrypoint
+        def drop_request(self, request_id: sp.nat):
+            # unblocks the queue when a callback keeps failing, the requester can ask for entropy again
+            assert sp.sender == self.data.administrator, "ONLY_ADMIN"
+            assert self.data.requests.contains(request_id), "UNKNOWN_REQUEST"
+            del self.data.requests[request_id]
+
         @sp.entrypoint
         def request_entropy(self, token_id, entropy):
-            # in a future implementation this could be done with a commit-reveal 
-            # scheme for now we are using this simple but gamable implementation
-            # that allows for a instant reveal
-            entropy_out = sp.bytes("0x")
-            if self.data.testnet_mode:
-                entropy_out = self._testnet_obscurer(entropy)
+            if self.data.async_mode:
+                # commit-reveal: the request is queued and revealed by a later default call
+                assert self.data.requesters.contains(sp.sender), "UNKNOWN_REQUESTER"
+                tokens = sp.view("get_entropy_batch_size", sp.sender, token_id, sp.nat).unwrap_some(error="NO_BATCH_SIZE_VIEW")
+                self.data.requests[self.data.next_request_id] = sp.record(
+                    requester=sp.sender,
+                    token_id=token_id,
+                    tokens=tokens,
+                    user_entropy=entropy,
+                    level=sp.level,
+                )
+                self.data.next_request_id += 1
             else:
-                entropy_out = self._mainnet_obscurer(entropy)
-            
-            self._set_entropy_callback(sp.record(address=sp.sender, token_id=token_id, entropy=entropy_out))
+                # instant reveal: simple but gamable, the entropy only depends on the
+                # state of the block the request is included in
+                entropy_out = sp.bytes("0x")
+                if self.data.pool_mode:
+                    # the pool is refreshed by default calls, not on every request
+                    entropy_out = sp.sha256(self.data.b + entropy + sp.pack(token_id) + sp.pack(sp.level))
+                else:
+                    if self.data.testnet_mode:
+                        entropy_out = self._testnet_obscurer(entropy)
+                    else:
+                        entropy_out = self._mainnet_obscurer(entropy)
+
+                self._set_entropy_callback(sp.record(address=sp.sender, token_id=token_id, entropy=entropy_out))
 
         @sp.private(with_storage="read-only", with_operations=True)
         def _set_entropy_callback(self, params):
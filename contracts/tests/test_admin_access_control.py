@@ -195,7 +195,7 @@ def test_moderator_permissions():
     
     scenario.h2("Moderator can flag generators")
     contract.flag_generator(generator_id=0, flag=1, _sender=moderator)
-    scenario.verify(contract.data.generators[0].flag == 1)
+    scenario.verify(contract.data.generator_state[0].flag == 1)
 
 @sp.add_test()
 def test_access_control_enforcement():
@@ -7,10 +7,13 @@ This module tests bootloader-related functionality:
 - Generator creation with different bootloader types
 - Bootloader versioning and fragments
 - Lambda function execution for token metadata
+- v0.0.2 lambda output matches v0.0.1
 """
 
 from bootloader import bootloader
 from randomiser import randomiser
+from benchmarks import benchmarks
+from contracts.utils import bytes_utils
 import smartpy as sp
 import os
 
@@ -516,3 +519,218 @@ def test_bootloader_storage_limit_enforcement():
         _valid=False,
         _exception="AUTHOR_TOO_LONG"
     )
+
+@sp.add_test()
+def test_lazy_render_mode():
+    """
+    Tests lazy token metadata:
+    - Minting stores no artifact for lazy bootloaders
+    - set_entropy only stores the seed
+    - The token_metadata off-chain view renders the same metadata as eager mode
+    - The lazy artifact is the bootloader lambda's output for the token's seed
+    - Stored entries (thumbnail overrides) take precedence in the view
+    - The code of a lazy generator is frozen once it has minted
+    """
+    scenario = sp.test_scenario("Lazy Render Mode", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    fragments = [
+        sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+        sp.bytes("0x3c2f7376673e"),
+        sp.bytes("0x3c2f7376673e"),
+        sp.bytes("0x3c2f7376673e")
+    ]
+    storage_limits = sp.record(code=30000, name=500, desc=8000, author=50)
+    # bootloader 0 is eager, bootloader 1 is lazy
+    for _ in range(2):
+        contract.add_bootloader(
+            version=sp.bytes("0x76302e302e31"),
+            fragments=fragments,
+            fun=bootloader.v0_0_1,
+            storage_limits=storage_limits,
+            _sender=admin
+        )
+    contract.set_bootloader_render_mode(bootloader_id=1, render_mode=2, _sender=admin)
+
+    for bootloader_id in range(2):
+        contract.create_generator(
+            name=sp.bytes("0x4c617a79"),
+            description=sp.bytes("0x54657374"),
+            code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+            author_bytes=sp.bytes("0x416c696365"),
+            reserved_editions=0,
+            bootloader_id=bootloader_id,
+            _sender=alice
+        )
+        contract.set_sale(
+            generator_id=bootloader_id,
+            start_time=None,
+            price=sp.mutez(0),
+            paused=False,
+            editions=10,
+            max_per_wallet=None,
+            _sender=alice
+        )
+
+    scenario.h2("Lazy mint only stores the seed")
+    contract.mint(generator_id=1, entropy=sp.bytes("0x01"), _sender=bob, _amount=sp.mutez(0))
+    scenario.verify(contract.data.token_extra[0].seed.is_some())
+    scenario.verify(sp.len(contract.data.token_metadata[0].token_info) == 0)
+
+    scenario.h2("Eager mint of the same generator setup")
+    contract.mint(generator_id=0, entropy=sp.bytes("0x01"), _sender=bob, _amount=sp.mutez(0))
+    scenario.verify(contract.data.token_metadata[1].token_info.contains("artifactUri"))
+
+    scenario.h2("Off-chain view computes the lazy metadata")
+    lazy_info = contract.token_metadata(0).token_info
+    scenario.verify(lazy_info.contains("artifactUri"))
+    scenario.verify(lazy_info["symbol"] == sp.bytes("0x42544C4452"))
+    scenario.verify(lazy_info["name"] == contract.data.token_metadata[1].token_info["name"])
+
+    scenario.h2("Lazy metadata is the lambda output for the token's seed")
+    token_extra = contract.data.token_extra[0]
+    generator = contract.data.generators[1]
+    expected_info = scenario.compute(contract.data.bootloaders[1].fun(sp.record(
+        fragments=fragments,
+        token_id=0,
+        seed=bytes_utils.from_nat(bytes_utils.to_nat(token_extra.seed.unwrap_some())),
+        iteration_number=token_extra.iteration_number,
+        generator_name=generator.name,
+        generator_author_bytes=generator.author_bytes,
+        generator_version=generator.version,
+        generator_code=generator.code,
+        libraries=[]
+    )))
+    scenario.verify(lazy_info["artifactUri"] == expected_info["artifactUri"])
+    scenario.verify_equal(lazy_info, expected_info)
+
+    scenario.h2("Off-chain view returns stored metadata for eager tokens")
+    scenario.verify_equal(contract.token_metadata(1).token_info, contract.data.token_metadata[1].token_info)
+
+    scenario.h2("Thumbnail overrides are merged into lazy metadata")
+    contract.update_thumbnail(token_id=0, thumbnailUri=sp.bytes("0x697066733a2f2f"), _sender=alice)
+    scenario.verify(contract.token_metadata(0).token_info["thumbnailUri"] == sp.bytes("0x697066733a2f2f"))
+    scenario.verify(contract.token_metadata(0).token_info.contains("artifactUri"))
+
+    scenario.h2("Code of a lazy generator is frozen once it has minted")
+    new_code = sp.bytes("0x636f6e736f6c652e6c6f67282256322054657374")
+    contract.update_generator_fields(
+        generator_id=1,
+        name=None,
+        description=None,
+        code=sp.Some(new_code),
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=alice,
+        _valid=False,
+        _exception="LAZY_TOKENS_MINTED"
+    )
+    contract.patch_generator_code(
+        generator_id=1,
+        patches=[sp.record(offset=0, delete_len=0, insert=sp.bytes("0x2f2f"))],
+        _sender=alice,
+        _valid=False,
+        _exception="LAZY_TOKENS_MINTED"
+    )
+    contract.set_generator_libraries(generator_id=1, library_hashes=[], _sender=alice, _valid=False, _exception="LAZY_TOKENS_MINTED")
+    contract.update_generator(
+        generator_id=1,
+        name=sp.bytes("0x4c617a79"),
+        description=sp.bytes("0x54657374"),
+        code=new_code,
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        _sender=alice,
+        _valid=False,
+        _exception="LAZY_TOKENS_MINTED"
+    )
+
+    scenario.h2("Other fields of a lazy generator can still be updated")
+    contract.update_generator(
+        generator_id=1,
+        name=sp.bytes("0x4c617a792032"),
+        description=sp.bytes("0x54657374"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[1].code == sp.bytes("0x636f6e736f6c652e6c6f67282254657374"))
+
+    scenario.h2("Eager generators keep updatable code")
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=None,
+        code=sp.Some(new_code),
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].code == new_code)
+
+@sp.add_test()
+def test_v0_0_2_matches_v0_0_1():
+    """
+    Tests the v0.0.2 lambda, which walks the fragments list once:
+    - Produces exactly the same token_info as v0.0.1
+    - Fails when fewer than four fragments are configured
+    """
+    scenario = sp.test_scenario("v0.0.2 Lambda", benchmarks)
+
+    contract = benchmarks.LambdaBenchmark()
+    scenario += contract
+
+    params = sp.record(
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+            sp.bytes("0x3c2f673e")
+        ],
+        token_id=42,
+        seed=sp.bytes("0x" + "31323334353637383930" * 7),
+        iteration_number=7,
+        generator_name=sp.bytes("0x4c616d626461"),
+        generator_author_bytes=sp.bytes("0x416c696365"),
+        generator_version=3,
+        generator_code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        libraries=[]
+    )
+
+    scenario.h2("Both versions render the same metadata")
+    contract.render_v0_0_1(params)
+    v0_0_1_info = scenario.compute(contract.data.token_info)
+    contract.render_v0_0_2(params)
+    scenario.verify_equal(contract.data.token_info, v0_0_1_info)
+
+    scenario.h2("v0.0.2 requires four fragments")
+    contract.render_v0_0_2(
+        sp.record(
+            fragments=[sp.bytes("0x3c2f7376673e")],
+            token_id=42,
+            seed=sp.bytes("0x30"),
+            iteration_number=7,
+            generator_name=sp.bytes("0x4c616d626461"),
+            generator_author_bytes=sp.bytes("0x416c696365"),
+            generator_version=3,
+            generator_code=sp.bytes("0x"),
+            libraries=[]
+        ),
+        _valid=False
+    )
@@ -0,0 +1,73 @@
+"""
+Bytes Utils Tests
+
+This module checks the bytes_utils conversions against their previous
+implementations and plain Python:
+- to_nat matches the legacy bitwise implementation on 1, 8 and 32 byte inputs
+- from_nat matches Python's str() over random inputs up to 256 bits
+"""
+
+from benchmarks import benchmarks
+import smartpy as sp
+import os
+import random
+
+def legacy_to_nat(raw):
+    """the legacy to_nat reads the bits of each byte least-significant first"""
+    return int.from_bytes(bytes(int(f"{byte:08b}"[::-1], 2) for byte in raw), "big")
+
+@sp.add_test()
+def test_to_nat_matches_legacy():
+    """
+    Tests the table-based to_nat conversion:
+    - Same result as the legacy bitwise loop
+    - Same result as Python's int.from_bytes with the bits of each byte reversed
+    """
+    scenario = sp.test_scenario("to_nat Benchmark", benchmarks)
+
+    contract = benchmarks.BytesUtilsBenchmark()
+    scenario += contract
+
+    for n_bytes in [1, 8, 32]:
+        raw = os.urandom(n_bytes)
+        expected = legacy_to_nat(raw)
+
+        scenario.h2("%d byte input" % n_bytes)
+        contract.to_nat_legacy(sp.bytes("0x" + raw.hex()))
+        scenario.verify(contract.data.nat_out == expected)
+        contract.to_nat(sp.bytes("0x" + raw.hex()))
+        scenario.verify(contract.data.nat_out == expected)
+
+    scenario.h2("Leading zero bytes and empty input")
+    contract.to_nat(sp.bytes("0x000001"))
+    scenario.verify(contract.data.nat_out == 128)
+    contract.to_nat(sp.bytes("0x0180"))
+    scenario.verify(contract.data.nat_out == 0x8001)
+    contract.to_nat(sp.bytes("0x"))
+    scenario.verify(contract.data.nat_out == 0)
+
+@sp.add_test()
+def test_from_nat_matches_python():
+    """
+    Tests the chunked from_nat encoder:
+    - Group boundaries (9999, 10000, 10007) and zero
+    - Random inputs up to 256 bits match str(n) and the legacy encoder
+    """
+    scenario = sp.test_scenario("from_nat Reference", benchmarks)
+
+    contract = benchmarks.BytesUtilsBenchmark()
+    scenario += contract
+
+    rng = random.Random(1337)
+    inputs = [0, 1, 9, 10, 99, 1000, 9999, 10000, 10007, 100000000]
+    inputs += [rng.getrandbits(bits) for bits in [8, 16, 32, 64, 128, 256] for _ in range(4)]
+
+    for n in inputs:
+        expected = sp.bytes("0x" + str(n).encode().hex())
+        contract.from_nat(n)
+        scenario.verify(contract.data.bytes_out == expected)
+
+    scenario.h2("Legacy encoder agrees on a 256-bit seed")
+    seed = int.from_bytes(os.urandom(32), "big")
+    contract.from_nat_legacy(seed)
+    scenario.verify(contract.data.bytes_out == sp.bytes("0x" + str(seed).encode().hex()))
@@ -43,7 +43,7 @@ def test_utils():
             self.data = ()
         
         @sp.entrypoint
-        def request_entropy(self, token_id, entropy):
+        def request_entropy(self, token_id: sp.nat, entropy: sp.bytes):
             # This contract doesn't call back, simulating a broken RNG
             pass
 
@@ -706,3 +706,728 @@ def test_entropy_callback_security():
 
     scenario.h2("Token has entropy set by legitimate RNG")
     scenario.verify(contract.data.token_extra[0].seed.is_some())
+
+@sp.add_test()
+def test_deferred_render_mode():
+    """
+    Tests the deferred render mode:
+    - Only admin can set the render mode of a bootloader
+    - The render mode cannot change once a generator uses the bootloader
+    - Minting stores an empty token_info placeholder instead of an artifact
+    - get_token_preview and the token_metadata view render the pending token with the empty seed
+    - set_entropy renders the artifact once with the real seed
+    """
+    scenario = sp.test_scenario("Deferred Render Mode", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    bad_rng = test_utils.BadRngContract()
+    scenario += bad_rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=bad_rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger=sp.map({}),
+        token_metadata=[]
+    )
+    scenario += contract
+
+    test_fragments = [
+        sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+        sp.bytes("0x3c2f7376673e"),
+        sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+        sp.bytes("0x3c2f673e")
+    ]
+
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=test_fragments,
+        fun=bootloader.v0_0_1,
+        storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+        _sender=admin
+    )
+
+    scenario.h2("Only admin can set render mode")
+    contract.set_bootloader_render_mode(
+        bootloader_id=0,
+        render_mode=1,
+        _sender=alice,
+        _valid=False,
+        _exception="ONLY_ADMIN"
+    )
+    contract.set_bootloader_render_mode(
+        bootloader_id=0,
+        render_mode=7,
+        _sender=admin,
+        _valid=False,
+        _exception="INVALID_RENDER_MODE"
+    )
+    contract.set_bootloader_render_mode(bootloader_id=0, render_mode=1, _sender=admin)
+
+    contract.create_generator(
+        name=sp.bytes("0x446566657272656420417274"),
+        description=sp.bytes("0x54657374"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    scenario.h2("Render mode is fixed once a generator uses the bootloader")
+    contract.set_bootloader_render_mode(
+        bootloader_id=0,
+        render_mode=0,
+        _sender=admin,
+        _valid=False,
+        _exception="BOOTLOADER_IN_USE"
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=5,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    scenario.h2("Mint only stores a placeholder")
+    contract.mint(
+        generator_id=0, 
+        entropy=sp.bytes("0x" + "ab" * 16),
+        _sender=bob,
+        _amount=sp.mutez(0)
+    )
+    scenario.verify(contract.data.token_extra[0].seed.is_none())
+    scenario.verify(sp.len(contract.data.token_metadata[0].token_info) == 0)
+
+    scenario.h2("Pending token can still be previewed")
+    preview = contract.get_token_preview(0)
+    scenario.verify(preview.contains("artifactUri"))
+    scenario.verify(preview["name"] == sp.bytes("0x446566657272656420417274") + sp.bytes("0x202331"))
+    scenario.verify_equal(contract.token_metadata(0).token_info, preview)
+
+    scenario.h2("Artifact is rendered when the seed arrives")
+    contract.set_entropy(
+        sp.record(token_id=0, entropy=sp.bytes("0x" + "01" * 32)),
+        _sender=bad_rng.address
+    )
+    scenario.verify(contract.data.token_extra[0].seed.is_some())
+    scenario.verify(contract.data.token_metadata[0].token_info["artifactUri"] == contract.get_token_preview(0)["artifactUri"])
+    scenario.verify_equal(contract.token_metadata(0).token_info, contract.data.token_metadata[0].token_info)
+
+@sp.add_test()
+def test_set_entropy_batch():
+    """
+    Tests revealing many tokens in one callback:
+    - Only designated RNG contract can call set_entropy_batch
+    - Tokens of several generators can be revealed in the same batch
+    - The result matches revealing each token with set_entropy
+    - Cannot reveal a token twice with set_entropy
+    - A late second reveal in a batch is ignored
+    """
+    scenario = sp.test_scenario("Set Entropy Batch", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+    attacker = sp.test_account("Attacker")
+
+    # the RNG never calls back on its own, reveals are sent manually
+    bad_rng = test_utils.BadRngContract()
+    scenario += bad_rng
+
+    test_fragments = [
+        sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+        sp.bytes("0x3c2f7376673e"),
+        sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+        sp.bytes("0x3c2f673e")
+    ]
+
+    contracts = []
+    for _ in range(2):
+        contract = bootloader.Bootloader(
+            admin_address=admin.address,
+            rng_contract=bad_rng.address,
+            contract_metadata=sp.big_map({}),
+            ledger=sp.map({}),
+            token_metadata=[]
+        )
+        scenario += contract
+
+        contract.add_bootloader(
+            version=sp.bytes("0x76302e302e31"),
+            fragments=test_fragments,
+            fun=bootloader.v0_0_1,
+            storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+            _sender=admin
+        )
+
+        for generator_id in range(2):
+            contract.create_generator(
+                name=sp.bytes("0x42617463682054657374"),
+                description=sp.bytes("0x54657374696e672062617463682072657665616c73"),
+                code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+                author_bytes=sp.bytes("0x416c696365"),
+                reserved_editions=0,
+                bootloader_id=0,
+                _sender=alice
+            )
+            contract.set_sale(
+                generator_id=generator_id,
+                start_time=None,
+                price=sp.mutez(0),
+                paused=False,
+                editions=5,
+                max_per_wallet=None,
+                _sender=alice
+            )
+
+        # tokens 0 and 2 belong to generator 0, token 1 to generator 1
+        for generator_id in [0, 1, 0]:
+            contract.mint(
+                generator_id=generator_id,
+                entropy=sp.bytes("0x" + "ee" * 16),
+                _sender=bob,
+                _amount=sp.mutez(0)
+            )
+        contracts.append(contract)
+
+    (single, batched) = contracts
+    entries = [
+        sp.record(token_id=token_id, entropy=sp.bytes("0x" + ("%02x" % (token_id + 1)) * 32))
+        for token_id in range(3)
+    ]
+
+    scenario.h2("Attacker cannot reveal a batch")
+    batched.set_entropy_batch(
+        entries,
+        _sender=attacker,
+        _valid=False,
+        _exception="INVALID_RNG_CONTRACT"
+    )
+
+    scenario.h2("Batch reveal matches individual reveals")
+    for entry in entries:
+        single.set_entropy(entry, _sender=bad_rng.address)
+    batched.set_entropy_batch(entries, _sender=bad_rng.address)
+
+    for token_id in range(3):
+        scenario.verify(batched.data.token_extra[token_id].seed.is_some())
+        scenario.verify(batched.data.token_extra[token_id].seed == single.data.token_extra[token_id].seed)
+        scenario.verify_equal(
+            batched.data.token_metadata[token_id].token_info,
+            single.data.token_metadata[token_id].token_info
+        )
+
+    scenario.h2("Cannot reveal a token twice")
+    batched.set_entropy(
+        entries[0],
+        _sender=bad_rng.address,
+        _valid=False,
+        _exception="SEED_SET"
+    )
+
+    scenario.h2("A late second reveal in a batch is ignored")
+    batched.set_entropy_batch(
+        [sp.record(token_id=0, entropy=sp.bytes("0x" + "ff" * 32))],
+        _sender=bad_rng.address
+    )
+    scenario.verify(batched.data.token_extra[0].seed == single.data.token_extra[0].seed)
+
+@sp.add_test()
+def test_async_randomiser():
+    """
+    Tests the async commit-reveal mode of the centralised randomiser:
+    - Requests are queued instead of revealed right away
+    - Requests from the current block are not revealed
+    - A later default call reveals the queue in one set_entropy_batch callback
+    - reveal_batch_size caps the number of tokens revealed per call
+    - Only allowed requesters can queue requests
+    - The administrator can resize batches and drop stuck requests
+    - Requests of a removed requester are dropped instead of stalling the queue
+    - The bootloader caps batch counts when configured for async reveals
+    - Owners and moderators can request entropy again for dropped tokens
+    """
+    scenario = sp.test_scenario("Async Randomiser", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+    keeper = sp.test_account("Keeper")
+
+    rng = randomiser.CentralisedRandomiser()
+    rng.data.administrator = admin.address
+    rng.data.testnet_mode = True
+    rng.data.async_mode = True
+    rng.data.reveal_batch_size = 3
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger=sp.map({}),
+        token_metadata=[]
+    )
+    scenario += contract
+
+    scenario.h2("Only allowed requesters can queue requests")
+    rng.request_entropy(
+        token_id=0,
+        entropy=sp.bytes("0x00"),
+        _sender=bob,
+        _valid=False,
+        _exception="UNKNOWN_REQUESTER"
+    )
+    rng.add_requester(contract.address, _sender=bob, _valid=False, _exception="ONLY_ADMIN")
+    rng.add_requester(contract.address, _sender=admin)
+
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+            sp.bytes("0x3c2f673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x4173796e632054657374"),
+        description=sp.bytes("0x54657374696e67206173796e632072657665616c73"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=20,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    scenario.h2("Mints only queue their entropy request")
+    for _ in range(4):
+        contract.mint(
+            generator_id=0,
+            entropy=sp.bytes("0x" + os.urandom(16).hex()),
+            _sender=bob,
+            _amount=sp.mutez(0),
+            _level=10
+        )
+    scenario.verify(rng.data.next_request_id == 4)
+    scenario.verify(contract.data.token_extra[0].seed.is_none())
+
+    scenario.h2("Requests from the current block are not revealed")
+    rng.default(_sender=keeper, _level=10)
+    scenario.verify(rng.data.next_reveal_id == 0)
+    scenario.verify(contract.data.token_extra[0].seed.is_none())
+
+    scenario.h2("A later block reveals up to reveal_batch_size requests")
+    rng.default(_sender=keeper, _level=11)
+    scenario.verify(rng.data.next_reveal_id == 3)
+    scenario.verify(~rng.data.requests.contains(0))
+    for token_id in range(3):
+        scenario.verify(contract.data.token_extra[token_id].seed.is_some())
+    scenario.verify(contract.data.token_extra[3].seed.is_none())
+
+    scenario.h2("The next call reveals the rest of the queue")
+    rng.default(_sender=keeper, _level=12)
+    scenario.verify(rng.data.next_reveal_id == 4)
+    scenario.verify(contract.data.token_extra[3].seed.is_some())
+
+    scenario.h2("Calls with an empty queue only refresh the hash")
+    rng.default(_sender=keeper, _level=13)
+    scenario.verify(rng.data.next_reveal_id == 4)
+
+    scenario.h2("Only the administrator can resize reveal batches")
+    rng.set_reveal_batch_size(10, _sender=keeper, _valid=False, _exception="ONLY_ADMIN")
+    rng.set_reveal_batch_size(0, _sender=admin, _valid=False, _exception="INVALID_BATCH_SIZE")
+    rng.set_reveal_batch_size(10, _sender=admin)
+    scenario.verify(rng.data.reveal_batch_size == 10)
+
+    scenario.h2("A dropped request is skipped, the rest of the queue is revealed")
+    for _ in range(2):
+        contract.mint(
+            generator_id=0,
+            entropy=sp.bytes("0x" + os.urandom(16).hex()),
+            _sender=bob,
+            _amount=sp.mutez(0),
+            _level=14
+        )
+    rng.drop_request(4, _sender=keeper, _valid=False, _exception="ONLY_ADMIN")
+    rng.drop_request(4, _sender=admin)
+    rng.drop_request(4, _sender=admin, _valid=False, _exception="UNKNOWN_REQUEST")
+    rng.default(_sender=keeper, _level=15)
+    scenario.verify(rng.data.next_reveal_id == 6)
+    scenario.verify(contract.data.token_extra[4].seed.is_none())
+    scenario.verify(contract.data.token_extra[5].seed.is_some())
+
+    scenario.h2("Requests of a removed requester are dropped")
+    contract.mint(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(0),
+        _level=16
+    )
+    rng.remove_requester(contract.address, _sender=admin)
+    rng.default(_sender=keeper, _level=17)
+    scenario.verify(rng.data.next_reveal_id == 7)
+    scenario.verify(~rng.data.requests.contains(6))
+    scenario.verify(contract.data.token_extra[6].seed.is_none())
+
+    scenario.h2("Batch counts can be capped for async reveals")
+    contract.set_max_batch_count(sp.Some(2), _sender=bob, _valid=False, _exception="ONLY_MODS")
+    contract.set_max_batch_count(sp.Some(2), _sender=admin)
+    contract.mint_batch(
+        generator_id=0,
+        count=3,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(0),
+        _level=18,
+        _valid=False,
+        _exception="BATCH_TOO_LARGE"
+    )
+
+    scenario.h2("Reveals are budgeted in tokens, not requests")
+    rng.add_requester(contract.address, _sender=admin)
+    rng.set_reveal_batch_size(3, _sender=admin)
+    # tokens 7-8, 9 and 10-11
+    for count in [2, 1, 2]:
+        contract.mint_batch(
+            generator_id=0,
+            count=count,
+            entropy=sp.bytes("0x" + os.urandom(16).hex()),
+            _sender=bob,
+            _amount=sp.mutez(0),
+            _level=18
+        )
+    scenario.verify(rng.data.requests[7].tokens == 2)
+    scenario.verify(rng.data.requests[8].tokens == 1)
+    rng.default(_sender=keeper, _level=19)
+    scenario.verify(rng.data.next_reveal_id == 9)
+    for token_id in range(7, 10):
+        scenario.verify(contract.data.token_extra[token_id].seed.is_some())
+    scenario.verify(contract.data.token_extra[10].seed.is_none())
+
+    scenario.h2("A request larger than the budget is revealed on its own")
+    rng.set_reveal_batch_size(1, _sender=admin)
+    rng.default(_sender=keeper, _level=20)
+    scenario.verify(rng.data.next_reveal_id == 10)
+    scenario.verify(contract.data.token_extra[11].seed.is_some())
+
+    scenario.h2("Dropped tokens can request entropy again")
+    rng.set_reveal_batch_size(10, _sender=admin)
+    # tokens 12-13, left pending
+    contract.mint_batch(
+        generator_id=0,
+        count=2,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(0),
+        _level=21
+    )
+    contract.request_entropy_again(token_id=4, entropy=sp.bytes("0x01"), _sender=alice, _level=21, _valid=False, _exception="ONLY_OWNER_OR_MODS")
+    contract.request_entropy_again(token_id=5, entropy=sp.bytes("0x01"), _sender=bob, _level=21, _valid=False, _exception="SEED_SET")
+    contract.request_entropy_again(token_id=13, entropy=sp.bytes("0x01"), _sender=bob, _level=21, _valid=False, _exception="NOT_FIRST_TOKEN")
+    contract.request_entropy_again(token_id=4, entropy=sp.bytes("0x01"), _sender=bob, _level=21)
+    contract.request_entropy_again(token_id=6, entropy=sp.bytes("0x02"), _sender=admin, _level=21)
+    rng.default(_sender=keeper, _level=22)
+    for token_id in [4, 6, 12, 13]:
+        scenario.verify(contract.data.token_extra[token_id].seed.is_some())
+    scenario.verify(rng.data.next_reveal_id == rng.data.next_request_id)
+
+@sp.add_test()
+def test_pooled_randomiser():
+    """
+    Tests the pool mode of the centralised randomiser:
+    - Mints are revealed instantly from the stored pool
+    - Anyone can refresh the pool through the default entrypoint
+    - Refreshing the pool changes the entropy of later mints
+    """
+    scenario = sp.test_scenario("Pooled Randomiser", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+    keeper = sp.test_account("Keeper")
+
+    rng = randomiser.CentralisedRandomiser()
+    rng.data.testnet_mode = True
+    rng.data.pool_mode = True
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger=sp.map({}),
+        token_metadata=[]
+    )
+    scenario += contract
+
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+            sp.bytes("0x3c2f673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x506f6f6c2054657374"),
+        description=sp.bytes("0x54657374696e6720706f6f6c65642072657665616c73"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=10,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    scenario.h2("Mints are revealed instantly from the pool")
+    pool = scenario.compute(rng.data.b)
+    entropy = sp.bytes("0x" + "ee" * 16)
+    contract.mint(generator_id=0, entropy=entropy, _sender=bob, _amount=sp.mutez(0), _level=10)
+    scenario.verify(rng.data.b == pool)
+    scenario.verify(contract.data.token_extra[0].seed == sp.Some(sp.sha256(pool + entropy + sp.pack(sp.nat(0)) + sp.pack(sp.nat(10)))))
+
+    scenario.h2("Anyone can refresh the pool")
+    rng.default(_sender=keeper, _level=11)
+    scenario.verify(rng.data.b != pool)
+
+    scenario.h2("Later mints use the refreshed pool")
+    refreshed = scenario.compute(rng.data.b)
+    contract.mint(generator_id=0, entropy=entropy, _sender=bob, _amount=sp.mutez(0), _level=11)
+    scenario.verify(contract.data.token_extra[1].seed == sp.Some(sp.sha256(refreshed + entropy + sp.pack(sp.nat(1)) + sp.pack(sp.nat(11)))))
+
+@sp.add_test()
+def test_batch_regeneration():
+    """
+    Tests regenerating many tokens in one operation:
+    - Tokens of several generators can be regenerated together
+    - The result matches regenerating each token with regenerate_token
+    - The decimal seed is cached in token_extra
+    - Ownership is checked for every token
+    """
+    scenario = sp.test_scenario("Batch Regeneration", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    mock_rng = test_utils.MockRngContract()
+    scenario += mock_rng
+
+    test_fragments = [
+        sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+        sp.bytes("0x3c2f7376673e"),
+        sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+        sp.bytes("0x3c2f673e")
+    ]
+
+    contracts = []
+    for _ in range(2):
+        contract = bootloader.Bootloader(
+            admin_address=admin.address,
+            rng_contract=mock_rng.address,
+            contract_metadata=sp.big_map({}),
+            ledger=sp.map({}),
+            token_metadata=[]
+        )
+        scenario += contract
+
+        contract.add_bootloader(
+            version=sp.bytes("0x76302e302e31"),
+            fragments=test_fragments,
+            fun=bootloader.v0_0_1,
+            storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+            _sender=admin
+        )
+
+        for generator_id in range(2):
+            contract.create_generator(
+                name=sp.bytes("0x526567656e20546573742047656e"),
+                description=sp.bytes("0x54657374696e6720746f6b656e20726567656e65726174696f6e"),
+                code=sp.bytes("0x636f6e736f6c652e6c6f67282256312054657374"),
+                author_bytes=sp.bytes("0x416c696365"),
+                reserved_editions=0,
+                bootloader_id=0,
+                _sender=alice
+            )
+            contract.set_sale(
+                generator_id=generator_id,
+                start_time=None,
+                price=sp.mutez(0),
+                paused=False,
+                editions=5,
+                max_per_wallet=None,
+                _sender=alice
+            )
+
+        # tokens 0 and 2 belong to generator 0, token 1 to generator 1, token 3 is alice's
+        for (generator_id, owner) in [(0, bob), (1, bob), (0, bob), (1, alice)]:
+            contract.mint(
+                generator_id=generator_id,
+                entropy=sp.bytes("0x" + "aa" * 16),
+                _sender=owner,
+                _amount=sp.mutez(0)
+            )
+
+        for generator_id in range(2):
+            contract.update_generator_fields(
+                generator_id=generator_id,
+                name=None,
+                description=None,
+                code=sp.Some(sp.bytes("0x636f6e736f6c652e6c6f67282256322054657374")),
+                author_bytes=None,
+                reserved_editions=None,
+                _sender=alice
+            )
+        contracts.append(contract)
+
+    (single, batched) = contracts
+
+    scenario.h2("Ownership is checked for every token")
+    batched.regenerate_tokens([0, 3], _sender=bob, _valid=False, _exception="ONLY_OWNER")
+
+    scenario.h2("Batch regeneration matches individual regenerations")
+    for token_id in range(3):
+        single.regenerate_token(token_id, _sender=bob)
+    batched.regenerate_tokens([0, 1, 2], _sender=bob)
+
+    for token_id in range(3):
+        scenario.verify(batched.data.token_extra[token_id].generator_version == 2)
+        scenario.verify(batched.data.token_extra[token_id].decimal_seed.is_some())
+        scenario.verify(batched.data.token_extra[token_id].decimal_seed == single.data.token_extra[token_id].decimal_seed)
+        scenario.verify_equal(
+            batched.data.token_metadata[token_id].token_info,
+            single.data.token_metadata[token_id].token_info
+        )
+
+    scenario.h2("Tokens cannot be regenerated twice for the same version")
+    batched.regenerate_tokens([1], _sender=bob, _valid=False, _exception="NO_UPDATE_POSSIBLE")
+
+@sp.add_test()
+def test_decimal_seed_cache():
+    """
+    Tests the decimal seed stored in token_extra:
+    - Revealed tokens store their decimal seed next to the raw entropy
+    - Lazy tokens are revealed without it and can be migrated
+    - The migration skips tokens without entropy
+    - The migration skips burnt tokens
+    """
+    scenario = sp.test_scenario("Decimal Seed Cache", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    bad_rng = test_utils.BadRngContract()
+    scenario += bad_rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=bad_rng.address,
+        contract_metadata=sp.big_map({}),
+        ledger=sp.map({}),
+        token_metadata=[]
+    )
+    scenario += contract
+
+    test_fragments = [
+        sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+        sp.bytes("0x3c2f7376673e"),
+        sp.bytes("0x3c67207374796c653d2266696c6c3a7265643b223e"),
+        sp.bytes("0x3c2f673e")
+    ]
+    for _ in range(2):
+        contract.add_bootloader(
+            version=sp.bytes("0x76302e302e31"),
+            fragments=test_fragments,
+            fun=bootloader.v0_0_1,
+            storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+            _sender=admin
+        )
+    contract.set_bootloader_render_mode(bootloader_id=1, render_mode=2, _sender=admin)
+
+    for bootloader_id in range(2):
+        contract.create_generator(
+            name=sp.bytes("0x5365656420546573742047656e"),
+            description=sp.bytes("0x54657374696e6720646563696d616c207365656473"),
+            code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+            author_bytes=sp.bytes("0x416c696365"),
+            reserved_editions=0,
+            bootloader_id=bootloader_id,
+            _sender=alice
+        )
+        contract.set_sale(
+            generator_id=bootloader_id,
+            start_time=None,
+            price=sp.mutez(0),
+            paused=False,
+            editions=5,
+            max_per_wallet=None,
+            _sender=alice
+        )
+
+    # token 0 is eager, tokens 1 and 2 are lazy
+    for generator_id in [0, 1, 1]:
+        contract.mint(
+            generator_id=generator_id,
+            entropy=sp.bytes("0x" + "aa" * 16),
+            _sender=bob,
+            _amount=sp.mutez(0)
+        )
+
+    # 0x0100 big-endian is 256
+    entropy = sp.bytes("0x" + "00" * 30 + "0100")
+
+    scenario.h2("Rendered tokens store their decimal seed on reveal")
+    contract.set_entropy(sp.record(token_id=0, entropy=entropy), _sender=bad_rng.address)
+    scenario.verify(contract.data.token_extra[0].decimal_seed == sp.Some(sp.bytes("0x" + b'256'.hex())))
+
+    scenario.h2("Lazy tokens are revealed without conversion")
+    contract.set_entropy(sp.record(token_id=1, entropy=entropy), _sender=bad_rng.address)
+    scenario.verify(contract.data.token_extra[1].decimal_seed.is_none())
+
+    scenario.h2("Migration fills in revealed tokens and skips pending ones")
+    contract.cache_decimal_seeds([0, 1, 2], _sender=alice)
+    scenario.verify(contract.data.token_extra[1].decimal_seed == sp.Some(sp.bytes("0x" + b'256'.hex())))
+    scenario.verify(contract.data.token_extra[2].decimal_seed.is_none())
+
+    scenario.h2("Migration skips burnt tokens")
+    contract.burn([sp.record(from_=bob.address, token_id=0, amount=1)], _sender=bob)
+    contract.cache_decimal_seeds([0, 1, 2], _sender=alice)
+    scenario.verify(~contract.data.token_extra.contains(0))
@@ -360,8 +360,8 @@ def test_state_consistency():
     )
     
     scenario.verify(contract.data.next_generator_id == 1)
-    scenario.verify(contract.data.generators[0].n_tokens == 0)
-    scenario.verify(contract.data.generators[0].reserved_editions == 3)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 0)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 3)
 
     scenario.h2("Second generator creation")
     contract.create_generator(
@@ -375,8 +375,8 @@ def test_state_consistency():
     )
     
     scenario.verify(contract.data.next_generator_id == 2)
-    scenario.verify(contract.data.generators[1].n_tokens == 0)
-    scenario.verify(contract.data.generators[1].reserved_editions == 2)
+    scenario.verify(contract.data.generator_state[1].n_tokens == 0)
+    scenario.verify(contract.data.generator_state[1].reserved_editions == 2)
 
     # Set sales for both generators
     contract.set_sale(
@@ -408,8 +408,8 @@ def test_state_consistency():
     )
     
     scenario.verify(contract.data.next_token_id == 1)
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
-    scenario.verify(contract.data.generators[1].n_tokens == 0)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[1].n_tokens == 0)
 
     contract.mint(
         generator_id=1, 
@@ -419,8 +419,8 @@ def test_state_consistency():
     )
     
     scenario.verify(contract.data.next_token_id == 2)
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
-    scenario.verify(contract.data.generators[1].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[1].n_tokens == 1)
 
     scenario.h2("Airdrop updates reserved editions correctly")
     contract.airdrop(
@@ -430,10 +430,10 @@ def test_state_consistency():
         _sender=alice
     )
     
-    scenario.verify(contract.data.generators[0].reserved_editions == 2)
-    scenario.verify(contract.data.generators[1].reserved_editions == 2)
-    scenario.verify(contract.data.generators[0].n_tokens == 2)
-    scenario.verify(contract.data.generators[1].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 2)
+    scenario.verify(contract.data.generator_state[1].reserved_editions == 2)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 2)
+    scenario.verify(contract.data.generator_state[1].n_tokens == 1)
 
 @sp.add_test()
 def test_complex_scenarios():
@@ -545,10 +545,10 @@ def test_complex_scenarios():
     )
 
     scenario.h2("Verify state consistency across generators")
-    scenario.verify(contract.data.generators[0].n_tokens == 2)
-    scenario.verify(contract.data.generators[0].reserved_editions == 1)
-    scenario.verify(contract.data.generators[1].n_tokens == 1)
-    scenario.verify(contract.data.generators[1].reserved_editions == 0)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 2)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 1)
+    scenario.verify(contract.data.generator_state[1].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[1].reserved_editions == 0)
     scenario.verify(contract.data.next_token_id == 3)
 
     scenario.h2("Update generator during active sale")
@@ -563,7 +563,7 @@ def test_complex_scenarios():
     )
 
     scenario.verify(contract.data.generators[0].version == 2)
-    scenario.verify(contract.data.generators[0].reserved_editions == 1)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 1)
 
     scenario.h2("Continue operations after update")
     # Mint more from updated generator
@@ -575,7 +575,7 @@ def test_complex_scenarios():
     )
 
     # Should reach public limit (5 total - 1 reserved - 3 already minted = 1 remaining)
-    scenario.verify(contract.data.generators[0].n_tokens == 3)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 3)
 
     contract.mint(
         generator_id=0, 
@@ -602,5 +602,5 @@ def test_complex_scenarios():
         _sender=alice
     )
 
-    scenario.verify(contract.data.generators[0].n_tokens == 5)
-    scenario.verify(contract.data.generators[0].reserved_editions == 0)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 5)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 0)
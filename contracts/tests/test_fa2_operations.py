@@ -15,6 +15,18 @@ from randomiser import randomiser
 import smartpy as sp
 import os
 
+@sp.module
+def test_utils():
+    class PendingRngContract(sp.Contract):
+        def __init__(self):
+            self.data = ()
+
+        @sp.entrypoint
+        def request_entropy(self, token_id, entropy):
+            # never calls back, the test reveals tokens itself
+            sp.cast(token_id, sp.nat)
+            sp.cast(entropy, sp.bytes)
+
 @sp.add_test()
 def test_token_transfers():
     """
@@ -187,6 +199,124 @@ def test_token_burning():
     scenario.verify(~contract.data.ledger.contains(0))
     scenario.verify(contract.data.ledger[1] == charlie.address)
 
+@sp.add_test()
+def test_burn_reclaims_storage():
+    """
+    Tests that burning frees the token's storage:
+    - Burning a revealed token deletes its ledger, token_metadata and token_extra entries
+    - Operators can burn on behalf of the owner
+    - A token burnt before its reveal keeps token_extra until set_entropy, which drops it
+    - The other tokens of a batch are still revealed
+    - Generator counters are unchanged, iteration numbers are never reused
+    """
+    scenario = sp.test_scenario("Burn Reclaims Storage", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+    charlie = sp.test_account("Charlie")
+
+    rng = test_utils.PendingRngContract()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address,
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    fragments = []
+    for i in range(4):
+        fragments.append(sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"))
+
+    contract.add_bootloader(
+        version=sp.bytes("0x302e302e32"),  # "0.0.2"
+        fragments=fragments,
+        fun=bootloader.v0_0_2,
+        storage_limits=sp.record(code=1000, name=1000, desc=1000, author=1000),
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x4275726e205465737420417274"),
+        description=sp.bytes("0x54657374696e67206275726e696e67"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=10,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    # token 0 on its own, tokens 1 to 3 as a batch sharing the entropy of token 1
+    contract.mint(generator_id=0, entropy=sp.bytes("0x" + os.urandom(16).hex()), _sender=bob)
+    contract.mint_batch(generator_id=0, count=3, entropy=sp.bytes("0x" + os.urandom(16).hex()), _sender=bob)
+    contract.set_entropy(token_id=0, entropy=sp.sha256(sp.bytes("0x00")), _sender=rng.address)
+
+    scenario.h2("Burning a revealed token frees its entries")
+    scenario.verify(contract.data.token_extra.contains(0))
+    contract.burn([sp.record(from_=bob.address, token_id=0, amount=1)], _sender=bob)
+    scenario.verify(~contract.data.ledger.contains(0))
+    scenario.verify(~contract.data.token_metadata.contains(0))
+    scenario.verify(~contract.data.token_extra.contains(0))
+
+    scenario.h2("Cannot burn a burnt token")
+    contract.burn(
+        [sp.record(from_=bob.address, token_id=0, amount=1)],
+        _sender=bob,
+        _valid=False,
+        _exception="FA2_TOKEN_UNDEFINED"
+    )
+
+    scenario.h2("Only the owner or an operator can burn")
+    contract.burn(
+        [sp.record(from_=bob.address, token_id=2, amount=1)],
+        _sender=charlie,
+        _valid=False,
+        _exception="FA2_NOT_OPERATOR"
+    )
+    contract.burn(
+        [sp.record(from_=charlie.address, token_id=2, amount=1)],
+        _sender=charlie,
+        _valid=False,
+        _exception="FA2_INSUFFICIENT_BALANCE"
+    )
+
+    scenario.h2("A pending token keeps token_extra until its reveal")
+    contract.update_operators(
+        [sp.variant.add_operator(sp.record(owner=bob.address, operator=charlie.address, token_id=2))],
+        _sender=bob
+    )
+    contract.burn([sp.record(from_=bob.address, token_id=2, amount=1)], _sender=charlie)
+    scenario.verify(~contract.data.ledger.contains(2))
+    scenario.verify(~contract.data.token_metadata.contains(2))
+    scenario.verify(contract.data.token_extra.contains(2))
+
+    contract.set_entropy(token_id=1, entropy=sp.sha256(sp.bytes("0x01")), _sender=rng.address)
+    scenario.verify(~contract.data.token_extra.contains(2))
+    scenario.verify(~contract.data.entropy_batches.contains(1))
+    scenario.verify(contract.data.token_extra[1].seed.is_some())
+    scenario.verify(contract.data.token_extra[3].seed.is_some())
+    scenario.verify(contract.data.token_metadata[3].token_info.contains("artifactUri"))
+
+    scenario.h2("Burning does not change the generator counters")
+    scenario.verify(contract.data.generator_state[0].n_tokens == 4)
+    scenario.verify(contract.data.generator_mints[(0, bob.address)] == 4)
+    contract.mint(generator_id=0, entropy=sp.bytes("0x" + os.urandom(16).hex()), _sender=charlie)
+    scenario.verify(contract.data.token_extra[4].iteration_number == 5)
+
 @sp.add_test()
 def test_token_regeneration():
     """
@@ -87,6 +87,7 @@ def test_basic_generator_deletion():
 
     scenario.h2("Generator is removed from storage")
     scenario.verify(~contract.data.generators.contains(0))
+    scenario.verify(~contract.data.generator_state.contains(0))
 
 @sp.add_test()
 def test_cannot_delete_generator_with_tokens():
@@ -164,7 +165,7 @@ def test_cannot_delete_generator_with_tokens():
         _amount=sp.mutez(0)
     )
 
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
 
     scenario.h2("Cannot delete generator after minting")
     contract.delete_generator(
@@ -234,7 +235,7 @@ def test_cannot_delete_generator_with_airdropped_tokens():
         _sender=alice
     )
 
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
 
     scenario.h2("Cannot delete generator after airdrop")
     contract.delete_generator(
@@ -307,7 +308,7 @@ def test_delete_generator_with_sale_configuration():
     )
 
     scenario.h2("Generator has sale configuration")
-    scenario.verify(contract.data.generators[0].sale.is_some())
+    scenario.verify(contract.data.generator_state[0].sale.is_some())
 
     scenario.h2("Can delete generator with sale config if no tokens minted")
     contract.delete_generator(
@@ -581,7 +582,7 @@ def test_delete_generator_after_failed_mint():
     )
 
     scenario.h2("n_tokens should still be 0")
-    scenario.verify(contract.data.generators[0].n_tokens == 0)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 0)
 
     scenario.h2("Can delete generator after failed mint")
     contract.delete_generator(
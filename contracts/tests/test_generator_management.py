@@ -14,6 +14,27 @@ from bootloader import bootloader
 from randomiser import randomiser
 import smartpy as sp
 import os
+import importlib.util
+
+# the deployment utils.py at the repository root, which contracts/utils.py shadows on sys.path
+_spec = importlib.util.spec_from_file_location(
+    "deploy_utils", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "utils.py")
+)
+deploy_utils = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(deploy_utils)
+compute_code_patches, apply_code_patches = deploy_utils.compute_code_patches, deploy_utils.apply_code_patches
+
+@sp.module
+def test_utils():
+    class PendingRngContract(sp.Contract):
+        def __init__(self):
+            self.data = ()
+
+        @sp.entrypoint
+        def request_entropy(self, token_id, entropy):
+            # never calls back, tokens keep their placeholder artifact
+            sp.cast(token_id, sp.nat)
+            sp.cast(entropy, sp.bytes)
 
 @sp.add_test()
 def test_generator_creation():
@@ -70,12 +91,13 @@ def test_generator_creation():
     scenario.verify(contract.data.next_generator_id == 1)
     scenario.verify(contract.data.generators.contains(0))
     generator = contract.data.generators[0]
+    state = contract.data.generator_state[0]
     scenario.verify(generator.author == alice.address)
-    scenario.verify(generator.n_tokens == 0)
-    scenario.verify(generator.sale.is_none())
+    scenario.verify(state.n_tokens == 0)
+    scenario.verify(state.sale.is_none())
     scenario.verify(generator.version == 1)
-    scenario.verify(generator.flag == 0)
-    scenario.verify(generator.reserved_editions == 0)
+    scenario.verify(state.flag == 0)
+    scenario.verify(state.reserved_editions == 0)
     scenario.verify(generator.type_id == 0)
 
     scenario.h2("Create generator with reserved editions")
@@ -90,7 +112,7 @@ def test_generator_creation():
     )
     
     scenario.verify(contract.data.next_generator_id == 2)
-    scenario.verify(contract.data.generators[1].reserved_editions == 10)
+    scenario.verify(contract.data.generator_state[1].reserved_editions == 10)
 
 @sp.add_test()
 def test_generator_updates():
@@ -445,11 +467,11 @@ def test_generator_flagging():
 
     scenario.h2("Moderator can flag generator")
     contract.flag_generator(generator_id=0, flag=1, _sender=moderator)
-    scenario.verify(contract.data.generators[0].flag == 1)
+    scenario.verify(contract.data.generator_state[0].flag == 1)
 
     scenario.h2("Admin can flag generator")
     contract.flag_generator(generator_id=0, flag=2, _sender=admin)
-    scenario.verify(contract.data.generators[0].flag == 2)
+    scenario.verify(contract.data.generator_state[0].flag == 2)
 
     scenario.h2("Non-mod cannot flag generator")
     contract.flag_generator(
@@ -510,4 +532,749 @@ def test_large_numbers_edge_case():
         _sender=alice
     )
     
-    scenario.verify(contract.data.generators[0].reserved_editions == 999999)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 999999)
+
+@sp.add_test()
+def test_generator_state_split():
+    """
+    Tests that mutable generator state lives in its own big_map:
+    - Minting only updates generator_state
+    - The generator record is left untouched by mints
+    - get_generator view returns the merged record
+    """
+    scenario = sp.test_scenario("Generator State Split", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=30000, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x53706c69742054657374"),
+        description=sp.bytes("0x54657374"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=2,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=10,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    scenario.h2("Mint only touches generator_state")
+    contract.mint(
+        generator_id=0,
+        entropy=sp.bytes("0x01"),
+        _sender=bob,
+        _amount=sp.mutez(0)
+    )
+    contract.airdrop(
+        generator_id=0,
+        recipient=bob.address,
+        entropy=sp.bytes("0x02"),
+        _sender=alice
+    )
+    scenario.verify(contract.data.generator_state[0].n_tokens == 2)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 1)
+    scenario.verify(contract.data.generators[0].version == 1)
+
+    scenario.h2("get_generator view merges record and state")
+    merged = contract.get_generator(0)
+    scenario.verify(merged.author == alice.address)
+    scenario.verify(merged.code == sp.bytes("0x636f6e736f6c652e6c6f67282254657374"))
+    scenario.verify(merged.n_tokens == 2)
+    scenario.verify(merged.reserved_editions == 1)
+    scenario.verify(merged.flag == 0)
+    scenario.verify(merged.sale.unwrap_some().editions == 10)
+
+@sp.add_test()
+def test_partial_generator_updates():
+    """
+    Tests update_generator_fields:
+    - Only the fields that are set are changed
+    - Version only increments when the code changes
+    - Storage limits and reserved editions are still validated
+    - Non-authors cannot update generators
+    """
+    scenario = sp.test_scenario("Partial Generator Updates", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=30000, name=500, desc=20, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    code = sp.bytes("0x636f6e736f6c652e6c6f67282248656c6c6f20576f726c642229")
+    contract.create_generator(
+        name=sp.bytes("0x416c69636520417274"),
+        description=sp.bytes("0x4120747970706f"),
+        code=code,
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    scenario.h2("Description can be fixed without resending the code")
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=sp.Some(sp.bytes("0x41207479706f")),
+        code=None,
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=alice
+    )
+    generator = contract.data.generators[0]
+    scenario.verify(generator.description == sp.bytes("0x41207479706f"))
+    scenario.verify(generator.name == sp.bytes("0x416c69636520417274"))
+    scenario.verify(generator.code == code)
+    scenario.verify(generator.version == 1)
+
+    scenario.h2("Version increments when the code changes")
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=None,
+        code=sp.Some(sp.bytes("0x636f6e736f6c652e6c6f67282256322229")),
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].version == 2)
+    scenario.verify(contract.data.generators[0].description == sp.bytes("0x41207479706f"))
+
+    scenario.h2("Storage limits apply to the updated fields")
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=sp.Some(sp.bytes("0x" + "41" * 21)),
+        code=None,
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=alice,
+        _valid=False,
+        _exception="DESC_TOO_LONG"
+    )
+
+    scenario.h2("Reserved editions are checked against the sale")
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=5,
+        max_per_wallet=None,
+        _sender=alice
+    )
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=None,
+        code=None,
+        author_bytes=None,
+        reserved_editions=sp.Some(6),
+        _sender=alice,
+        _valid=False,
+        _exception="RESERVE_EXCEEDS_CAPACITY"
+    )
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=None,
+        code=None,
+        author_bytes=None,
+        reserved_editions=sp.Some(3),
+        _sender=alice
+    )
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 3)
+    scenario.verify(contract.data.generators[0].version == 2)
+
+    scenario.h2("Non-author cannot update generator")
+    contract.update_generator_fields(
+        generator_id=0,
+        name=sp.Some(sp.bytes("0x426f62")),
+        description=None,
+        code=None,
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_AUTHOR"
+    )
+
+@sp.add_test()
+def test_patch_generator_code():
+    """
+    Tests byte-range patches of the generator code:
+    - Splices are applied in order and bump the version
+    - Out of range splices are rejected
+    - The code size limit is checked after patching
+    - Non-authors cannot patch generators
+    - Splices reaching the end of the code and splices of empty code are applied
+    - Patches computed by utils.compute_code_patches are accepted
+    """
+    scenario = sp.test_scenario("Patch Generator Code", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=40, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x416c69636520417274"),
+        description=sp.bytes("0x412062656175746966756c2067656e657261746f72"),
+        code=sp.bytes("0x" + b'console.log("Hello World")'.hex()),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    scenario.h2("Author can patch a byte range of the code")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[
+            # "log" -> "info", shifts the rest of the code by one byte
+            sp.record(offset=8, delete_len=3, insert=sp.bytes("0x" + b'info'.hex())),
+            # "World" -> "Tezos", at its shifted offset
+            sp.record(offset=20, delete_len=5, insert=sp.bytes("0x" + b'Tezos'.hex())),
+        ],
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].code == sp.bytes("0x" + b'console.info("Hello Tezos")'.hex()))
+    scenario.verify(contract.data.generators[0].version == 2)
+
+    scenario.h2("Splices past the end of the code are rejected")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[sp.record(offset=25, delete_len=5, insert=sp.bytes("0x"))],
+        _sender=alice,
+        _valid=False,
+        _exception="INVALID_PATCH"
+    )
+
+    scenario.h2("Patched code must fit the storage limit")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[sp.record(offset=0, delete_len=0, insert=sp.bytes("0x" + "20" * 14))],
+        _sender=alice,
+        _valid=False,
+        _exception="CODE_TOO_LONG"
+    )
+
+    scenario.h2("Non-author cannot patch generator")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[sp.record(offset=0, delete_len=0, insert=sp.bytes("0x20"))],
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_AUTHOR"
+    )
+
+    def hex_bytes(b):
+        return sp.bytes("0x" + b.hex())
+
+    scenario.h2("Append at the end of the code")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[sp.record(offset=27, delete_len=0, insert=hex_bytes(b';'))],
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].code == hex_bytes(b'console.info("Hello Tezos");'))
+
+    scenario.h2("Suffix delete")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[sp.record(offset=27, delete_len=1, insert=sp.bytes("0x"))],
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].code == hex_bytes(b'console.info("Hello Tezos")'))
+
+    scenario.h2("Tail replacement")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[sp.record(offset=20, delete_len=7, insert=hex_bytes(b'World")'))],
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].code == hex_bytes(b'console.info("Hello World")'))
+
+    scenario.h2("Empty code can be patched")
+    contract.patch_generator_code(
+        generator_id=0,
+        patches=[
+            sp.record(offset=0, delete_len=27, insert=sp.bytes("0x")),
+            sp.record(offset=0, delete_len=0, insert=hex_bytes(b'x()')),
+        ],
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].code == hex_bytes(b'x()'))
+
+    scenario.h2("Patches computed by compute_code_patches are accepted")
+    code = b'x()'
+    for new_code in [
+        b'x();\nfoo()',
+        b'// x();\nfoo() // end',
+        b'// x();',
+        b'',
+        b'console.log("Hi")',
+    ]:
+        patches = compute_code_patches(code, new_code)
+        assert apply_code_patches(code, patches) == new_code
+        contract.patch_generator_code(
+            generator_id=0,
+            patches=[
+                sp.record(offset=patch["offset"], delete_len=patch["delete_len"], insert=hex_bytes(patch["insert"]))
+                for patch in patches
+            ],
+            _sender=alice
+        )
+        scenario.verify(contract.data.generators[0].code == hex_bytes(new_code))
+        code = new_code
+
+@sp.add_test()
+def test_staged_upload():
+    """
+    Tests creating a generator from code uploaded in chunks:
+    - Chunks are appended in order to the staged code
+    - Only the uploader can append, cancel or finalize
+    - The code size limit is checked on every chunk
+    - Finalizing creates the generator and clears the staging area
+    """
+    scenario = sp.test_scenario("Staged Upload", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=40, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    scenario.h2("Upload requires a known bootloader")
+    contract.begin_upload(5, _sender=alice, _valid=False, _exception="UNKNOWN_BOOTLOADER")
+
+    scenario.h2("Author uploads the code in chunks")
+    contract.begin_upload(0, _sender=alice)
+    contract.append_chunk(upload_id=0, chunk=sp.bytes("0x" + b'console.log('.hex()), _sender=alice)
+    contract.append_chunk(upload_id=0, chunk=sp.bytes("0x" + b'"Hello World")'.hex()), _sender=alice)
+    scenario.verify(contract.data.uploads[0].code == sp.bytes("0x" + b'console.log("Hello World")'.hex()))
+
+    scenario.h2("Only the uploader can append")
+    contract.append_chunk(
+        upload_id=0,
+        chunk=sp.bytes("0x20"),
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_UPLOADER"
+    )
+
+    scenario.h2("Staged code must fit the storage limit")
+    contract.append_chunk(
+        upload_id=0,
+        chunk=sp.bytes("0x" + "20" * 15),
+        _sender=alice,
+        _valid=False,
+        _exception="CODE_TOO_LONG"
+    )
+
+    scenario.h2("Only the uploader can finalize")
+    contract.finalize_generator(
+        upload_id=0,
+        name=sp.bytes("0x416c69636520417274"),
+        description=sp.bytes("0x5374616765642075706c6f6164"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=2,
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_UPLOADER"
+    )
+
+    scenario.h2("Finalizing creates the generator")
+    contract.finalize_generator(
+        upload_id=0,
+        name=sp.bytes("0x416c69636520417274"),
+        description=sp.bytes("0x5374616765642075706c6f6164"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=2,
+        _sender=alice
+    )
+    scenario.verify(~contract.data.uploads.contains(0))
+    scenario.verify(contract.data.next_generator_id == 1)
+    generator = contract.data.generators[0]
+    scenario.verify(generator.code == sp.bytes("0x" + b'console.log("Hello World")'.hex()))
+    scenario.verify(generator.author == alice.address)
+    scenario.verify(generator.version == 1)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 2)
+
+    scenario.h2("A finalized upload cannot be reused")
+    contract.append_chunk(
+        upload_id=0,
+        chunk=sp.bytes("0x20"),
+        _sender=alice,
+        _valid=False,
+        _exception="UNKNOWN_UPLOAD"
+    )
+
+    scenario.h2("Uploads can be cancelled by their uploader")
+    contract.begin_upload(0, _sender=alice)
+    contract.cancel_upload(1, _sender=bob, _valid=False, _exception="ONLY_UPLOADER")
+    contract.cancel_upload(1, _sender=alice)
+    scenario.verify(~contract.data.uploads.contains(1))
+
+@sp.add_test()
+def test_shared_libraries():
+    """
+    Tests content-addressed libraries:
+    - Anyone can add a library, keyed by the sha256 of its code, up to the admin's size limit
+    - Adding the same code twice keeps a single entry
+    - Only the author can reference libraries, which must exist
+    - Only bootloaders flagged as splicing libraries accept them
+    - Libraries count against the bootloader's code limit
+    - Referencing libraries bumps the generator version
+    - The v0.0.3 lambda splices the libraries in front of the generator code
+    - Libraries are left out once the bootloader no longer splices them
+    """
+    scenario = sp.test_scenario("Shared Libraries", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = test_utils.PendingRngContract()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    scenario.h2("Only admin can set the library size limit")
+    contract.set_library_size_limit(64, _sender=bob, _valid=False, _exception="ONLY_ADMIN")
+    contract.set_library_size_limit(64, _sender=admin)
+
+    fragments = [
+        sp.bytes("0x" + b'<svg><script>const SEED='.hex()),
+        sp.bytes("0x" + b';const N='.hex()),
+        sp.bytes("0x" + b';'.hex()),
+        sp.bytes("0x" + b'</script></svg>'.hex()),
+    ]
+    contract.add_bootloader(
+        version=sp.bytes("0x" + b'svg-js:0.0.3'.hex()),
+        fragments=fragments,
+        fun=bootloader.v0_0_3,
+        storage_limits=sp.record(code=60, name=500, desc=8000, author=50),
+        _sender=admin
+    )
+
+    code = sp.bytes("0x" + b'draw(noise(N))'.hex())
+    contract.create_generator(
+        name=sp.bytes("0x416c69636520417274"),
+        description=sp.bytes("0x536861726564206c6962726172696573"),
+        code=code,
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=1,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    noise = b'function noise(x){return x}'
+    draw = b'function draw(x){}'
+
+    scenario.h2("Anyone can add a library")
+    contract.add_library(sp.bytes("0x" + noise.hex()), _sender=bob)
+    contract.add_library(sp.bytes("0x" + draw.hex()), _sender=alice)
+    contract.add_library(sp.bytes("0x" + noise.hex()), _sender=alice)
+    noise_hash = sp.sha256(sp.bytes("0x" + noise.hex()))
+    draw_hash = sp.sha256(sp.bytes("0x" + draw.hex()))
+    scenario.verify(contract.data.libraries[noise_hash] == sp.bytes("0x" + noise.hex()))
+
+    scenario.h2("Libraries must fit the size limit")
+    contract.add_library(
+        sp.bytes("0x" + "20" * 65),
+        _sender=bob,
+        _valid=False,
+        _exception="LIBRARY_TOO_LONG"
+    )
+
+    scenario.h2("Only the author can reference libraries")
+    contract.set_generator_libraries(
+        generator_id=0,
+        library_hashes=[noise_hash],
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_AUTHOR"
+    )
+
+    scenario.h2("Libraries need a bootloader that splices them")
+    contract.set_generator_libraries(
+        generator_id=0,
+        library_hashes=[noise_hash],
+        _sender=alice,
+        _valid=False,
+        _exception="LIBRARIES_NOT_SUPPORTED"
+    )
+    contract.set_bootloader_library_support(bootloader_id=0, supported=True, _sender=bob, _valid=False, _exception="ONLY_ADMIN")
+    contract.set_bootloader_library_support(bootloader_id=0, supported=True, _sender=admin)
+
+    scenario.h2("Referenced libraries must exist")
+    contract.set_generator_libraries(
+        generator_id=0,
+        library_hashes=[sp.sha256(sp.bytes("0x00"))],
+        _sender=alice,
+        _valid=False,
+        _exception="UNKNOWN_LIBRARY"
+    )
+
+    scenario.h2("Author references libraries")
+    contract.set_generator_libraries(
+        generator_id=0,
+        library_hashes=[noise_hash, draw_hash],
+        _sender=alice
+    )
+    scenario.verify(contract.data.generators[0].version == 2)
+
+    scenario.h2("Libraries count against the code limit")
+    # 14 bytes of code + 27 + 18 bytes of libraries fill the 60 byte limit
+    contract.set_generator_libraries(
+        generator_id=0,
+        library_hashes=[noise_hash, draw_hash, draw_hash],
+        _sender=alice,
+        _valid=False,
+        _exception="CODE_TOO_LONG"
+    )
+    contract.update_generator_fields(
+        generator_id=0,
+        name=None,
+        description=None,
+        code=sp.Some(sp.bytes("0x" + b'draw(noise(N));;'.hex())),
+        author_bytes=None,
+        reserved_editions=None,
+        _sender=alice,
+        _valid=False,
+        _exception="CODE_TOO_LONG"
+    )
+
+    scenario.h2("Libraries are spliced in front of the generator code")
+    contract.airdrop(
+        generator_id=0,
+        recipient=bob.address,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=alice
+    )
+    # the RNG never calls back, so the token keeps its placeholder seed "0"
+    expected_artifact = sp.concat([
+        fragments[0],
+        sp.bytes("0x30"),
+        fragments[1],
+        sp.bytes("0x31"),
+        fragments[2],
+        sp.bytes("0x" + noise.hex() + "3b0a" + draw.hex() + "3b0a"),
+        code,
+        fragments[3],
+    ])
+    scenario.verify(contract.data.token_metadata[0].token_info["artifactUri"] == expected_artifact)
+
+    scenario.h2("Libraries are left out once the bootloader no longer splices them")
+    contract.set_bootloader_library_support(bootloader_id=0, supported=False, _sender=admin)
+    expected_artifact = sp.concat([
+        fragments[0],
+        sp.bytes("0x30"),
+        fragments[1],
+        sp.bytes("0x31"),
+        fragments[2],
+        code,
+        fragments[3],
+    ])
+    scenario.verify(contract.get_token_preview(0)["artifactUri"] == expected_artifact)
+
+@sp.add_test()
+def test_onchain_views():
+    """
+    Tests the small read views:
+    - get_generator_summary returns the counters without code or description
+    - get_sale, get_token_extra and get_mint_count return single entries
+    - remaining_editions excludes minted and reserved editions
+    """
+    scenario = sp.test_scenario("Onchain Views", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=sp.record(code=30000, name=500, desc=8000, author=50),
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x416c69636520417274"),
+        description=sp.bytes("0x412062656175746966756c2067656e657261746f72"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=2,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    scenario.h2("No sale configured")
+    scenario.verify(contract.get_sale(0).is_none())
+    scenario.verify(contract.remaining_editions(0) == 0)
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(0),
+        paused=False,
+        editions=10,
+        max_per_wallet=None,
+        _sender=alice
+    )
+    contract.mint_batch(
+        generator_id=0,
+        count=3,
+        entropy=sp.bytes("0x01"),
+        _sender=bob,
+        _amount=sp.mutez(0)
+    )
+
+    scenario.h2("Views return small records")
+    summary = contract.get_generator_summary(0)
+    scenario.verify(summary.author == alice.address)
+    scenario.verify(summary.n_tokens == 3)
+    scenario.verify(summary.reserved_editions == 2)
+    scenario.verify(summary.version == 1)
+    scenario.verify(contract.get_sale(0).unwrap_some().editions == 10)
+    scenario.verify(contract.get_token_extra(2).iteration_number == 3)
+    scenario.verify(contract.get_token_extra(2).generator_id == 0)
+    scenario.verify(contract.get_mint_count(sp.record(generator_id=0, address=bob.address)) == 3)
+    scenario.verify(contract.get_mint_count(sp.record(generator_id=0, address=alice.address)) == 0)
+    scenario.verify(contract.remaining_editions(0) == 5)
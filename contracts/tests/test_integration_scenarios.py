@@ -153,8 +153,8 @@ def test_complete_platform_workflow():
             _sender=artist
         )
 
-    scenario.verify(contract.data.generators[0].reserved_editions == 7)
-    scenario.verify(contract.data.generators[0].n_tokens == 6)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 7)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 6)
 
     scenario.h1("Phase 5: Secondary Market Activity")
 
@@ -192,7 +192,7 @@ def test_complete_platform_workflow():
 
     scenario.h2("Moderator flags generator")
     contract.flag_generator(generator_id=0, flag=1, _sender=moderator)
-    scenario.verify(contract.data.generators[0].flag == 1)
+    scenario.verify(contract.data.generator_state[0].flag == 1)
 
     scenario.h2("Moderator updates thumbnail")
     contract.update_thumbnail(
@@ -371,9 +371,9 @@ def test_multi_generator_ecosystem():
 
     scenario.h2("Verify final state")
     scenario.verify(contract.data.next_token_id == 20)  # 1 + 3 + 5 + 1 + 10
-    scenario.verify(contract.data.generators[0].n_tokens == 2)  # 1 mint + 1 airdrop
-    scenario.verify(contract.data.generators[1].n_tokens == 3)  # 3 mints
-    scenario.verify(contract.data.generators[2].n_tokens == 15)  # 5 mints + 10 airdrops
+    scenario.verify(contract.data.generator_state[0].n_tokens == 2)  # 1 mint + 1 airdrop
+    scenario.verify(contract.data.generator_state[1].n_tokens == 3)  # 3 mints
+    scenario.verify(contract.data.generator_state[2].n_tokens == 15)  # 5 mints + 10 airdrops
 
 @sp.add_test()
 def test_platform_evolution_scenario():
@@ -621,8 +621,8 @@ def test_edge_case_combinations():
         _sender=artist
     )
 
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
-    scenario.verify(contract.data.generators[0].reserved_editions == 4)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 4)
 
     scenario.h2("Multiple generator updates and regenerations")
     # Update generator multiple times
@@ -91,7 +91,7 @@ def test_public_minting():
     
     scenario.verify(contract.data.next_token_id == 1)
     scenario.verify(contract.data.ledger[0] == bob.address)
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
     scenario.verify(contract.data.token_extra[0].generator_id == 0)
     scenario.verify(contract.data.token_extra[0].generator_version == 1)
     scenario.verify(contract.data.token_extra[0].iteration_number == 1)
@@ -105,7 +105,7 @@ def test_public_minting():
     )
     
     scenario.verify(contract.data.next_token_id == 2)
-    scenario.verify(contract.data.generators[0].n_tokens == 2)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 2)
     scenario.verify(contract.data.token_extra[1].iteration_number == 2)
 
 @sp.add_test()
@@ -269,8 +269,8 @@ def test_airdrop_functionality():
     
     scenario.verify(contract.data.next_token_id == 1)
     scenario.verify(contract.data.ledger[0] == charlie.address)
-    scenario.verify(contract.data.generators[0].reserved_editions == 4)
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 4)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
 
     scenario.h2("Non-author cannot airdrop")
     contract.airdrop(
@@ -477,8 +477,8 @@ def test_edition_limits():
         _sender=alice
     )
     
-    scenario.verify(contract.data.generators[0].n_tokens == 4)
-    scenario.verify(contract.data.generators[0].reserved_editions == 1)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 4)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 1)
 
 @sp.add_test()
 def test_reserved_editions_comprehensive():
@@ -553,8 +553,8 @@ def test_reserved_editions_comprehensive():
         _sender=alice
     )
     
-    scenario.verify(contract.data.generators[0].reserved_editions == 4)
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 4)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
 
     scenario.h2("Public minting respects reserved editions")
     # Should only be able to mint 4 more (10 total - 4 reserved - 1 already minted)
@@ -584,8 +584,8 @@ def test_reserved_editions_comprehensive():
         _sender=alice
     )
     
-    scenario.verify(contract.data.generators[0].n_tokens == 7)
-    scenario.verify(contract.data.generators[0].reserved_editions == 3)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 7)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 3)
 
 @sp.add_test()
 def test_sold_out_conditions():
@@ -678,3 +678,234 @@ def test_sold_out_conditions():
         _valid=False,
         _exception="NO_RESERVED_LEFT"
     )
+
+@sp.add_test()
+def test_mint_batch():
+    """
+    Tests batch minting:
+    - Mints several editions in one operation with one entropy request
+    - Every token gets its own derived seed
+    - Price, edition and max per wallet limits apply to the whole batch
+    """
+    scenario = sp.test_scenario("Mint Batch", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=30000, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x42617463682054657374"),
+        description=sp.bytes("0x54657374696e67206261746368206d696e7473"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=1,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(1000000),
+        paused=False,
+        editions=6,
+        max_per_wallet=sp.Some(4),
+        _sender=alice
+    )
+
+    scenario.h2("Batch must pay for every edition")
+    contract.mint_batch(
+        generator_id=0,
+        count=3,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(1000000),
+        _valid=False,
+        _exception="PRICE_MISMATCH"
+    )
+
+    scenario.h2("Empty batch fails")
+    contract.mint_batch(
+        generator_id=0,
+        count=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(0),
+        _valid=False,
+        _exception="INVALID_COUNT"
+    )
+
+    scenario.h2("Successful batch mint")
+    contract.mint_batch(
+        generator_id=0,
+        count=3,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(3000000)
+    )
+
+    scenario.verify(contract.data.next_token_id == 3)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 3)
+    scenario.verify(contract.data.generator_mints[(0, bob.address)] == 3)
+    scenario.verify(~contract.data.entropy_batches.contains(0))
+    for token_id in range(3):
+        scenario.verify(contract.data.ledger[token_id] == bob.address)
+        scenario.verify(contract.data.token_extra[token_id].iteration_number == token_id + 1)
+        scenario.verify(contract.data.token_extra[token_id].seed.is_some())
+    scenario.verify(contract.data.token_extra[0].seed != contract.data.token_extra[1].seed)
+    scenario.verify(contract.data.token_extra[1].seed != contract.data.token_extra[2].seed)
+
+    scenario.h2("Max per wallet applies to the whole batch")
+    contract.mint_batch(
+        generator_id=0,
+        count=2,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(2000000),
+        _valid=False,
+        _exception="EXCEEDS_MAX_PER_WALLET"
+    )
+
+    scenario.h2("Batch cannot dip into reserved editions")
+    contract.mint_batch(
+        generator_id=0,
+        count=3,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=alice,
+        _amount=sp.mutez(3000000),
+        _valid=False,
+        _exception="PUBLIC_SOLD_OUT"
+    )
+    contract.mint_batch(
+        generator_id=0,
+        count=2,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=alice,
+        _amount=sp.mutez(2000000)
+    )
+    scenario.verify(contract.data.generator_state[0].n_tokens == 5)
+
+@sp.add_test()
+def test_airdrop_batch():
+    """
+    Tests batch airdrops:
+    - Author can airdrop to many recipients in one operation
+    - Reserved editions are decremented by the number of recipients
+    - Cannot airdrop more recipients than reserved editions
+    - Non-author cannot batch airdrop
+    """
+    scenario = sp.test_scenario("Airdrop Batch", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+    charlie = sp.test_account("Charlie")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=30000, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x42617463682041697264726f70"),
+        description=sp.bytes("0x54657374696e672062617463682061697264726f7073"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=4,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    scenario.h2("Non-author cannot batch airdrop")
+    contract.airdrop_batch(
+        generator_id=0,
+        recipients=[bob.address, charlie.address],
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_AUTHOR"
+    )
+
+    scenario.h2("Author can airdrop to several recipients")
+    contract.airdrop_batch(
+        generator_id=0,
+        recipients=[bob.address, charlie.address, bob.address],
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=alice
+    )
+
+    scenario.verify(contract.data.next_token_id == 3)
+    scenario.verify(contract.data.ledger[0] == bob.address)
+    scenario.verify(contract.data.ledger[1] == charlie.address)
+    scenario.verify(contract.data.ledger[2] == bob.address)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 3)
+    scenario.verify(contract.data.generator_state[0].reserved_editions == 1)
+    scenario.verify(contract.data.token_extra[2].iteration_number == 3)
+    scenario.verify(contract.data.token_extra[2].seed.is_some())
+
+    scenario.h2("Cannot airdrop more than the reserved editions")
+    contract.airdrop_batch(
+        generator_id=0,
+        recipients=[bob.address, charlie.address],
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=alice,
+        _valid=False,
+        _exception="NO_RESERVED_LEFT"
+    )
+
+    scenario.h2("Empty recipient list fails")
+    contract.airdrop_batch(
+        generator_id=0,
+        recipients=[],
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=alice,
+        _valid=False,
+        _exception="INVALID_COUNT"
+    )
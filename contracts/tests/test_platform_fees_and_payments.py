@@ -719,3 +719,130 @@ def test_dynamic_fee_changes():
     
     # Total: 100000 (from first) + 200000 (from second) = 300000
     scenario.verify(treasury_counter.data == sp.mutez(300000))
+
+@sp.add_test()
+def test_accrued_payments():
+    """
+    Tests the pull-payment mode:
+    - Only admin or moderators can enable accrual
+    - Mints credit fees and proceeds to balances instead of sending them
+    - A treasury that rejects tez no longer blocks mints
+    - Authors withdraw their own balance
+    - withdraw_many pays out several balances at once
+    """
+    scenario = sp.test_scenario("Accrued Payments", [bootloader, randomiser])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+
+    treasury_counter = test_utils.BalanceCounter()
+    scenario += treasury_counter
+
+    failing_treasury = test_utils.FailingTreasury()
+    scenario += failing_treasury
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    contract.set_treasury(treasury_counter.address, _sender=admin)
+
+    storage_limits = sp.record(code=30000, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x41636372756564205061796d656e7473"),
+        description=sp.bytes("0x54657374696e67207061796d656e74206163637275616c"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    contract.set_sale(
+        generator_id=0,
+        start_time=None,
+        price=sp.mutez(1000000),
+        paused=False,
+        editions=10,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    scenario.h2("Only admin or moderators can enable accrual")
+    contract.set_accrue_payments(True, _sender=bob, _valid=False, _exception="ONLY_MODS")
+    contract.set_accrue_payments(True, _sender=admin)
+
+    scenario.h2("Mints credit balances instead of sending tez")
+    contract.mint(
+        generator_id=0, 
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(1000000)
+    )
+    contract.mint_batch(
+        generator_id=0,
+        count=2,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(2000000)
+    )
+    # default platform fee is 20%
+    scenario.verify(treasury_counter.data == sp.mutez(0))
+    scenario.verify(contract.data.balances[treasury_counter.address] == sp.mutez(600000))
+    scenario.verify(contract.data.balances[alice.address] == sp.mutez(2400000))
+    scenario.verify(contract.balance == sp.mutez(3000000))
+
+    scenario.h2("A rejecting treasury no longer blocks mints")
+    contract.set_treasury(failing_treasury.address, _sender=admin)
+    contract.mint(
+        generator_id=0, 
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(1000000)
+    )
+    scenario.verify(contract.data.balances[failing_treasury.address] == sp.mutez(200000))
+    contract.set_treasury(treasury_counter.address, _sender=admin)
+
+    scenario.h2("Authors withdraw their own balance")
+    contract.withdraw(_sender=alice)
+    scenario.verify(~contract.data.balances.contains(alice.address))
+    scenario.verify(contract.balance == sp.mutez(800000))
+    contract.withdraw(_sender=alice, _valid=False, _exception="NO_BALANCE")
+
+    scenario.h2("withdraw_many pays out several balances")
+    contract.withdraw_many([treasury_counter.address, bob.address], _sender=bob, _valid=False, _exception="ONLY_MODS")
+    contract.withdraw_many([treasury_counter.address, bob.address], _sender=admin)
+    scenario.verify(treasury_counter.data == sp.mutez(600000))
+    scenario.verify(~contract.data.balances.contains(treasury_counter.address))
+    scenario.verify(contract.balance == sp.mutez(200000))
+
+    scenario.h2("A rejecting receiver fails the withdrawal and keeps its balance")
+    contract.withdraw_many(
+        [failing_treasury.address],
+        _sender=admin,
+        _valid=False,
+        _exception="TREASURY_REJECTED"
+    )
+    scenario.verify(contract.data.balances[failing_treasury.address] == sp.mutez(200000))
@@ -8,6 +8,7 @@ This module tests all sale-related functionality:
 - Max per wallet limits
 - Timestamp boundaries
 - Zero editions edge case
+- Merkle allowlist phase
 """
 
 from bootloader import bootloader
@@ -15,6 +16,20 @@ from randomiser import randomiser
 import smartpy as sp
 import os
 
+@sp.module
+def test_utils():
+    # mirrors allowlist.py
+    def leaf(entry):
+        sp.cast(entry, sp.pair[sp.address, sp.nat])
+        return sp.sha256(sp.pack(entry))
+
+    def hash_pair(ab):
+        (a, b) = ab
+        res = sp.sha256(b + a)
+        if a < b:
+            res = sp.sha256(a + b)
+        return res
+
 @sp.add_test()
 def test_sale_configuration():
     """
@@ -78,8 +93,7 @@ def test_sale_configuration():
         _sender=alice
     )
     
-    generator = contract.data.generators[0]
-    sale = generator.sale.unwrap_some()
+    sale = contract.data.generator_state[0].sale.unwrap_some()
     scenario.verify(sale.start_time == sp.Some(sp.timestamp(100)))
     scenario.verify(sale.price == sp.mutez(1000000))
     scenario.verify(sale.paused == False)
@@ -442,7 +456,7 @@ def test_sale_states():
     
     scenario.verify(contract.data.next_token_id == 1)
     scenario.verify(contract.data.ledger[0] == bob.address)
-    scenario.verify(contract.data.generators[0].n_tokens == 1)
+    scenario.verify(contract.data.generator_state[0].n_tokens == 1)
 
 @sp.add_test()
 def test_timestamp_boundaries():
@@ -648,7 +662,7 @@ def test_large_sale_parameters():
         _sender=alice
     )
     
-    sale = contract.data.generators[0].sale.unwrap_some()
+    sale = contract.data.generator_state[0].sale.unwrap_some()
     scenario.verify(sale.editions == 1000000)
     scenario.verify(sale.max_per_wallet == sp.Some(999999))
 
@@ -723,3 +737,207 @@ def test_price_exactness():
         _valid=False,
         _exception="PRICE_MISMATCH"
     )
+
+@sp.add_test()
+def test_allowlist_phase():
+    """
+    Tests the merkle allowlist phase:
+    - Only the author can set or close the allowlist
+    - Allowlisted addresses mint before start_time, up to their quota
+    - Wrong quotas and addresses outside the list are rejected
+    - The sale price still applies
+    - Public mints still wait for start_time
+    """
+    scenario = sp.test_scenario("Allowlist Phase", [bootloader, randomiser, test_utils])
+
+    admin = sp.test_account("Admin")
+    alice = sp.test_account("Alice")
+    bob = sp.test_account("Bob")
+    charlie = sp.test_account("Charlie")
+    dave = sp.test_account("Dave")
+
+    rng = randomiser.RandomiserMock()
+    scenario += rng
+
+    contract = bootloader.Bootloader(
+        admin_address=admin.address,
+        rng_contract=rng.address, 
+        contract_metadata=sp.big_map({}),
+        ledger={},
+        token_metadata=[]
+    )
+    scenario += contract
+
+    storage_limits = sp.record(code=30000, name=500, desc=8000, author=50)
+    contract.add_bootloader(
+        version=sp.bytes("0x76302e302e31"),
+        fragments=[
+            sp.bytes("0x3c73766720786d6c6e733d22687474703a2f2f7777772e77332e6f72672f323030302f737667222076696577426f783d22302030203130302031303022207374796c653d226261636b67726f756e642d636f6c6f723a77686974653b223e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e"),
+            sp.bytes("0x3c2f7376673e")
+        ],
+        fun=bootloader.v0_0_1,
+        storage_limits=storage_limits,
+        _sender=admin
+    )
+
+    contract.create_generator(
+        name=sp.bytes("0x416c6c6f776c69737420417274"),
+        description=sp.bytes("0x54657374696e672074686520616c6c6f776c697374"),
+        code=sp.bytes("0x636f6e736f6c652e6c6f67282254657374"),
+        author_bytes=sp.bytes("0x416c696365"),
+        reserved_editions=0,
+        bootloader_id=0,
+        _sender=alice
+    )
+
+    start_time = sp.timestamp(2000000)
+    contract.set_sale(
+        generator_id=0,
+        start_time=sp.Some(start_time),
+        price=sp.mutez(1000000),
+        paused=False,
+        editions=10,
+        max_per_wallet=None,
+        _sender=alice
+    )
+
+    # bob may mint 2, charlie 1: root = hash(hash(bob, charlie), alice)
+    bob_leaf = scenario.compute(test_utils.leaf((bob.address, 2)))
+    charlie_leaf = scenario.compute(test_utils.leaf((charlie.address, 1)))
+    alice_leaf = scenario.compute(test_utils.leaf((alice.address, 1)))
+    node = scenario.compute(test_utils.hash_pair((bob_leaf, charlie_leaf)))
+    root = scenario.compute(test_utils.hash_pair((node, alice_leaf)))
+    presale_time = sp.timestamp(1000000)
+
+    scenario.h2("Cannot mint from an allowlist before it is set")
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=2,
+        proof=[charlie_leaf, alice_leaf],
+        _sender=bob,
+        _amount=sp.mutez(1000000),
+        _now=presale_time,
+        _valid=False,
+        _exception="NO_ALLOWLIST"
+    )
+
+    scenario.h2("Only the author can set the allowlist")
+    contract.set_allowlist(
+        generator_id=0,
+        root=sp.Some(root),
+        _sender=bob,
+        _valid=False,
+        _exception="ONLY_AUTHOR"
+    )
+    contract.set_allowlist(generator_id=0, root=sp.Some(root), _sender=alice)
+    scenario.verify(contract.data.allowlists[0] == root)
+
+    scenario.h2("Public mint still waits for start_time")
+    contract.mint(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=bob,
+        _amount=sp.mutez(1000000),
+        _now=presale_time,
+        _valid=False,
+        _exception="SALE_NOT_STARTED"
+    )
+
+    scenario.h2("Allowlisted addresses mint before start_time, up to their quota")
+    for _ in range(2):
+        contract.mint_allowlisted(
+            generator_id=0,
+            entropy=sp.bytes("0x" + os.urandom(16).hex()),
+            quota=2,
+            proof=[charlie_leaf, alice_leaf],
+            _sender=bob,
+            _amount=sp.mutez(1000000),
+            _now=presale_time
+        )
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=1,
+        proof=[bob_leaf, alice_leaf],
+        _sender=charlie,
+        _amount=sp.mutez(1000000),
+        _now=presale_time
+    )
+    scenario.verify(contract.data.ledger[0] == bob.address)
+    scenario.verify(contract.data.ledger[1] == bob.address)
+    scenario.verify(contract.data.ledger[2] == charlie.address)
+    scenario.verify(contract.data.allowlist_mints[(0, bob.address)] == 2)
+
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=2,
+        proof=[charlie_leaf, alice_leaf],
+        _sender=bob,
+        _amount=sp.mutez(1000000),
+        _now=presale_time,
+        _valid=False,
+        _exception="EXCEEDS_ALLOWLIST_QUOTA"
+    )
+
+    scenario.h2("Proofs are bound to the address and quota")
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=3,
+        proof=[bob_leaf, alice_leaf],
+        _sender=charlie,
+        _amount=sp.mutez(1000000),
+        _now=presale_time,
+        _valid=False,
+        _exception="INVALID_PROOF"
+    )
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=1,
+        proof=[bob_leaf, alice_leaf],
+        _sender=dave,
+        _amount=sp.mutez(1000000),
+        _now=presale_time,
+        _valid=False,
+        _exception="INVALID_PROOF"
+    )
+
+    scenario.h2("The sale price applies to allowlisted mints")
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=1,
+        proof=[node],
+        _sender=alice,
+        _amount=sp.mutez(0),
+        _now=presale_time,
+        _valid=False,
+        _exception="PRICE_MISMATCH"
+    )
+
+    scenario.h2("Closing the allowlist")
+    contract.set_allowlist(generator_id=0, root=None, _sender=alice)
+    contract.mint_allowlisted(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        quota=1,
+        proof=[node],
+        _sender=alice,
+        _amount=sp.mutez(1000000),
+        _now=presale_time,
+        _valid=False,
+        _exception="NO_ALLOWLIST"
+    )
+    contract.mint(
+        generator_id=0,
+        entropy=sp.bytes("0x" + os.urandom(16).hex()),
+        _sender=dave,
+        _amount=sp.mutez(1000000),
+        _now=start_time
+    )
+    scenario.verify(contract.data.ledger[3] == dave.address)
@@ -54,53 +54,61 @@ def bytes_utils():
             return sp.bytes("0x2d") + out
 
     def from_nat(n):
-        """Convert an integer to ASCII-encoded decimal bytes.
+        """Convert a nat to ASCII-encoded decimal bytes.
+
+        Digits are peeled off four at a time: a group d3 d2 d1 d0 is encoded as the
+        nat 0x30303030 + (d3 << 24) + (d2 << 16) + (d1 << 8) + d0, whose big-endian
+        bytes are exactly its four ASCII digits. Only the most significant group is
+        rendered digit by digit so that no leading zeros are emitted.
 
         Examples:
-        from_nat(0)  == sp.bytes("0x30")
-        from_nat(7)  == sp.bytes("0x37")
-        from_nat(10) == sp.bytes("0x3130")
-        from_nat(99) == sp.bytes("0x3939")
+        from_nat(0)     == sp.bytes("0x30")
+        from_nat(7)     == sp.bytes("0x37")
+        from_nat(10)    == sp.bytes("0x3130")
+        from_nat(99)    == sp.bytes("0x3939")
+        from_nat(10007) == sp.bytes("0x3130303037")
         """
         sp.cast(n, sp.nat)
-        out = sp.bytes("0x")
-        v=n
-
-        # Special-case zero
-        if v == 0:
-            out = sp.bytes("0x30")
-        else:
-            pieces = []
-            # Collect digits least-significant to most-significant
-            while v > 0:
-                (q, r) = sp.ediv(v, 10).unwrap_some()  # q, r are nat
-                pieces.push(_digit_to_byte(sp.to_int(r)))
-                v = q
-            # Concatenate in correct order thanks to push semantics
-            out = sp.concat(pieces)
-        return out
+        pieces = []
+        v = n
+        # Collect full 4-digit groups least-significant to most-significant
+        while v >= 10000:
+            (q, group) = sp.ediv(v, 10000).unwrap_some()
+            (g1, d0) = sp.ediv(group, 10).unwrap_some()
+            (g2, d1) = sp.ediv(g1, 10).unwrap_some()
+            (d3, d2) = sp.ediv(g2, 10).unwrap_some()
+            pieces.push(sp.to_bytes(0x30303030 + (d3 << 24) + (d2 << 16) + (d1 << 8) + d0))
+            v = q
+        # Leading group, 1 to 4 digits
+        while v >= 10:
+            (q, r) = sp.ediv(v, 10).unwrap_some()
+            pieces.push(sp.to_bytes(0x30 + r))
+            v = q
+        pieces.push(sp.to_bytes(0x30 + v))
+        # Concatenate in correct order thanks to push semantics
+        return sp.concat(pieces)
     
     def to_nat(b: sp.bytes) -> sp.nat:
-        n_bytes = sp.len(b)
-        bit_masks = [
-            sp.bytes("0x01"),
-            sp.bytes("0x02"),
-            sp.bytes("0x04"),
-            sp.bytes("0x08"),
-            sp.bytes("0x10"),
-            sp.bytes("0x20"),
-            sp.bytes("0x40"),
-            sp.bytes("0x80"),
-        ]
-        res = 0
-        for i in range(n_bytes):
-            byte = sp.slice(i, 1, b).unwrap_some()
-            for bit_mask in bit_masks:
-                if sp.and_bytes(byte, bit_mask) == bit_mask:
-                    res = (res << 1) + 1
-                else:
-                    res = res << 1
-        return res
+        """Convert bytes to a nat, reading the bits of each byte least-significant first.
+
+        This is the bit order of the original bitwise loop, which every rendered seed (and
+        the frontend's hexToNat) depends on. Each byte is mapped to its bit-reversed value
+        with a single lookup in a 256 byte table, and the result is converted with
+        Michelson's native NAT instruction.
+
+        Examples:
+        to_nat(sp.bytes("0x"))     == 0
+        to_nat(sp.bytes("0x01"))   == 128
+        to_nat(sp.bytes("0x80"))   == 1
+        to_nat(sp.bytes("0x0100")) == 32768
+        """
+        # byte i of the table is i with its bits reversed
+        reversed_bits = sp.bytes("0x008040c020a060e0109050d030b070f0088848c828a868e8189858d838b878f8048444c424a464e4149454d434b474f40c8c4ccc2cac6cec1c9c5cdc3cbc7cfc028242c222a262e2129252d232b272f20a8a4aca2aaa6aea1a9a5ada3aba7afa068646c626a666e6169656d636b676f60e8e4ece2eae6eee1e9e5ede3ebe7efe018141c121a161e1119151d131b171f1098949c929a969e9199959d939b979f9058545c525a565e5159555d535b575f50d8d4dcd2dad6ded1d9d5ddd3dbd7dfd038343c323a363e3139353d333b373f30b8b4bcb2bab6beb1b9b5bdb3bbb7bfb078747c727a767e7179757d737b777f70f8f4fcf2faf6fef1f9f5fdf3fbf7fff")
+        out = sp.bytes("0x")
+        for i in range(sp.len(b)):
+            byte = sp.to_nat(sp.slice(i, 1, b).unwrap_some())
+            out += sp.slice(byte, 1, reversed_bits).unwrap_some()
+        return sp.to_nat(out)
 
 @sp.module
 def list_utils():
@@ -131,3 +139,37 @@ def list_utils():
                     brk = True
                 it = it + 1
         return res
+
+    def unpack_4(elements):
+        """Return the first four elements of a list, walking it only once.
+
+        Parameters:
+        elements (sp.list[sp.bytes]): A list with at least four elements.
+
+        Returns:
+        sp.tuple[sp.bytes, sp.bytes, sp.bytes, sp.bytes]: The first four elements.
+
+        Examples:
+        list_utils.unpack_4([a, b, c, d]) == (a, b, c, d)
+        """
+        sp.cast(elements, sp.list[sp.bytes])
+        assert sp.len(elements) >= 4
+        f0 = sp.bytes("0x")
+        f1 = sp.bytes("0x")
+        f2 = sp.bytes("0x")
+        f3 = sp.bytes("0x")
+        it = 0
+        for e in elements:
+            if it == 0:
+                f0 = e
+            else:
+                if it == 1:
+                    f1 = e
+                else:
+                    if it == 2:
+                        f2 = e
+                    else:
+                        if it == 3:
+                            f3 = e
+            it = it + 1
+        return (f0, f1, f2, f3)
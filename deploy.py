@@ -6,9 +6,11 @@ import sys
 from pytezos import pytezos
 from pytezos.crypto.key import Key
 from hashlib import sha256
-from utils import ContractDeployment, Network, load_lambda_from_name, get_tezos_storage
+from utils import ContractDeployment, Network, load_lambda_from_name, load_offchain_views, get_tezos_storage
 from templates import get_fragments_from_template
 
+ASYNC_MAX_BATCH_COUNT = 20
+
 def get_wallet_from_env():
     """Get wallet from environment variable"""
     private_key = os.getenv('TEZOS_PRIVATE_KEY')
@@ -46,6 +48,16 @@ def main():
         action='store_true',
         help='Clear cached contract addresses before deployment'
     )
+    parser.add_argument(
+        '--async-randomiser',
+        action='store_true',
+        help='Queue entropy requests and reveal them in batches through the randomiser default entrypoint'
+    )
+    parser.add_argument(
+        '--pooled-randomiser',
+        action='store_true',
+        help='Reveal entropy from a pool refreshed by the randomiser default entrypoint instead of external views on every mint'
+    )
     parser.add_argument(
         '--test-wallet', 
         action='store_true',
@@ -80,7 +92,10 @@ def main():
     print("Deploying randomiser contract")
     randomiser_deployer = ContractDeployment.from_name('randomiser')
     randomiser_deployer.update_storage({
-        "testnet_mode": network == Network.ghostnet
+        "administrator": wallet.public_key_hash(),
+        "testnet_mode": network == Network.ghostnet,
+        "async_mode": args.async_randomiser,
+        "pool_mode": args.pooled_randomiser,
     })
     randomiser_deployer.set_pytezos_client(pt)
     randomiser_deployer.set_network(network)
@@ -98,6 +113,7 @@ def main():
         description="open experimental on-chain long-form generative art",
         imageUri="ipfs://bafkreic2zzpvkzfztgwrlavpit2psrip5xcgqfov4hq6ec4r5ds5didxim",
         homepage=f"https://{'ghostnet.' if args.network == 'ghostnet' else ''}bootloader.art",
+        views=load_offchain_views('bootloader'),
     )
     
     # Deploy bootloader contract
@@ -109,6 +125,8 @@ def main():
         "rng_contract": randomiser_address,
         "treasury": wallet.public_key_hash(),
         "platform_fee_bps": 2_000,
+        # queued batches are revealed in a single callback, keep them small enough to fit its gas
+        "max_batch_count": ASYNC_MAX_BATCH_COUNT if args.async_randomiser else None,
     })
     nft_deployer.set_pytezos_client(pt)
     nft_deployer.set_network(network)
@@ -121,18 +139,22 @@ def main():
     
     nft_address = nft_deployer.deploy()
     nft = pt.contract(nft_address)
+
+    if args.async_randomiser:
+        print("Allowing the bootloader to queue entropy requests")
+        pt.contract(randomiser_address).add_requester(nft_address).send(min_confirmations=1)
     
     print("Adding generator type")
     
     # Load the lambda function
-    bootloader = load_lambda_from_name('lambda_0_0_1')
+    bootloader = load_lambda_from_name('lambda_0_0_2')
     if args.network == 'ghostnet':
-        bootloader = load_lambda_from_name('lambda_0_0_1_ghostnet')
+        bootloader = load_lambda_from_name('lambda_0_0_2_ghostnet')
 
     
     # Add bootloader to contract
     operation_hash = nft.add_bootloader(
-        version='svg-js:0.0.1'.encode(), 
+        version='svg-js:0.0.2'.encode(), 
         fragments=[f.encode() for f in fragments], 
         fun=bootloader,
         storage_limits={
@@ -197,7 +197,9 @@ class TezosService {
 
       await operation.confirmation();
       const operationResult = await operation.operationResults();
-      const generatorId = operationResult[0].metadata.operation_result.lazy_storage_diff[6].diff.updates[0].key.int
+      const generatorsBigMap = await tzktService.getBigMapByPath("generators");
+      const [generatorUpdate] = this.bigMapUpdates(operationResult, generatorsBigMap?.ptr);
+      const generatorId = generatorUpdate ? generatorUpdate.key.int : null;
 
       return { success: true, hash: operation.hash, generatorId: generatorId };
     } catch (error) {
@@ -240,6 +242,35 @@ class TezosService {
     }
   }
 
+  // Only the fields that are passed (not null/undefined) are sent and updated,
+  // the generator version only changes when the code does
+  async updateGeneratorFields(generatorId, { name, description, code, reservedEditions } = {}) {
+    try {
+      if (!this.contract) {
+        await this.loadContract();
+      }
+
+      const optionalBytes = (value) => (value == null ? null : this.stringToBytes(value));
+
+      const operation = await this.contract.methodsObject
+        .update_generator_fields({
+          generator_id: generatorId,
+          name: optionalBytes(name),
+          description: optionalBytes(description),
+          code: code == null ? null : this.stringToBytes(encodeURIComponent(code)),
+          author_bytes: null,
+          reserved_editions: reservedEditions == null ? null : reservedEditions,
+        })
+        .send();
+
+      await operation.confirmation();
+      return { success: true, hash: operation.hash };
+    } catch (error) {
+      console.error("Failed to update generator fields:", error);
+      return { success: false, error: error.message };
+    }
+  }
+
   async setSale(
     generatorId,
     startTime,
@@ -337,22 +368,27 @@ class TezosService {
       let tokenName = null;
 
       try {
-        mintedTokenId = operationResults[0]?.metadata.operation_result.lazy_storage_diff[0].diff.updates[0].key.int;
-
-        const artifactUriHex = operationResults[0]?.metadata?.internal_operation_results?.[3]?.result?.lazy_storage_diff?.[0]?.diff?.updates?.[0]?.value?.args?.[1]?.[0]?.args?.[1];
-
+        const [ledgerBigMap, tokenMetadataBigMap] = await Promise.all([
+          tzktService.getBigMapByPath("ledger"),
+          tzktService.getBigMapByPath("token_metadata"),
+        ]);
+        const [ledgerUpdate] = this.bigMapUpdates(operationResults, ledgerBigMap?.ptr);
+        mintedTokenId = ledgerUpdate ? ledgerUpdate.key.int : null;
+
+        // the last write wins: the placeholder rendered by mint, then the set_entropy render
+        const metadataUpdate = this.bigMapUpdates(operationResults, tokenMetadataBigMap?.ptr)
+          .filter((update) => update.key.int === mintedTokenId && update.value)
+          .pop();
+
+        const artifactUriHex = this.tokenInfoField(metadataUpdate?.value, "artifactUri");
         if (artifactUriHex) {
-          const hexValue = artifactUriHex.bytes || artifactUriHex;
-
-          artifactUri = this.bytesToString(hexValue);
+          artifactUri = this.bytesToString(artifactUriHex);
           console.log("Extracted artifactUri from operationResults:", artifactUri);
         }
 
-        const tokenNameHex = operationResults[0]?.metadata?.internal_operation_results?.[3]?.result?.lazy_storage_diff?.[0]?.diff?.updates?.[0]?.value?.args?.[1]?.[3]?.args?.[1];
-
+        const tokenNameHex = this.tokenInfoField(metadataUpdate?.value, "name");
         if (tokenNameHex) {
-          const hexValue = tokenNameHex.bytes || tokenNameHex;
-          tokenName = this.bytesToString(hexValue);
+          tokenName = this.bytesToString(tokenNameHex);
         }
       } catch (error) {
         console.warn("Failed to extract metadata from operationResults:", error);
@@ -373,6 +409,31 @@ class TezosService {
   }
 
   // Utility functions
+
+  // Updates of a big_map by the operation and its internal operations, in execution order.
+  // Big_maps are matched by id: their position in lazy_storage_diff and the position of the
+  // internal operations (callbacks, events) change with the contract.
+  bigMapUpdates(operationResults, bigMapId) {
+    if (bigMapId == null) {
+      return [];
+    }
+    const results = operationResults.flatMap((content) => [
+      content.metadata?.operation_result,
+      ...(content.metadata?.internal_operation_results || []).map((internal) => internal.result),
+    ]);
+    return results.flatMap((result) =>
+      (result?.lazy_storage_diff || [])
+        .filter((diff) => diff.kind === "big_map" && String(diff.id) === String(bigMapId))
+        .flatMap((diff) => diff.diff?.updates || [])
+    );
+  }
+
+  // Bytes of a token_info entry in a token_metadata value, Pair token_id { Elt key bytes ; ... }
+  tokenInfoField(value, field) {
+    const elt = (value?.args?.[1] || []).find((item) => item.args?.[0]?.string === field);
+    return elt ? elt.args[1].bytes : null;
+  }
+
   stringToBytes(str) {
     return "0x" + Buffer.from(str, "utf8").toString("hex");
   }
@@ -395,6 +456,38 @@ class TezosService {
     }
   }
 
+  // entry is the { quota, proof } of the sender in the JSON written by allowlist.py
+  async mintAllowlisted(generatorId, salePrice, { quota, proof }) {
+    try {
+      if (!this.contract) {
+        await this.loadContract();
+      }
+
+      const entropy = new Uint8Array(16);
+      crypto.getRandomValues(entropy);
+      const entropyHex =
+        "0x" +
+        Array.from(entropy)
+          .map((b) => b.toString(16).padStart(2, "0"))
+          .join("");
+
+      const operation = await this.contract.methodsObject
+        .mint_allowlisted({
+          generator_id: generatorId,
+          entropy: entropyHex,
+          quota,
+          proof,
+        })
+        .send({ amount: salePrice, mutez: true });
+
+      await operation.confirmation();
+      return { success: true, hash: operation.hash };
+    } catch (error) {
+      console.error("Failed to mint from allowlist:", error);
+      return { success: false, error: error.message };
+    }
+  }
+
   async regenerateToken(tokenId) {
     try {
       if (!this.contract) {
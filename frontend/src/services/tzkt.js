@@ -83,10 +83,16 @@ class TzKTService {
     }
 
     try {
-      // Use the key.in syntax to batch query multiple keys at once
-      const keysParam = keys.join(',');
-      const url = `${this.baseUrl}/v1/bigmaps/${bigmapId}/keys?key.in=${keysParam}&active=true`;
-      return await this.fetchJson(url);
+      // TzKT returns 100 rows unless told otherwise, and key.in lists are kept
+      // short enough for a URL, so the keys are queried in chunks
+      const chunkSize = 100;
+      const requests = [];
+      for (let i = 0; i < keys.length; i += chunkSize) {
+        const chunk = keys.slice(i, i + chunkSize);
+        const url = `${this.baseUrl}/v1/bigmaps/${bigmapId}/keys?key.in=${chunk.join(',')}&active=true&limit=${chunk.length}`;
+        requests.push(this.fetchJson(url));
+      }
+      return (await Promise.all(requests)).flat();
     } catch (error) {
       console.error(`Failed to batch get bigmap keys for bigmap ${bigmapId}:`, error);
       throw error;
@@ -126,8 +132,16 @@ class TzKTService {
         limit: 1000, // Adjust as needed
       });
 
+      // Counters and sale config live in the separate generator_state bigmap
+      const stateMap = await this.getGeneratorStates(
+        keys.map((keyData) => keyData.key),
+      );
+
       const generators = keys.map((keyData) => {
-        const generator = keyData.value;
+        const generator = {
+          ...keyData.value,
+          ...(stateMap.get(keyData.key) || {}),
+        };
         return {
           id: parseInt(keyData.key),
           name: this.bytesToString(generator.name),
@@ -170,7 +184,11 @@ class TzKTService {
         return null;
       }
 
-      const generator = keyData.value;
+      const stateMap = await this.getGeneratorStates([keyData.key]);
+      const generator = {
+        ...keyData.value,
+        ...(stateMap.get(keyData.key) || {}),
+      };
       return {
         id: parseInt(keyData.key),
         name: this.bytesToString(generator.name),
@@ -194,6 +212,23 @@ class TzKTService {
     }
   }
 
+  // Get the mutable generator state (n_tokens, reserved_editions, flag, sale)
+  // keyed by generator id. Older contracts keep these fields on the generator
+  // record itself, in which case an empty map is returned.
+  async getGeneratorStates(generatorIds) {
+    const stateMap = new Map();
+    const stateBigMap = await this.getBigMapByPath("generator_state");
+    if (!stateBigMap || generatorIds.length === 0) {
+      return stateMap;
+    }
+
+    const results = await this.getBatchBigMapKeys(stateBigMap.ptr, generatorIds);
+    results.forEach((result) => {
+      stateMap.set(result.key, result.value);
+    });
+    return stateMap;
+  }
+
   // Get all fragments from the frags bigmap
   async getFragments() {
     try {
@@ -260,6 +295,21 @@ class TzKTService {
     }
   }
 
+  // Get contract events (mint, airdrop, set_entropy, create_generator, update_generator,
+  // set_sale, regenerate_token, flag_generator), oldest first
+  async getContractEvents(options = {}) {
+    const params = new URLSearchParams();
+    params.append("contract", this.contractAddress);
+    if (options.tag) params.append("tag", options.tag);
+    if (options.level) params.append("level.gt", options.level);
+    if (options.limit) params.append("limit", options.limit);
+    if (options.offset) params.append("offset", options.offset);
+    params.append("sort.asc", "id");
+
+    const url = `${this.baseUrl}/v1/contracts/events?${params.toString()}`;
+    return await this.fetchJson(url);
+  }
+
   // Get bigmap updates for monitoring changes
   async getBigMapUpdates(bigmapId, options = {}) {
     let url = `${this.baseUrl}/v1/bigmaps/${bigmapId}/updates`;
@@ -1,10 +1,13 @@
 // === Storage cost model (250 mutez/byte) ===
-const MUTEZ_PER_BYTE = 250;
-const TEZ_PER_MUTEZ = 1_000_000;
+// BASE_CREATE_NO_AB does NOT include author_bytes, BASE_MINT already includes the
+// current fragments + static wrappers. Both are generated by storage_cost.py.
+import {
+  MUTEZ_PER_BYTE,
+  BASE_CREATE_NO_AB,
+  BASE_MINT,
+} from "./storageCostConstants";
 
-// From calibration with your data
-const BASE_CREATE_NO_AB = 164; // bytes, does NOT include author_bytes
-const BASE_MINT = 1915; // bytes, already includes your current fragments + static wrappers
+const TEZ_PER_MUTEZ = 1_000_000;
 
 /**
  * Convert a byte count into {bytes, mutez, tez}.
@@ -39,9 +42,11 @@ export function estimateCreateGenerator(
  *            + blen(code)
  *            + blen(name)
  *            + 2*blen(author_bytes)
+ *            + sum(blen(library) + 2)   (each library is spliced followed by ";\n")
  */
-export function estimateMint(nameBytes, codeBytes, authorBytes = 36) {
-  const bytes = BASE_MINT + codeBytes + nameBytes + 2 * authorBytes;
+export function estimateMint(nameBytes, codeBytes, authorBytes = 36, libraryBytes = []) {
+  const librariesBytes = libraryBytes.reduce((total, size) => total + size + 2, 0);
+  const bytes = BASE_MINT + codeBytes + nameBytes + 2 * authorBytes + librariesBytes;
   return cost(bytes);
 }
 
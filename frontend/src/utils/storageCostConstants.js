@@ -0,0 +1,6 @@
+// Generated by storage_cost.py from the compiled bootloader, its lambda and templates/v0.0.1.
+// Do not edit, run `python storage_cost.py` after changing the storage, the fragments or the lambda.
+
+export const MUTEZ_PER_BYTE = 250;
+export const BASE_CREATE_NO_AB = 211;
+export const BASE_MINT = 1936;
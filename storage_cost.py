@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Storage cost estimator for the bootloader contract.
+
+Computes the bytes of storage paid by create_generator, mint and update_generator from
+the big_map types of the compiled contract (bootloader/*contract.tz, written by
+compile.py), the token_info rendered by the compiled v0.0.3 lambda (lambda_0_0_3/,
+run in the pytezos interpreter; v0.0.2 renders the same without libraries) and the
+fragments of templates/v0.0.1, using the protocol's accounting: a new big_map entry
+costs the binary Micheline size of its value plus 65 bytes, and an updated entry the
+change in size of its value.
+
+    python compile.py && python storage_cost.py
+
+writes frontend/src/utils/storageCostConstants.js, imported by storageCost.js.
+"""
+
+import argparse
+import glob
+import re
+from pytezos.contract.interface import ContractInterface
+from pytezos.michelson.forge import forge_micheline
+from pytezos.michelson.types import MichelsonType
+from templates import get_fragments_from_template
+from utils import load_lambda_from_name
+
+MUTEZ_PER_BYTE = 250
+# paid for every new big_map key, on top of its value
+BIG_MAP_KEY_BYTES = 65
+# any implicit account, addresses all have the same size in optimized form
+ADDRESS = "tz1burnburnburnburnburnburnburjAYjjX"
+TIMESTAMP = 1_800_000_000
+
+def find_big_maps(node, found):
+    """value types of the annotated big_maps of a storage type, by field name"""
+    if isinstance(node, list):
+        for item in node:
+            find_big_maps(item, found)
+    elif isinstance(node, dict):
+        if node.get("prim") == "big_map":
+            for annot in node.get("annots", []):
+                if annot.startswith("%"):
+                    found[annot[1:]] = MichelsonType.match(node["args"][1])
+        for arg in node.get("args", []):
+            find_big_maps(arg, found)
+    return found
+
+def load_big_map_types(name="bootloader"):
+    code_path = glob.glob(f"{name}/*contract.tz")[0]
+    contract = ContractInterface.from_file(code_path)
+    storage = next(section for section in contract.to_micheline() if section["prim"] == "storage")
+    return find_big_maps(storage["args"][0], {})
+
+def value_size(value_type, value):
+    """binary size of a value as stored by the node, in optimized form"""
+    micheline = value_type.from_python_object(value).to_micheline_value(mode="optimized")
+    return len(forge_micheline(micheline))
+
+def decimal(n):
+    return str(n).encode()
+
+def load_renderer(name):
+    """the compiled lambda (written by compile.py) wrapped in a script whose default entrypoint applies it"""
+    with open(glob.glob(f"{name}/*contract.tz")[0]) as f:
+        params_type = re.search(r"storage\s+\(lambda (.*) \(map string bytes\)\);", f.read()).group(1)
+    code = f"{{ CAR; LAMBDA {params_type} (map string bytes) {load_lambda_from_name(name)}; SWAP; EXEC; NIL operation; PAIR }}"
+    return ContractInterface.from_michelson(f"parameter {params_type};\nstorage (map string bytes);\ncode {code};")
+
+def render(renderer, fragments, token_id, seed, iteration_number, name, author_bytes, version, code, libraries=()):
+    """token_info rendered by the lambda, run in the pytezos Michelson interpreter"""
+    return renderer.default(
+        fragments=list(fragments),
+        token_id=token_id,
+        seed=seed,
+        iteration_number=iteration_number,
+        generator_name=name,
+        generator_author_bytes=author_bytes,
+        generator_version=version,
+        generator_code=code,
+        libraries=list(libraries),
+    ).interpret(storage={}).storage
+
+def generator_size(types, name, description, code, author_bytes, version=1, type_id=0):
+    return value_size(types["generators"], {
+        "name": name,
+        "created": TIMESTAMP,
+        "last_update": TIMESTAMP,
+        "description": description,
+        "author": ADDRESS,
+        "author_bytes": author_bytes,
+        "code": code,
+        "version": version,
+        "type_id": type_id,
+    })
+
+def generator_state_size(types, n_tokens=0, reserved_editions=0, flag=0):
+    return value_size(types["generator_state"], {
+        "n_tokens": n_tokens,
+        "reserved_editions": reserved_editions,
+        "flag": flag,
+        "sale": None,
+    })
+
+def create_generator_bytes(types, name, description, code, author_bytes, reserved_editions=0):
+    """paid storage of create_generator: the generators and generator_state entries"""
+    return (
+        BIG_MAP_KEY_BYTES + generator_size(types, name, description, code, author_bytes)
+        + BIG_MAP_KEY_BYTES + generator_state_size(types, reserved_editions=reserved_editions)
+    )
+
+def mint_bytes(types, renderer, name, code, author_bytes, fragments, token_id=10_000, iteration_number=100, version=1,
+               seed_digits=78, first_mint=True, libraries=()):
+    """paid storage of a mint once its entropy is revealed (eager and deferred render modes)
+
+    The seed is rendered as the decimal form of 32 random bytes, 78 digits at most.
+    first_mint adds the generator_mints entry created by a wallet's first mint of a generator.
+    """
+    seed = b"9" * seed_digits
+    token_info = render(renderer, fragments, token_id, seed, iteration_number, name, author_bytes, version, code, libraries)
+    token_metadata = value_size(types["token_metadata"], {"token_id": token_id, "token_info": token_info})
+    token_extra = value_size(types["token_extra"], {
+        "generator_id": 0,
+        "generator_version": version,
+        "seed": b"\x00" * 32,
+        "decimal_seed": seed,
+        "iteration_number": iteration_number,
+    })
+    total = (
+        BIG_MAP_KEY_BYTES + value_size(types["ledger"], ADDRESS)
+        + BIG_MAP_KEY_BYTES + token_metadata
+        + BIG_MAP_KEY_BYTES + token_extra
+    )
+    if first_mint:
+        total += BIG_MAP_KEY_BYTES + value_size(types["generator_mints"], 1)
+    return total
+
+def update_generator_bytes(old_name, old_code, new_name, new_code):
+    """paid storage of update_generator, only growth of the generator record is paid"""
+    return max(0, (len(new_name) - len(old_name)) + (len(new_code) - len(old_code)))
+
+def frontend_constants(types, renderer, fragments):
+    """constants of the linear model used by frontend/src/utils/storageCost.js"""
+    base_create = create_generator_bytes(types, b"", b"", b"", b"")
+    base_mint = mint_bytes(types, renderer, b"", b"", b"", fragments)
+    # the model charges code, name and each library (plus its ";\n" separator) once and
+    # author_bytes twice per token, check it holds
+    assert mint_bytes(types, renderer, b"n" * 10, b"c" * 100, b"a" * 36, fragments) == base_mint + 10 + 100 + 2 * 36
+    assert mint_bytes(types, renderer, b"", b"", b"", fragments, libraries=[b"l" * 50]) == base_mint + 50 + 2
+    assert create_generator_bytes(types, b"n" * 10, b"", b"c" * 100, b"a" * 36) == base_create + 10 + 100 + 36
+    return {
+        "MUTEZ_PER_BYTE": MUTEZ_PER_BYTE,
+        "BASE_CREATE_NO_AB": base_create,
+        "BASE_MINT": base_mint,
+    }
+
+def write_js_constants(constants, path):
+    lines = [
+        "// Generated by storage_cost.py from the compiled bootloader, its lambda and templates/v0.0.1.",
+        "// Do not edit, run `python storage_cost.py` after changing the storage, the fragments or the lambda.",
+        "",
+    ]
+    lines += [f"export const {name} = {value};" for name, value in constants.items()]
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute storage costs and export the frontend constants')
+    parser.add_argument(
+        '--template',
+        default='templates/v0.0.1',
+        help='Template directory the fragments are read from'
+    )
+    parser.add_argument(
+        '--contract',
+        default='bootloader',
+        help='Directory of the compiled contract, as written by compile.py'
+    )
+    parser.add_argument(
+        '--lambda',
+        dest='lambda_name',
+        default='lambda_0_0_3',
+        help='Directory of the compiled bootloader lambda rendering the tokens, as written by compile.py'
+    )
+    parser.add_argument(
+        '--output',
+        default='frontend/src/utils/storageCostConstants.js',
+        help='Generated constants file'
+    )
+    args = parser.parse_args()
+
+    types = load_big_map_types(args.contract)
+    renderer = load_renderer(args.lambda_name)
+    fragments = [f.encode() for f in get_fragments_from_template(args.template)]
+    constants = frontend_constants(types, renderer, fragments)
+    for name, value in constants.items():
+        print(f"{name} = {value}")
+    write_js_constants(constants, args.output)
+    print(f"written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import difflib
 import glob
 from pytezos import pytezos
 from pytezos.client import PyTezosClient
@@ -15,6 +16,41 @@ from datetime import datetime
 def str_to_hex(string):
     return "".join("{:02x}".format(ord(c)) for c in string)
 
+def compute_code_patches(old: bytes, new: bytes, min_gap: int = 16):
+    """compute the splices turning old into new, as expected by patch_generator_code
+
+    Returns a list of {"offset", "delete_len", "insert"} dicts to be applied in order,
+    each offset referring to the code as left by the previous splice. Changes separated
+    by fewer than min_gap unchanged bytes are merged, since every extra splice costs
+    more in encoding than a few resent bytes.
+    """
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    changes = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        if changes and i1 - changes[-1][1] < min_gap:
+            changes[-1][1] = i2
+            changes[-1][3] = j2
+        else:
+            changes.append([i1, i2, j1, j2])
+
+    patches = []
+    shift = 0
+    for i1, i2, j1, j2 in changes:
+        patches.append({"offset": i1 + shift, "delete_len": i2 - i1, "insert": new[j1:j2]})
+        shift += (j2 - j1) - (i2 - i1)
+    return patches
+
+def apply_code_patches(code: bytes, patches):
+    """apply splices the same way patch_generator_code does"""
+    for patch in patches:
+        end = patch["offset"] + patch["delete_len"]
+        if end > len(code):
+            raise ValueError("INVALID_PATCH")
+        code = code[:patch["offset"]] + patch["insert"] + code[end:]
+    return code
+
 def load_code_and_storage(name):
     """load contract and storage from corresponding .tz files"""
 
@@ -44,6 +80,79 @@ def load_lambda_from_name(name):
     with open(storage_path) as f:
         return f.read().strip()
 
+def load_offchain_views(name):
+    """load the TZIP-16 off-chain views exported by compile.py, if any"""
+    views_path = f"{name}/offchain_views.json"
+    if not os.path.exists(views_path):
+        return []
+    with open(views_path) as f:
+        return json.load(f)
+
+def upload_generator(client: PyTezosClient, contract_address: str, code: bytes, bootloader_id: int, name: bytes, description: bytes,
+                     author_bytes: bytes, reserved_editions: int = 0, group_size: int = 28_000):
+    """create a generator whose code does not fit in a single operation
+
+    The code is staged with begin_upload/append_chunk and turned into a generator by
+    finalize_generator. Chunks are packed into operation groups of at most group_size
+    bytes of payload (below the protocol's 32 KB operation size limit); begin_upload is
+    sent in the same group as the first chunks and finalize_generator, whose name,
+    description and author_bytes count against the budget, in the same group as the
+    last ones when they fit, in a group of its own otherwise. Small codes need a single
+    operation. One operation group is injected per block, as the protocol allows only
+    one pending manager operation per source. Returns the hashes of the injected
+    operation groups.
+    """
+    contract = client.contract(contract_address)
+    chunks = [code[i:i + group_size] for i in range(0, len(code), group_size)] or [b""]
+
+    # the upload id is the counter at the time begin_upload is applied; if another upload
+    # sneaks in first, append_chunk fails with ONLY_UPLOADER and nothing is applied
+    upload_id = contract.storage['next_upload_id']()
+    groups = []
+    for i, chunk in enumerate(chunks):
+        operations = []
+        if i == 0:
+            operations.append(contract.begin_upload(bootloader_id))
+        operations.append(contract.append_chunk(upload_id=upload_id, chunk=chunk))
+        groups.append(operations)
+
+    finalize = contract.finalize_generator(
+        upload_id=upload_id,
+        name=name,
+        description=description,
+        author_bytes=author_bytes,
+        reserved_editions=reserved_editions,
+    )
+    if len(chunks[-1]) + len(name) + len(description) + len(author_bytes) <= group_size:
+        groups[-1].append(finalize)
+    else:
+        groups.append([finalize])
+
+    hashes = []
+    for i, operations in enumerate(groups):
+        operation = client.bulk(*operations).send(min_confirmations=1)
+        print(f"\tgroup {i + 1}/{len(groups)} included:", operation.hash())
+        hashes.append(operation.hash())
+    return hashes
+
+def cache_decimal_seeds(client: PyTezosClient, contract_address: str, token_ids=None, batch_size: int = 100):
+    """fill token_extra.decimal_seed for already revealed tokens through cache_decimal_seeds
+
+    token_ids defaults to every token minted so far; tokens that already have a decimal
+    seed, are still waiting for their entropy or were burnt are skipped by the contract. Returns the
+    hashes of the injected operation groups.
+    """
+    contract = client.contract(contract_address)
+    if token_ids is None:
+        token_ids = list(range(contract.storage['next_token_id']()))
+    hashes = []
+    for i in range(0, len(token_ids), batch_size):
+        batch = token_ids[i:i + batch_size]
+        operation = contract.cache_decimal_seeds(batch).send(min_confirmations=1)
+        print(f"\ttokens {batch[0]}..{batch[-1]} migrated:", operation.hash())
+        hashes.append(operation.hash())
+    return hashes
+
 class Network(StrEnum):
     localnet = 'http://localhost:20000'
     ghostnet = 'https://ghostnet.tezos.ecadinfra.com'